@@ -1,8 +1,39 @@
 """Business hours and quiet hours checker for auto-reply system."""
 from datetime import datetime, time
+from functools import lru_cache
 from typing import Optional
 import pytz
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional speedup
+    np = None
+
+
+@lru_cache(maxsize=32)
+def _tz(name: str):
+    """Resolve a timezone name to its tzinfo once per process."""
+    return pytz.timezone(name)
+
+
+def _mode_batch_kernel(local_secs, quiet_lut):
+    """Map local-time Unix seconds to quiet-hour flags via the 168-slot LUT.
+
+    Pure array arithmetic: works vectorized under plain NumPy and
+    compiles as-is under Numba. Epoch day 0 (1970-01-01) was a Thursday,
+    hence the +3 to land on Python's Monday=0 weekday convention.
+    """
+    bits = (((local_secs // 86400) + 3) % 7) * 24 + (local_secs // 3600) % 24
+    return quiet_lut[bits]
+
+
+try:
+    from numba import njit
+
+    _mode_batch_kernel = njit(cache=True)(_mode_batch_kernel)
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    pass
+
 
 class BusinessHours:
     """Check if current time is within operating hours or quiet hours."""
@@ -19,7 +50,58 @@ class BusinessHours:
         self.weekday_end = weekday_end
         self.weekend_start = weekend_start
         self.weekend_end = weekend_end
-        self.timezone = pytz.timezone(timezone)
+        # Resolve tz names through the process-wide cache; accept an
+        # already-built tzinfo so instances can share one object
+        self.timezone = _tz(timezone) if isinstance(timezone, str) else timezone
+
+        # 7x24 weekly bitmask with bit (weekday*24 + hour) set for quiet
+        # hours, so the common lookup is one shift + AND. Only valid when
+        # the windows sit on hour boundaries; otherwise the exact
+        # comparison path handles the minutes.
+        if all(t.minute == 0 and t.second == 0 for t in
+               (weekday_start, weekday_end, weekend_start, weekend_end)):
+            self._quiet_mask: Optional[int] = self._build_quiet_mask()
+        else:
+            self._quiet_mask = None
+
+        # Minute-of-day bounds for the scalar checks: one branch plus
+        # two integer comparisons instead of time-object comparisons.
+        # Valid whenever the windows don't use seconds; the windows stay
+        # half-open ([start, end)) like the time comparisons they replace.
+        if all(t.second == 0 for t in
+               (weekday_start, weekday_end, weekend_start, weekend_end)):
+            self._weekday_window: Optional[tuple] = (
+                weekday_start.hour * 60 + weekday_start.minute,
+                weekday_end.hour * 60 + weekday_end.minute,
+            )
+            self._weekend_window: Optional[tuple] = (
+                weekend_start.hour * 60 + weekend_start.minute,
+                weekend_end.hour * 60 + weekend_end.minute,
+            )
+        else:
+            self._weekday_window = None
+            self._weekend_window = None
+
+        # Unpacked LUT form of the mask for the vectorized batch path
+        self._quiet_lut = None
+        if np is not None and self._quiet_mask is not None:
+            self._quiet_lut = np.array(
+                [(self._quiet_mask >> bit) & 1 for bit in range(168)],
+                dtype=np.int8,
+            )
+
+    def _build_quiet_mask(self) -> int:
+        """Precompute quiet/operating per (weekday, hour)."""
+        mask = 0
+        for weekday in range(7):
+            if weekday <= 4:
+                start, end = self.weekday_start, self.weekday_end
+            else:
+                start, end = self.weekend_start, self.weekend_end
+            for hour in range(24):
+                if not (start <= time(hour, 0) < end):
+                    mask |= 1 << (weekday * 24 + hour)
+        return mask
 
     def is_operating_hours(self, dt: Optional[datetime] = None) -> bool:
         """Check if current time is during operating hours (AI + full service)."""
@@ -28,9 +110,15 @@ class BusinessHours:
         else:
             dt = dt.astimezone(self.timezone)
 
-        current_time = dt.time()
         day_of_week = dt.weekday()  # 0=Monday, 6=Sunday
 
+        if self._weekday_window is not None:
+            minute = dt.hour * 60 + dt.minute
+            lo, hi = self._weekday_window if day_of_week <= 4 else self._weekend_window
+            return lo <= minute < hi
+
+        current_time = dt.time()
+
         # Weekday (Mon-Fri): 0-4
         if day_of_week <= 4:
             return self.weekday_start <= current_time < self.weekday_end
@@ -43,6 +131,84 @@ class BusinessHours:
         """Check if current time is during quiet hours (no AI, templates only)."""
         return not self.is_operating_hours(dt)
 
+    @lru_cache(maxsize=1024)
+    def _mode_cached(self, year: int, month: int, day: int,
+                     hour: int, minute: int, weekday: int) -> str:
+        """Resolve the mode for one minute bucket.
+
+        Bursty inbox traffic lands many emails in the same minute; the
+        cache turns the repeated window comparisons into a dict lookup.
+        Caching on the method is fine here — BusinessHours instances
+        live for the process lifetime.
+        """
+        current_time = time(hour, minute)
+        if weekday <= 4:
+            operating = self.weekday_start <= current_time < self.weekday_end
+        else:
+            operating = self.weekend_start <= current_time < self.weekend_end
+        return "ai" if operating else "template"
+
+    def get_response_mode_fast(self, weekday: int, hour: int, minute: int = 0) -> str:
+        """Mode from already-localized weekday/hour/minute integers.
+
+        Skips datetime construction and timezone conversion entirely;
+        the caller is responsible for localizing first.
+        """
+        if self._quiet_mask is not None:
+            bit = weekday * 24 + hour
+            return "template" if (self._quiet_mask >> bit) & 1 else "ai"
+        if self._weekday_window is not None:
+            minute_of_day = hour * 60 + minute
+            lo, hi = self._weekday_window if weekday <= 4 else self._weekend_window
+            return "ai" if lo <= minute_of_day < hi else "template"
+        current_time = time(hour, minute)
+        if weekday <= 4:
+            operating = self.weekday_start <= current_time < self.weekday_end
+        else:
+            operating = self.weekend_start <= current_time < self.weekend_end
+        return "ai" if operating else "template"
+
+    def get_response_mode_batch(self, timestamps) -> "np.ndarray":
+        """Classify an array of Unix timestamps in one vectorized pass.
+
+        Built for bulk backfills (e.g. re-classifying a day's inbox),
+        where per-call Python overhead in get_response_mode dominates.
+
+        Args:
+            timestamps: array-like of Unix seconds (UTC).
+
+        Returns:
+            int8 array — 1 means quiet hours (template mode), 0 means
+            operating hours (AI mode).
+        """
+        if np is None:
+            raise RuntimeError("numpy is required for get_response_mode_batch")
+
+        ts = np.asarray(timestamps, dtype=np.int64)
+
+        # Resolve the UTC offset once per unique UTC hour rather than per
+        # timestamp — DST transitions land on hour boundaries, so the
+        # offset is constant within each hour bucket
+        hours, inverse = np.unique(ts // 3600, return_inverse=True)
+        offsets = np.empty(len(hours), dtype=np.int64)
+        for i, hour_bucket in enumerate(hours):
+            local = datetime.fromtimestamp(int(hour_bucket) * 3600, tz=pytz.UTC)
+            local = local.astimezone(self.timezone)
+            offsets[i] = int(local.utcoffset().total_seconds())
+        local_secs = ts + offsets[inverse]
+
+        if self._quiet_lut is not None:
+            return _mode_batch_kernel(local_secs, self._quiet_lut)
+
+        # Non-hour-aligned windows: fall back to the scalar cached path
+        out = np.empty(len(ts), dtype=np.int8)
+        for i, secs in enumerate(local_secs.tolist()):
+            weekday = int((secs // 86400 + 3) % 7)
+            hour = int((secs // 3600) % 24)
+            minute = int((secs // 60) % 60)
+            out[i] = 1 if self.get_response_mode_fast(weekday, hour, minute) == "template" else 0
+        return out
+
     def get_response_mode(self, dt: Optional[datetime] = None) -> str:
         """
         Get the appropriate response mode.
@@ -51,4 +217,12 @@ class BusinessHours:
             "ai" - Use AI for personalized responses (operating hours)
             "template" - Use templates only (quiet hours or weekends)
         """
-        return "ai" if self.is_operating_hours(dt) else "template"
+        if dt is None:
+            dt = datetime.now(self.timezone)
+        else:
+            dt = dt.astimezone(self.timezone)
+        if self._quiet_mask is not None:
+            bit = dt.weekday() * 24 + dt.hour
+            return "template" if (self._quiet_mask >> bit) & 1 else "ai"
+        return self._mode_cached(dt.year, dt.month, dt.day,
+                                 dt.hour, dt.minute, dt.weekday())
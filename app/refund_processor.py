@@ -3,6 +3,11 @@ from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 import re
 
+# Order-ID patterns compiled once at import; extraction runs per email
+_OUBON_ORDER_RE = re.compile(r"\bOU\d{5,}\b", re.IGNORECASE)
+_ORDER_HASH_RE = re.compile(r"\border\s*#\s*(\d{5,})\b", re.IGNORECASE)
+_SHOPIFY_HASH_RE = re.compile(r"#(\d{4,})\b")
+
 
 class RefundProcessor:
     """Process refund requests with configurable safety parameters."""
@@ -29,6 +34,14 @@ class RefundProcessor:
             "send it back", "returning", "will ship", "will send", "will return",
             "sending back", "shipping back",
         ]
+        # Keyword lists are instance-configurable, so compile here: one
+        # C-level alternation scan replaces a substring test per keyword
+        self._reason_pattern = re.compile(
+            "|".join(re.escape(r.lower()) for r in self.valid_reasons)
+        )
+        self._shipped_back_pattern = re.compile(
+            "|".join(re.escape(k.lower()) for k in self.shipped_back_keywords)
+        )
 
     def should_auto_refund(
         self,
@@ -64,14 +77,17 @@ class RefundProcessor:
 
         # Get order details
         order_total = float(order_info.get("total_price", 0))
-        order_date_str = order_info.get("created_at", "")
-
-        try:
-            order_date = datetime.fromisoformat(order_date_str.replace("Z", "+00:00"))
-            days_since_order = (datetime.now(order_date.tzinfo) - order_date).days
-        except (ValueError, AttributeError):
-            result["reason"] = "Invalid order date"
-            return result
+        order_date = order_info.get("created_at", "")
+
+        # Accept a pre-parsed datetime so batch eligibility scans skip
+        # string parsing entirely; Shopify payloads still pass ISO strings
+        if not isinstance(order_date, datetime):
+            try:
+                order_date = datetime.fromisoformat(order_date.replace("Z", "+00:00"))
+            except (ValueError, AttributeError):
+                result["reason"] = "Invalid order date"
+                return result
+        days_since_order = (datetime.now(order_date.tzinfo) - order_date).days
 
         # Check 1: Order amount within auto-refund limit
         if order_total > self.max_auto_refund_amount:
@@ -89,25 +105,16 @@ class RefundProcessor:
         message_lower = message_body.lower()
         reason_found = None
         if self.require_reason_keywords:
-            for reason in self.valid_reasons:
-                if reason.lower() in message_lower:
-                    reason_found = reason
-                    break
-
-            if not reason_found:
+            match = self._reason_pattern.search(message_lower)
+            if not match:
                 result["reason"] = "No valid refund reason detected. Manual review required."
                 result["action"] = "manual_review"
                 return result
+            reason_found = match.group(0)
 
         # Check 4: Customer confirms they will ship item back
-        shipped_back_confirmed = False
         if self.require_shipped_back:
-            for keyword in self.shipped_back_keywords:
-                if keyword.lower() in message_lower:
-                    shipped_back_confirmed = True
-                    break
-
-            if not shipped_back_confirmed:
+            if not self._shipped_back_pattern.search(message_lower):
                 result["reason"] = "Customer must confirm item will be shipped back for refund. Manual review required."
                 result["action"] = "manual_review"
                 return result
@@ -125,17 +132,17 @@ class RefundProcessor:
         text = f"{subject}\n{body}"
 
         # Pattern 1: Oubon order format (OU12345)
-        m = re.search(r"\bOU\d{5,}\b", text, flags=re.I)
+        m = _OUBON_ORDER_RE.search(text)
         if m:
             return m.group(0).upper()
 
         # Pattern 2: Order #12345
-        m = re.search(r"\border\s*#\s*(\d{5,})\b", text, flags=re.I)
+        m = _ORDER_HASH_RE.search(text)
         if m:
             return m.group(1)
 
         # Pattern 3: #12345 in Shopify format
-        m = re.search(r"#(\d{4,})\b", text)
+        m = _SHOPIFY_HASH_RE.search(text)
         if m:
             return f"#{m.group(1)}"
 
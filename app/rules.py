@@ -1,4 +1,10 @@
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Keyword groups for classification
 KEYWORDS_IMPORTANT = [
@@ -27,16 +33,91 @@ KEYWORDS_ORDER = [
 ]
 
 
+def _compile_keywords(keywords: List[str]) -> "re.Pattern":
+    """Join a keyword list into one compiled alternation.
+
+    One C-level scan of the text replaces a Python-level substring
+    test per keyword.
+    """
+    return re.compile("|".join(re.escape(k.lower()) for k in keywords))
+
+
+# Compiled once at import — classification is called per message
+_VIP_PATTERN = _compile_keywords(KEYWORDS_VIP)
+_ORDER_PATTERN = _compile_keywords(KEYWORDS_ORDER)
+_IMPORTANT_PATTERN = _compile_keywords(KEYWORDS_IMPORTANT)
+
+
+def compile_rule_patterns(rules: List[Dict]) -> List[Tuple[Dict, "re.Pattern"]]:
+    """Precompile the if_any keyword list of each data-driven rule.
+
+    Returns (rule, pattern) pairs for match_label_for_message; rules
+    without keywords are skipped. Compile once per rules.json load,
+    not per message.
+    """
+    return [
+        (rule, _compile_keywords(rule["if_any"]))
+        for rule in rules
+        if rule.get("if_any")
+    ]
+
+
+def compile_rule_automaton(rules: List[Dict]):
+    """Build an Aho-Corasick automaton over every rule's keywords.
+
+    One linear pass over the text then matches all keywords of all
+    rules at once. Returns None when pyahocorasick isn't installed;
+    callers fall back to the per-rule compiled patterns.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, rule in enumerate(rules):
+        for keyword in rule.get("if_any", []):
+            keyword = keyword.lower()
+            # First rule listing a keyword keeps it — rule order is
+            # priority order
+            if not automaton.exists(keyword):
+                automaton.add_word(keyword, (index, rule))
+    automaton.make_automaton()
+    return automaton
+
+
+def match_label_for_message(
+    text: str,
+    rule_patterns: List[Tuple[Dict, "re.Pattern"]],
+    automaton=None,
+) -> Optional[Dict]:
+    """Return the first rule whose keyword pattern matches the text.
+
+    Expects text already lowercased and patterns from
+    compile_rule_patterns. With an automaton from
+    compile_rule_automaton, matching is a single scan that still
+    honors rule order.
+    """
+    if automaton is not None:
+        best = None
+        for _, (index, rule) in automaton.iter(text):
+            if best is None or index < best[0]:
+                best = (index, rule)
+        return best[1] if best else None
+
+    for rule, pattern in rule_patterns:
+        if pattern.search(text):
+            return rule
+    return None
+
+
 # Simple message classifier
 def classify_message(subject: str, body: str) -> List[str]:
     text = f"{subject} {body}".lower()
     tags = []
 
-    if any(k in text for k in KEYWORDS_VIP):
+    if _VIP_PATTERN.search(text):
         tags.append("VIP")
-    elif any(k in text for k in KEYWORDS_ORDER):
+    elif _ORDER_PATTERN.search(text):
         tags.append("Orders")
-    elif any(k in text for k in KEYWORDS_IMPORTANT):
+    elif _IMPORTANT_PATTERN.search(text):
         tags.append("Important")
     else:
         tags.append("Routine")
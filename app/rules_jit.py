@@ -0,0 +1,105 @@
+"""Optional compiled batch keyword scanning for rule classification.
+
+Packs rule keywords and a batch of (already lowercased) email texts into
+contiguous byte arrays and runs a naive substring scan over the whole
+batch in one native loop. With numba installed the kernel is JIT-compiled
+and parallelized across emails; without it the same arrays go through a
+pure-Python loop, and callers can equally fall back to
+rules.match_label_for_message per message.
+"""
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional speedup
+    np = None
+
+
+def _scan_kernel(text_bytes, text_offsets, kw_bytes, kw_offsets, kw_rule, out):
+    """Fill out[i] with the lowest rule index whose keyword occurs in text i.
+
+    Byte-wise substring scan over flattened arrays — no Python objects,
+    so it compiles unchanged under numba. out must be pre-filled with -1.
+    """
+    for i in prange(len(text_offsets) - 1):
+        t_start = text_offsets[i]
+        t_end = text_offsets[i + 1]
+        best = -1
+        for k in range(len(kw_offsets) - 1):
+            rule = kw_rule[k]
+            if best != -1 and rule >= best:
+                continue
+            k_start = kw_offsets[k]
+            k_len = kw_offsets[k + 1] - k_start
+            if k_len == 0 or t_end - t_start < k_len:
+                continue
+            for pos in range(t_start, t_end - k_len + 1):
+                hit = True
+                for j in range(k_len):
+                    if text_bytes[pos + j] != kw_bytes[k_start + j]:
+                        hit = False
+                        break
+                if hit:
+                    best = rule
+                    break
+        out[i] = best
+
+
+try:
+    from numba import njit, prange
+
+    _scan_kernel = njit(cache=True, parallel=True)(_scan_kernel)
+except ImportError:  # pragma: no cover - numba is an optional speedup
+    prange = range
+
+
+def _pack(chunks: List[bytes]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Flatten byte strings into one uint8 array plus an offsets array."""
+    offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+    np.cumsum([len(c) for c in chunks], out=offsets[1:])
+    flat = np.frombuffer(b"".join(chunks), dtype=np.uint8)
+    return flat, offsets
+
+
+def pack_rule_keywords(rules: List[Dict]):
+    """Pack every rule's if_any keywords for match_labels_batch.
+
+    Returns None when numpy is unavailable. Keywords keep the index of
+    the first rule listing them — rule order is priority order, matching
+    compile_rule_automaton.
+    """
+    if np is None:
+        return None
+    seen = set()
+    keywords: List[bytes] = []
+    owners: List[int] = []
+    for index, rule in enumerate(rules):
+        for keyword in rule.get("if_any", []):
+            keyword = keyword.lower()
+            if keyword not in seen:
+                seen.add(keyword)
+                keywords.append(keyword.encode())
+                owners.append(index)
+    kw_bytes, kw_offsets = _pack(keywords)
+    return kw_bytes, kw_offsets, np.asarray(owners, dtype=np.int64)
+
+
+def match_labels_batch(
+    texts: List[str],
+    rules: List[Dict],
+    packed=None,
+) -> List[Optional[Dict]]:
+    """Classify a batch of lowercased texts against the rules at once.
+
+    Returns the matched rule (or None) per text. Pass the result of
+    pack_rule_keywords to amortize packing across batches.
+    """
+    if np is None:
+        raise RuntimeError("match_labels_batch requires numpy")
+    if packed is None:
+        packed = pack_rule_keywords(rules)
+    kw_bytes, kw_offsets, kw_rule = packed
+    text_bytes, text_offsets = _pack([t.encode() for t in texts])
+    out = np.full(len(texts), -1, dtype=np.int64)
+    _scan_kernel(text_bytes, text_offsets, kw_bytes, kw_offsets, kw_rule, out)
+    return [rules[index] if index >= 0 else None for index in out]
@@ -1,6 +1,8 @@
 from dotenv import load_dotenv
 load_dotenv(".env")  # force load env file into os.environ
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -41,5 +43,6 @@ class Settings(BaseSettings):
         extra="ignore",  # Ignore extra env variables
     )
 
+@lru_cache(maxsize=1)
 def get_settings() -> "Settings":
     return Settings()
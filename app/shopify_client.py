@@ -1,13 +1,19 @@
 """Enhanced Shopify integration for order lookup, tracking, and refunds."""
 from typing import Optional, Dict, Any
-import requests
+import httpx
 from datetime import datetime
 
 
 class ShopifyClient:
     """Enhanced Shopify Admin API client."""
 
-    def __init__(self, store_domain: str, api_token: str, api_version: str = "2025-01"):
+    def __init__(
+        self,
+        store_domain: str,
+        api_token: str,
+        api_version: str = "2025-01",
+        http_client: Optional[httpx.Client] = None,
+    ):
         """
         Initialize Shopify client.
 
@@ -15,6 +21,8 @@ class ShopifyClient:
             store_domain: e.g., "oubonshop.myshopify.com"
             api_token: Shopify Admin API access token
             api_version: API version (default: 2025-01)
+            http_client: Optional shared httpx.Client — pass one to reuse
+                a connection pool across clients/scripts
         """
         self.store_domain = store_domain
         self.api_token = api_token
@@ -24,6 +32,11 @@ class ShopifyClient:
             "X-Shopify-Access-Token": api_token,
             "Content-Type": "application/json",
         }
+        # Keep-alive pool to the Admin API host — TLS is negotiated once
+        # and every lookup afterwards rides the same HTTP/2 connection
+        self._http = http_client or httpx.Client(
+            headers=self.headers, http2=True, timeout=10.0
+        )
 
     def lookup_order(self, order_identifier: str) -> Optional[Dict[str, Any]]:
         """
@@ -42,7 +55,7 @@ class ShopifyClient:
 
         try:
             url = f"{self.base_url}/orders.json?name={order_name}&status=any"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self._http.get(url, headers=self.headers)
             response.raise_for_status()
 
             data = response.json()
@@ -144,7 +157,7 @@ class ShopifyClient:
                 }
             }
 
-            response = requests.post(url, headers=self.headers, json=refund_data, timeout=10)
+            response = self._http.post(url, headers=self.headers, json=refund_data)
             response.raise_for_status()
 
             refund = response.json().get("refund", {})
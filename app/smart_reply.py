@@ -1,6 +1,7 @@
 """Intelligent auto-reply system with hybrid AI/template responses."""
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache, partial
 from app.business_hours import BusinessHours
 from app.shopify_client import ShopifyClient
 from app.refund_processor import RefundProcessor
@@ -9,6 +10,25 @@ from ospra_os.core.settings import Settings  # Use ospra_os settings for Render
 import re
 
 
+class _TemplateContext(dict):
+    """format_map context that leaves unknown placeholders untouched."""
+
+    def __missing__(self, key: str) -> str:
+        return "{{%s}}" % key
+
+
+@lru_cache(maxsize=256)
+def _compile_template(text: str) -> Callable[[dict], str]:
+    """Compile a {{var}} template into a format_map-ready callable.
+
+    The brace rewrite runs once per distinct template string; the
+    returned builder fills every placeholder in a single C-level pass
+    instead of chained str.replace calls.
+    """
+    escaped = text.replace("{", "{{").replace("}", "}}")
+    return partial(str.format_map, escaped.replace("{{{{", "{").replace("}}}}", "}"))
+
+
 class SmartReplySystem:
     """
     Intelligent email auto-reply system that:
@@ -53,10 +73,15 @@ class SmartReplySystem:
         from_name: str,
         rule: Dict[str, Any],
         templates: Dict[str, Any],
+        now: Optional[datetime] = None,
     ) -> Optional[Dict[str, str]]:
         """
         Generate intelligent auto-reply based on business hours and email content.
 
+        Args:
+            now: Evaluate business hours as of this moment instead of the
+                current time. Lets tests pin a clock without patching.
+
         Returns:
             {
                 "subject": str,
@@ -64,7 +89,7 @@ class SmartReplySystem:
                 "metadata": dict  # For logging/tracking
             }
         """
-        response_mode = self.business_hours.get_response_mode()
+        response_mode = self.business_hours.get_response_mode(now)
         label = rule.get("apply_label", "")
 
         # Extract customer first name
@@ -86,7 +111,7 @@ class SmartReplySystem:
             return self._handle_refund_request(subject, body, customer_name, from_email, templates, metadata)
 
         elif label == "Support":
-            return self._handle_quality_issue(subject, body, customer_name, templates, metadata)
+            return self._handle_quality_issue(subject, body, customer_name, templates, metadata, now)
 
         # For other categories, use hybrid AI/template approach
         if response_mode == "ai":
@@ -105,7 +130,7 @@ class SmartReplySystem:
             }
         else:
             # Use template during quiet hours or if AI unavailable
-            return self._use_template(rule, templates, customer_name, metadata)
+            return self._use_template(rule, templates, customer_name, metadata, now)
 
     def _handle_order_tracking(
         self,
@@ -138,9 +163,10 @@ class SmartReplySystem:
 
         # Fallback to template if no order ID or lookup failed
         template = templates.get("tracking_lookup", {})
+        context = _TemplateContext(name=customer_name)
         return {
             "subject": template.get("subject", "Re: Your order"),
-            "body": template.get("body", "").replace("{{name}}", customer_name),
+            "body": _compile_template(template.get("body", ""))(context),
             "metadata": metadata,
         }
 
@@ -193,8 +219,12 @@ class SmartReplySystem:
         # Fallback to template
         template = templates.get("refund_request", {})
         return {
-            "subject": template.get("subject", "Your refund request").replace("{{order_id}}", order_id or ""),
-            "body": template.get("body", "").replace("{{name}}", customer_name).replace("{{order_id}}", order_id or "your order"),
+            "subject": _compile_template(template.get("subject", "Your refund request"))(
+                _TemplateContext(order_id=order_id or "")
+            ),
+            "body": _compile_template(template.get("body", ""))(
+                _TemplateContext(name=customer_name, order_id=order_id or "your order")
+            ),
             "metadata": metadata,
         }
 
@@ -205,10 +235,11 @@ class SmartReplySystem:
         customer_name: str,
         templates: Dict[str, Any],
         metadata: Dict[str, Any],
+        now: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """Handle quality issues (damaged, defective, wrong item)."""
         # Use AI during business hours for personalized empathy
-        response_mode = self.business_hours.get_response_mode()
+        response_mode = self.business_hours.get_response_mode(now)
 
         if response_mode == "ai":
             metadata["used_ai"] = True
@@ -228,7 +259,9 @@ class SmartReplySystem:
         template = templates.get("support_quality", {})
         return {
             "subject": template.get("subject", "We're here to help"),
-            "body": template.get("body", "").replace("{{name}}", customer_name),
+            "body": _compile_template(template.get("body", ""))(
+                _TemplateContext(name=customer_name)
+            ),
             "metadata": metadata,
         }
 
@@ -238,6 +271,7 @@ class SmartReplySystem:
         templates: Dict[str, Any],
         customer_name: str,
         metadata: Dict[str, Any],
+        now: Optional[datetime] = None,
     ) -> Optional[Dict[str, Any]]:
         """Use template-based reply."""
         template_name = rule.get("auto_reply_template")
@@ -246,7 +280,7 @@ class SmartReplySystem:
             return None
 
         # Use quiet hours template during off-hours
-        response_mode = self.business_hours.get_response_mode()
+        response_mode = self.business_hours.get_response_mode(now)
         if response_mode == "template":
             template_name = "quiet_hours_auto"
 
@@ -257,7 +291,9 @@ class SmartReplySystem:
 
         return {
             "subject": template.get("subject", "Re: Your message"),
-            "body": template.get("body", "").replace("{{name}}", customer_name),
+            "body": _compile_template(template.get("body", ""))(
+                _TemplateContext(name=customer_name)
+            ),
             "metadata": metadata,
         }
 
@@ -0,0 +1,56 @@
+"""Shared pytest fixtures for the root-level test scripts."""
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.settings import get_settings
+
+# Warm the zoneinfo cache at collection time so no test pays the
+# first-use tzdata parse for the zone everything here runs in
+_EST = ZoneInfo("America/New_York")
+_ = datetime.now(_EST).utcoffset()
+
+
+@pytest.fixture(scope="session")
+def smart_reply():
+    """Fully wired SmartReplySystem, built once per test session.
+
+    Construction pulls in the AI/Shopify client modules and reads
+    settings, which dominates short CI runs — every test file sharing
+    this fixture pays that cost once.
+    """
+    from datetime import time
+
+    from app.ai_client import AIClient
+    from app.business_hours import BusinessHours
+    from app.refund_processor import RefundProcessor
+    from app.shopify_client import ShopifyClient
+    from app.smart_reply import SmartReplySystem
+
+    settings = get_settings()
+
+    system = SmartReplySystem.__new__(SmartReplySystem)
+    system.settings = settings
+    system.ai_client = AIClient(settings)
+    # Weekday 7 AM - 9 PM operating, weekends fully quiet (zero-width
+    # weekend window) — matches the documented Oubon hours
+    system.business_hours = BusinessHours(
+        weekday_start=time(7, 0),
+        weekday_end=time(21, 0),
+        weekend_start=time(0, 0),
+        weekend_end=time(0, 0),
+        timezone="America/New_York",
+    )
+    system.shopify = None
+    if settings.SHOPIFY_STORE and settings.SHOPIFY_API_TOKEN:
+        system.shopify = ShopifyClient(
+            store_domain=settings.SHOPIFY_STORE,
+            api_token=settings.SHOPIFY_API_TOKEN,
+        )
+    system.refund_processor = RefundProcessor(
+        max_auto_refund_amount=100.00,
+        auto_refund_days_limit=30,
+        require_reason_keywords=True,
+    )
+    return system
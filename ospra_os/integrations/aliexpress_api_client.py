@@ -31,6 +31,21 @@ class AliExpressAPIClient:
         else:
             logger.info(f"✅ AliExpress API initialized (App Key: {self.app_key[:10]}...)")
 
+        # Shared AsyncClient so consecutive feed calls reuse the pooled
+        # TLS connection instead of opening a new one per request
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30.0)
+        return self._client
+
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
     def _generate_signature(self, params: Dict) -> str:
         """
         Generate HMAC-MD5 signature for API request
@@ -118,68 +133,68 @@ class AliExpressAPIClient:
         params['sign'] = self._generate_signature(params)
 
         try:
-            # Make API request
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(self.api_url, data=params)
-                response.raise_for_status()
+            # Make API request over the shared pooled client
+            client = self._get_client()
+            response = await client.post(self.api_url, data=params)
+            response.raise_for_status()
 
-                data = response.json()
+            data = response.json()
 
-                # Check for API errors
-                if 'error_response' in data:
-                    error = data['error_response']
-                    logger.debug(f"Feed {feed_name} error: {error.get('msg', 'Unknown')}")
-                    return []
+            # Check for API errors
+            if 'error_response' in data:
+                error = data['error_response']
+                logger.debug(f"Feed {feed_name} error: {error.get('msg', 'Unknown')}")
+                return []
 
-                # Parse successful response
-                if 'aliexpress_ds_recommend_feed_get_response' in data:
-                    result = data['aliexpress_ds_recommend_feed_get_response']['result']
-                    products_data = result.get('products', {}).get('product', [])
-
-                    if not products_data:
-                        logger.debug(f"Feed {feed_name} returned 0 products")
-                        return []
-
-                    # Convert to standardized format
-                    products = []
-                    for item in products_data:
-                        # Filter by minimum criteria (relaxed for feeds)
-                        orders = int(item.get('lastest_volume', 0))
-                        if orders < min_orders // 2:  # Relaxed criteria for feed
-                            continue
-
-                        # Rating is in percentage format (e.g., "96%" = 4.8 stars)
-                        rating_str = item.get('evaluate_rate', '80%')
-                        try:
-                            rating = float(rating_str.rstrip('%')) / 20.0
-                        except:
-                            rating = 4.0
-
-                        if rating < min_rating - 0.5:  # Relaxed criteria
-                            continue
-
-                        products.append({
-                            'product_id': str(item.get('product_id', '')),
-                            'name': item.get('product_title', ''),
-                            'price': float(item.get('target_sale_price', 0)),
-                            'original_price': float(item.get('target_original_price', 0)),
-                            'orders': orders,
-                            'rating': rating,
-                            'image_url': item.get('product_main_image_url', ''),
-                            'url': item.get('promotion_link', '') or f"https://www.aliexpress.com/item/{item.get('product_id')}.html",
-                            'shipping_days': int(item.get('ship_to_days', 15)),
-                            'supplier_rating': 95.0,
-                            'store_name': item.get('shop_title', 'AliExpress Store'),
-                            'store_id': item.get('shop_id', '')
-                        })
-
-                        if len(products) >= limit:
-                            break
+            # Parse successful response
+            if 'aliexpress_ds_recommend_feed_get_response' in data:
+                result = data['aliexpress_ds_recommend_feed_get_response']['result']
+                products_data = result.get('products', {}).get('product', [])
 
-                    return products
+                if not products_data:
+                    logger.debug(f"Feed {feed_name} returned 0 products")
+                    return []
 
-                logger.warning(f"⚠️  Unexpected API response format for feed {feed_name}")
-                return []
+                # Convert to standardized format
+                products = []
+                for item in products_data:
+                    # Filter by minimum criteria (relaxed for feeds)
+                    orders = int(item.get('lastest_volume', 0))
+                    if orders < min_orders // 2:  # Relaxed criteria for feed
+                        continue
+
+                    # Rating is in percentage format (e.g., "96%" = 4.8 stars)
+                    rating_str = item.get('evaluate_rate', '80%')
+                    try:
+                        rating = float(rating_str.rstrip('%')) / 20.0
+                    except:
+                        rating = 4.0
+
+                    if rating < min_rating - 0.5:  # Relaxed criteria
+                        continue
+
+                    products.append({
+                        'product_id': str(item.get('product_id', '')),
+                        'name': item.get('product_title', ''),
+                        'price': float(item.get('target_sale_price', 0)),
+                        'original_price': float(item.get('target_original_price', 0)),
+                        'orders': orders,
+                        'rating': rating,
+                        'image_url': item.get('product_main_image_url', ''),
+                        'url': item.get('promotion_link', '') or f"https://www.aliexpress.com/item/{item.get('product_id')}.html",
+                        'shipping_days': int(item.get('ship_to_days', 15)),
+                        'supplier_rating': 95.0,
+                        'store_name': item.get('shop_title', 'AliExpress Store'),
+                        'store_id': item.get('shop_id', '')
+                    })
+
+                    if len(products) >= limit:
+                        break
+
+                return products
+
+            logger.warning(f"⚠️  Unexpected API response format for feed {feed_name}")
+            return []
 
         except httpx.TimeoutException:
             logger.error("❌ AliExpress API timeout")
@@ -216,22 +231,22 @@ class AliExpressAPIClient:
 
             params['sign'] = self._generate_signature(params)
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(self.api_url, data=params)
-                response.raise_for_status()
+            client = self._get_client()
+            response = await client.post(self.api_url, data=params)
+            response.raise_for_status()
 
-                data = response.json()
+            data = response.json()
 
-                if 'error_response' in data:
-                    logger.error(f"❌ Product details error: {data['error_response']}")
-                    return []
+            if 'error_response' in data:
+                logger.error(f"❌ Product details error: {data['error_response']}")
+                return []
 
-                # Parse product details
-                if 'aliexpress_ds_product_get_response' in data:
-                    result = data['aliexpress_ds_product_get_response']['result']
-                    return [result]  # Details for single product
+            # Parse product details
+            if 'aliexpress_ds_product_get_response' in data:
+                result = data['aliexpress_ds_product_get_response']['result']
+                return [result]  # Details for single product
 
-                return []
+            return []
 
         except Exception as e:
             logger.error(f"❌ Product details error: {e}")
@@ -87,7 +87,8 @@ class MultiNicheDiscovery:
     async def discover_all_niches(
         self,
         min_score: float = 7.0,
-        max_per_niche: int = 5
+        max_per_niche: int = 5,
+        max_concurrency: int = 8
     ) -> Dict[str, List[Dict]]:
         """
         Discover products across ALL niches in parallel.
@@ -97,6 +98,8 @@ class MultiNicheDiscovery:
         Args:
             min_score: Minimum product score (0-10)
             max_per_niche: Maximum products to return per niche
+            max_concurrency: Maximum niches searched at once (bounds the
+                burst of Reddit/AliExpress calls so we don't trip rate limits)
 
         Returns:
             {
@@ -115,7 +118,9 @@ class MultiNicheDiscovery:
 
         start_time = datetime.now()
 
-        # Run all niche discoveries in parallel
+        # Run all niche discoveries in parallel, bounded by a semaphore so
+        # only max_concurrency niches hit the upstream APIs at once
+        self._sem = asyncio.Semaphore(max_concurrency)
         tasks = []
         for niche_name, niche_data in self.NICHES.items():
             task = self._discover_niche(
@@ -180,10 +185,11 @@ class MultiNicheDiscovery:
         """Discover products for a single niche."""
         try:
             # Use pipeline's discover_niche_winners method
-            products = await self.pipeline.discover_niche_winners(
-                subreddits=subreddits,
-                max_results=max_results
-            )
+            async with self._sem:
+                products = await self.pipeline.discover_niche_winners(
+                    subreddits=subreddits,
+                    max_results=max_results
+                )
 
             # Filter by minimum score
             filtered = [p for p in products if p["score"] >= min_score][:max_results]
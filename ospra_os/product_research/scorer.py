@@ -4,6 +4,117 @@ from typing import List, Dict
 from .connectors.base import ProductCandidate
 
 
+def _score_kernel(mentions: float, search: float, engagement: float,
+                  trend: float, is_reddit: bool, is_gtrends: bool,
+                  w_demand: float, w_sentiment: float, w_trend: float) -> float:
+    """
+    Pure-numeric scoring kernel.
+
+    Kept free of dict/string/attribute access so Numba can JIT-compile
+    it for batch discovery runs; falls back to plain Python when numba
+    isn't installed. Must stay behaviorally identical to the documented
+    scoring model in ProductScorer.score.
+    """
+    # 1. DEMAND (0-10): Reddit mentions + search volume, 5 points each
+    demand = 0.0
+    if mentions > 0:
+        if mentions >= 1000:
+            demand += 5.0
+        elif mentions >= 500:
+            demand += 4.0
+        elif mentions >= 100:
+            demand += 3.0
+        elif mentions >= 50:
+            demand += 2.0
+        else:
+            demand += 1.0
+    if search > 0:
+        if search >= 80:
+            demand += 5.0
+        elif search >= 60:
+            demand += 4.0
+        elif search >= 40:
+            demand += 3.0
+        elif search >= 20:
+            demand += 2.0
+        else:
+            demand += 1.0
+    if demand == 0:
+        demand = 3.0  # Conservative default
+    demand = min(10.0, demand)
+
+    # 2. SENTIMENT (0-10): engagement + Reddit engagement score
+    sentiment = 0.0
+    if engagement > 0:
+        if engagement >= 200:
+            sentiment += 5.0
+        elif engagement >= 100:
+            sentiment += 4.0
+        elif engagement >= 50:
+            sentiment += 3.0
+        elif engagement >= 20:
+            sentiment += 2.0
+        else:
+            sentiment += 1.0
+    if trend != 0 and is_reddit:
+        if trend >= 500:
+            sentiment += 5.0
+        elif trend >= 250:
+            sentiment += 4.0
+        elif trend >= 100:
+            sentiment += 3.0
+        elif trend >= 50:
+            sentiment += 2.0
+        else:
+            sentiment += 1.0
+    if sentiment == 0:
+        sentiment = 4.0  # Slightly below neutral
+    sentiment = min(10.0, sentiment)
+
+    # 3. TREND DIRECTION (0-10): Google Trends trajectory
+    if trend != 0 and is_gtrends:
+        if trend >= 80:
+            trend_dir = 10.0
+        elif trend >= 60:
+            trend_dir = 8.0
+        elif trend >= 40:
+            trend_dir = 6.0
+        elif trend >= 20:
+            trend_dir = 4.0
+        else:
+            trend_dir = 2.0
+    elif search != 0:
+        trend_dir = min(10.0, search / 10)
+    else:
+        trend_dir = 3.0
+
+    weighted = demand * w_demand + sentiment * w_sentiment + trend_dir * w_trend
+    weight_sum = w_demand + w_sentiment + w_trend
+    return weighted / weight_sum if weight_sum > 0 else 0.0
+
+
+try:
+    from numba import njit
+    # cache=True persists the compiled kernel to disk so only the first
+    # run ever pays the LLVM compile cost
+    _score_kernel = njit(cache=True, fastmath=True)(_score_kernel)
+except ImportError:
+    pass  # pure-Python kernel is already correct, just slower in bulk
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Point-ladder thresholds mirrored from _score_kernel; searchsorted
+# against these reproduces the elif chains as one vector op each
+_MENTION_STEPS = (50, 100, 500, 1000)
+_SEARCH_STEPS = (20, 40, 60, 80)
+_ENGAGEMENT_STEPS = (20, 50, 100, 200)
+_REDDIT_TREND_STEPS = (50, 100, 250, 500)
+_GTRENDS_STEPS = (20, 40, 60, 80)
+
+
 class ProductScorer:
     """
     Score and rank product candidates based on multiple signals.
@@ -42,117 +153,77 @@ class ProductScorer:
         Returns:
             Score from 0-10
         """
-        scores = {}
-
-        # 1. DEMAND SCORE (0-10) - 40% weight
-        # Combines Reddit mentions and search volume
-        demand_score = 0.0
-
-        # Reddit mentions (upvotes) - max 5 points
-        if candidate.social_mentions and candidate.social_mentions > 0:
-            if candidate.social_mentions >= 1000:
-                demand_score += 5.0
-            elif candidate.social_mentions >= 500:
-                demand_score += 4.0
-            elif candidate.social_mentions >= 100:
-                demand_score += 3.0
-            elif candidate.social_mentions >= 50:
-                demand_score += 2.0
-            else:
-                demand_score += 1.0
-
-        # Search volume (Google Trends) - max 5 points
-        if candidate.search_volume and candidate.search_volume > 0:
-            if candidate.search_volume >= 80:
-                demand_score += 5.0
-            elif candidate.search_volume >= 60:
-                demand_score += 4.0
-            elif candidate.search_volume >= 40:
-                demand_score += 3.0
-            elif candidate.search_volume >= 20:
-                demand_score += 2.0
-            else:
-                demand_score += 1.0
-
-        # If no data, use conservative score
-        if demand_score == 0:
-            demand_score = 3.0  # Conservative default
-
-        scores["demand"] = min(10, demand_score)
-
-        # 2. SENTIMENT SCORE (0-10) - 30% weight
-        # Measures community engagement quality
-        sentiment_score = 0.0
-
-        # Comments/engagement - max 5 points
-        if candidate.social_engagement and candidate.social_engagement > 0:
-            if candidate.social_engagement >= 200:
-                sentiment_score += 5.0
-            elif candidate.social_engagement >= 100:
-                sentiment_score += 4.0
-            elif candidate.social_engagement >= 50:
-                sentiment_score += 3.0
-            elif candidate.social_engagement >= 20:
-                sentiment_score += 2.0
-            else:
-                sentiment_score += 1.0
-
-        # Engagement ratio (engagement score from Reddit) - max 5 points
-        # Reddit connector calculates this as weighted score
-        if candidate.trend_score and candidate.source == "reddit":
-            # Reddit trend_score is engagement score (0-1000+)
-            if candidate.trend_score >= 500:
-                sentiment_score += 5.0
-            elif candidate.trend_score >= 250:
-                sentiment_score += 4.0
-            elif candidate.trend_score >= 100:
-                sentiment_score += 3.0
-            elif candidate.trend_score >= 50:
-                sentiment_score += 2.0
-            else:
-                sentiment_score += 1.0
-
-        # If no data, use conservative score
-        if sentiment_score == 0:
-            sentiment_score = 4.0  # Slightly below neutral
-
-        scores["sentiment"] = min(10, sentiment_score)
-
-        # 3. TREND DIRECTION SCORE (0-10) - 30% weight
-        # Google Trends trajectory
-        trend_score = 0.0
-
-        if candidate.trend_score and candidate.source == "google_trends":
-            # Google Trends returns 0-100 trend score
-            if candidate.trend_score >= 80:
-                trend_score = 10.0
-            elif candidate.trend_score >= 60:
-                trend_score = 8.0
-            elif candidate.trend_score >= 40:
-                trend_score = 6.0
-            elif candidate.trend_score >= 20:
-                trend_score = 4.0
-            else:
-                trend_score = 2.0
-        elif candidate.search_volume:
-            # Use search volume as proxy if trend_score not available
-            trend_score = min(10, candidate.search_volume / 10)
-        else:
-            # No trend data - conservative score
-            trend_score = 3.0
+        # All the arithmetic lives in _score_kernel (JIT-compiled when
+        # numba is available); this wrapper only extracts plain floats
+        final_score = _score_kernel(
+            float(candidate.social_mentions or 0),
+            float(candidate.search_volume or 0),
+            float(candidate.social_engagement or 0),
+            float(candidate.trend_score or 0),
+            candidate.source == "reddit",
+            candidate.source == "google_trends",
+            self.weights["demand"],
+            self.weights["sentiment"],
+            self.weights["trend"],
+        )
 
-        scores["trend"] = trend_score
+        return round(final_score, 2)
 
-        # Calculate weighted average
-        weighted_score = sum(
-            scores[factor] * self.weights[factor]
-            for factor in scores
-        )
+    def score_batch(self, candidates: List[ProductCandidate]) -> List[float]:
+        """
+        Score many candidates at once.
 
-        # Normalize to 0-10 scale
-        final_score = weighted_score / sum(self.weights.values()) if sum(self.weights.values()) > 0 else 0
+        With numpy installed the whole batch is computed with vector
+        ops (searchsorted reproduces each point ladder), so discovery
+        runs over thousands of candidates skip the per-product Python
+        loop. Without numpy it degrades to scoring one at a time.
 
-        return round(final_score, 2)
+        Returns:
+            Scores in candidate order, same values as score() per item
+        """
+        if np is None or not candidates:
+            return [self.score(c) for c in candidates]
+
+        n = len(candidates)
+        mentions = np.fromiter(
+            (float(c.social_mentions or 0) for c in candidates), np.float64, count=n)
+        search = np.fromiter(
+            (float(c.search_volume or 0) for c in candidates), np.float64, count=n)
+        engagement = np.fromiter(
+            (float(c.social_engagement or 0) for c in candidates), np.float64, count=n)
+        trend = np.fromiter(
+            (float(c.trend_score or 0) for c in candidates), np.float64, count=n)
+        is_reddit = np.fromiter(
+            (c.source == "reddit" for c in candidates), bool, count=n)
+        is_gtrends = np.fromiter(
+            (c.source == "google_trends" for c in candidates), bool, count=n)
+
+        demand = np.where(
+            mentions > 0, 1.0 + np.searchsorted(_MENTION_STEPS, mentions, side="right"), 0.0)
+        demand += np.where(
+            search > 0, 1.0 + np.searchsorted(_SEARCH_STEPS, search, side="right"), 0.0)
+        demand = np.where(demand == 0, 3.0, np.minimum(10.0, demand))
+
+        sentiment = np.where(
+            engagement > 0,
+            1.0 + np.searchsorted(_ENGAGEMENT_STEPS, engagement, side="right"), 0.0)
+        sentiment += np.where(
+            (trend != 0) & is_reddit,
+            1.0 + np.searchsorted(_REDDIT_TREND_STEPS, trend, side="right"), 0.0)
+        sentiment = np.where(sentiment == 0, 4.0, np.minimum(10.0, sentiment))
+
+        trend_dir = np.where(
+            (trend != 0) & is_gtrends,
+            2.0 * (1.0 + np.searchsorted(_GTRENDS_STEPS, trend, side="right")),
+            np.where(search != 0, np.minimum(10.0, search / 10), 3.0))
+
+        weighted = (demand * self.weights["demand"]
+                    + sentiment * self.weights["sentiment"]
+                    + trend_dir * self.weights["trend"])
+        weight_sum = sum(self.weights.values())
+        scores = weighted / weight_sum if weight_sum > 0 else np.zeros(n)
+
+        return [round(s, 2) for s in scores.tolist()]
 
     def rank(self, candidates: List[ProductCandidate], limit: int = 10) -> List[Dict]:
         """
@@ -167,8 +238,7 @@ class ProductScorer:
         """
         scored = []
 
-        for candidate in candidates:
-            score = self.score(candidate)
+        for candidate, score in zip(candidates, self.score_batch(candidates)):
             scored.append({
                 "product": candidate.to_dict(),
                 "score": score,
@@ -199,6 +269,22 @@ class ProductScorer:
         else:
             return "LOW"
 
+    def score_with_explanation(self, candidate: ProductCandidate) -> tuple:
+        """
+        Score a candidate and return its breakdown in one pass.
+
+        Callers that want both the number and the factor breakdown
+        should use this instead of score() + explain_score(), which
+        computes the sub-scores twice. The returned score is the
+        breakdown's total, so the printed number always matches the
+        printed factors.
+
+        Returns:
+            (score, explanation) — explanation as from explain_score()
+        """
+        explanation = self.explain_score(candidate)
+        return explanation["total_score"], explanation
+
     def explain_score(self, candidate: ProductCandidate) -> Dict:
         """
         Get detailed scoring breakdown.
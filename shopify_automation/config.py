@@ -8,8 +8,16 @@ used across the Shopify automation package.
 DO NOT hardcode secrets here - use environment variables.
 """
 
+import atexit
+import functools
+import hashlib
+import logging
+import logging.handlers
 import os
-from typing import Dict, List
+import queue
+import re
+import sqlite3
+from typing import Dict, List, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -46,6 +54,7 @@ class ShopifyConfig:
 
     # Rate limiting
     REQUESTS_PER_SECOND = 2  # Shopify allows 2 req/sec for REST API
+    BURST_CAPACITY = 40  # Shopify's leaky bucket holds 40 requests
     MAX_RETRIES = 3
     RETRY_BACKOFF_FACTOR = 2  # Exponential backoff: 1s, 2s, 4s
 
@@ -482,8 +491,87 @@ class ValidationConfig:
 # HELPER FUNCTIONS
 # ============================================
 
+# ============================================
+# AI CONTENT CACHE (content-addressed, on disk)
+# ============================================
+
+_CONTENT_CACHE_DB = DATA_DIR / "content_cache.sqlite3"
+_content_cache_conn = None
+
+
+def _content_cache() -> sqlite3.Connection:
+    """Open (once) the on-disk cache of generated content"""
+    global _content_cache_conn
+    if _content_cache_conn is None:
+        _content_cache_conn = sqlite3.connect(_CONTENT_CACHE_DB)
+        _content_cache_conn.execute("PRAGMA synchronous=NORMAL")
+        _content_cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS content_cache (key TEXT PRIMARY KEY, value TEXT)"
+        )
+    return _content_cache_conn
+
+
+def content_cache_key(*parts: str) -> str:
+    """Content-addressed key: same inputs -> same cached output"""
+    return hashlib.blake2b(":".join(parts).encode()).hexdigest()[:32]
+
+
+def content_cache_get(key: str) -> Optional[str]:
+    """Look up a previously generated value; None on miss or cache error"""
+    try:
+        row = _content_cache().execute(
+            "SELECT value FROM content_cache WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error:
+        return None
+
+
+def content_cache_put(key: str, value: str) -> None:
+    """Store a generated value; cache errors are non-fatal"""
+    try:
+        conn = _content_cache()
+        conn.execute(
+            "INSERT OR REPLACE INTO content_cache (key, value) VALUES (?, ?)",
+            (key, value)
+        )
+        conn.commit()
+    except sqlite3.Error:
+        pass
+
+
+def setup_queue_logging(log_file) -> None:
+    """Configure root logging through a background queue listener.
+
+    Records are handed to an in-memory queue and written by a worker
+    thread, so disk I/O never blocks the request-issuing loop. The file
+    handler rotates using the limits declared in LogConfig.
+    """
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.StreamHandler(),
+        logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=LogConfig.MAX_LOG_SIZE_MB * 2**20,
+            backupCount=LogConfig.BACKUP_COUNT,
+            delay=True  # open on first emit; --help runs never touch disk
+        ),
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LogConfig.LOG_FORMAT,
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def get_shopify_headers() -> Dict[str, str]:
-    """Get headers for Shopify API requests"""
+    """Get headers for Shopify API requests (built once; token is constant)"""
     return {
         "Content-Type": "application/json",
         "X-Shopify-Access-Token": ShopifyConfig.ACCESS_TOKEN
@@ -518,24 +606,23 @@ def calculate_compare_at_price(selling_price: float) -> float:
     return psychological_price(compare_at)
 
 
-def clean_handle(text: str) -> str:
-    """Create clean URL handle from text"""
-    import re
+# Compiled once at import - clean_handle runs per product/collection
+_HANDLE_STRIP_RE = re.compile(r'[^a-z0-9\-]')
+_HANDLE_DEDUP_RE = re.compile(r'-+')
+
 
-    # Convert to lowercase
-    handle = text.lower()
+@functools.lru_cache(maxsize=1024)
+def clean_handle(text: str) -> str:
+    """Create clean URL handle from text (memoized; titles repeat across runs)"""
 
-    # Replace spaces with hyphens
-    handle = handle.replace(' ', '-')
+    # Lowercase, spaces to hyphens
+    handle = text.lower().replace(' ', '-')
 
     # Remove special characters
-    handle = re.sub(r'[^a-z0-9\-]', '', handle)
-
-    # Remove multiple hyphens
-    handle = re.sub(r'-+', '-', handle)
+    handle = _HANDLE_STRIP_RE.sub('', handle)
 
-    # Trim hyphens from ends
-    handle = handle.strip('-')
+    # Collapse multiple hyphens and trim from ends
+    handle = _HANDLE_DEDUP_RE.sub('-', handle).strip('-')
 
     # Limit length
     if len(handle) > SEOConfig.HANDLE_MAX_LENGTH:
@@ -548,8 +635,9 @@ def clean_handle(text: str) -> str:
 # VALIDATE CONFIGURATION ON IMPORT
 # ============================================
 
+@functools.lru_cache(maxsize=1)
 def validate_all():
-    """Validate all configuration settings"""
+    """Validate all configuration settings (cached; re-run via validate_all.cache_clear())"""
     errors = []
 
     # Check Shopify credentials
@@ -598,6 +686,10 @@ __all__ = [
     'APIConfig',
     'UIConfig',
     'ValidationConfig',
+    'setup_queue_logging',
+    'content_cache_key',
+    'content_cache_get',
+    'content_cache_put',
     'get_shopify_headers',
     'psychological_price',
     'calculate_selling_price',
@@ -21,9 +21,24 @@ Usage:
 import os
 import sys
 import argparse
+import asyncio
+import functools
+import json
 import logging
 import time
+import httpx
 import requests
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
 from pathlib import Path
 
@@ -37,46 +52,113 @@ from shopify_automation.config import (
     ContentConfig,
     LogConfig,
     UIConfig,
+    setup_queue_logging,
+    content_cache_key,
+    content_cache_get,
+    content_cache_put,
     get_shopify_headers,
     clean_handle
 )
 
-# Try to import optional dependencies
-try:
-    from tqdm import tqdm
-    HAS_TQDM = True
-except ImportError:
-    HAS_TQDM = False
+# Optional dependencies are imported lazily on first use so cold starts
+# (--help, cached dry-runs) don't pay for anthropic/openai import time
+_Anthropic = None
+_OpenAI = None
 
-try:
-    from anthropic import Anthropic
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
 
-try:
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+def _get_anthropic():
+    """Return the Anthropic class, or False if the package is missing"""
+    global _Anthropic
+    if _Anthropic is None:
+        try:
+            from anthropic import Anthropic
+            _Anthropic = Anthropic
+        except ImportError:
+            _Anthropic = False
+    return _Anthropic
+
+
+def _get_openai():
+    """Return the OpenAI class, or False if the package is missing"""
+    global _OpenAI
+    if _OpenAI is None:
+        try:
+            from openai import OpenAI
+            _OpenAI = OpenAI
+        except ImportError:
+            _OpenAI = False
+    return _OpenAI
+
+
+def tqdm(iterable, **kwargs):
+    """Import tqdm on first call; rebinds itself to the real (or no-op) one"""
+    global tqdm
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        def tqdm(it, **_):
+            return it
+    return tqdm(iterable, **kwargs)
 
 
 # ============================================
 # LOGGING SETUP
 # ============================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LogConfig.LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LogConfig.CREATE_COLLECTIONS_LOG)
-    ]
-)
+setup_queue_logging(LogConfig.CREATE_COLLECTIONS_LOG)
 
 logger = logging.getLogger(__name__)
 
 
+# Shared on-disk content cache (see config.content_cache_*)
+_cache_key = content_cache_key
+_cache_get = content_cache_get
+_cache_put = content_cache_put
+
+
+# ============================================
+# FALLBACK DESCRIPTIONS (static, built once)
+# ============================================
+
+_FALLBACK_DESCRIPTIONS: Dict[str, str] = {
+    "Smart Lighting": """<p>Illuminate your home with our collection of smart lighting solutions. From WiFi LED bulbs to voice-controlled light strips, transform any space with customizable colors, schedules, and voice commands.</p>
+
+<p><strong>Why Choose Smart Lighting?</strong></p>
+<ul>
+<li>Energy savings up to 75% compared to traditional bulbs</li>
+<li>Voice control with Alexa, Google Home, and Siri</li>
+<li>Set schedules and automations for convenience</li>
+<li>Create custom scenes for any mood or occasion</li>
+</ul>
+
+<p>At Oubon Shop, we carefully select only the highest-rated smart lighting products with proven reliability and customer satisfaction. Free shipping on orders over $50 and 30-day returns on all products.</p>""",
+
+    "Home Security": """<p>Protect what matters most with our professional-grade home security solutions. Browse wireless cameras, smart locks, and security systems designed for easy installation and remote monitoring.</p>
+
+<p><strong>Essential Security Features:</strong></p>
+<ul>
+<li>24/7 HD video recording with night vision</li>
+<li>Instant alerts sent to your smartphone</li>
+<li>Two-way audio communication</li>
+<li>Cloud storage and local backup options</li>
+</ul>
+
+<p>Every security product at Oubon Shop is tested for reliability and backed by our satisfaction guarantee. Shop with confidence knowing you're getting quality home protection.</p>"""
+}
+
+_DEFAULT_FALLBACK_TEMPLATE = """<p>Discover our curated selection of {title_lower} at Oubon Shop. Each product is carefully selected for quality, reliability, and customer satisfaction.</p>
+
+<p><strong>Why Shop This Collection?</strong></p>
+<ul>
+<li>Hand-picked products with verified reviews</li>
+<li>Easy installation and setup</li>
+<li>Compatible with major smart home platforms</li>
+<li>Free shipping on orders over $50</li>
+</ul>
+
+<p>At Oubon Shop, we're committed to bringing you the latest in smart home technology at unbeatable prices. Every product is backed by our 30-day money-back guarantee.</p>"""
+
+
 # ============================================
 # COLLECTION CONTENT GENERATOR
 # ============================================
@@ -87,10 +169,92 @@ class CollectionContentGenerator:
     def __init__(self, claude=None, openai_client=None):
         self.claude = claude
         self.openai = openai_client
+        self.bulk_descriptions: Dict[str, str] = {}
+
+    def generate_descriptions_bulk(self, titles: List[str], collection_type: str = "category") -> Dict[str, str]:
+        """Generate descriptions for many collections in ONE AI request.
+
+        Packs all titles into a single prompt asking for a JSON object of
+        title -> HTML description, cutting per-request overhead by ~N.
+        Results are kept on the instance so generate_description finds
+        them; titles missing from the response fall back per-title.
+        """
+        if not titles or not (self.claude or self.openai):
+            return {}
+
+        titles_list = "\n".join(f"- {t}" for t in titles)
+        prompt = f"""Write engaging collection descriptions for these e-commerce category pages:
+{titles_list}
+
+Requirements for EACH description:
+1. Opening paragraph explaining the category (2-3 sentences)
+2. Benefits of products in this category (3-4 bullet points)
+3. How to choose the right product (1 paragraph)
+4. Why buy from Oubon Shop (1 paragraph)
+
+Tone: Helpful, expert, trustworthy
+Length: 300-500 words each
+Keywords: Include each collection title naturally 3-4 times in its description
+Format: HTML with <p>, <ul>, <li> tags
+
+Return ONLY a JSON object mapping each collection title exactly as given to its HTML description."""
+
+        raw = None
+        try:
+            if self.claude:
+                key = _cache_key(ContentConfig.CLAUDE_MODEL, prompt)
+                raw = _cache_get(key)
+                if raw is None:
+                    response = self.claude.messages.create(
+                        model=ContentConfig.CLAUDE_MODEL,
+                        max_tokens=800 * len(titles),
+                        messages=[{"role": "user", "content": prompt}]
+                    )
+                    parts = response.content
+                    raw = parts[0].text if parts else ""
+                    if raw:
+                        _cache_put(key, raw)
+            elif self.openai:
+                key = _cache_key(ContentConfig.OPENAI_MODEL, prompt)
+                raw = _cache_get(key)
+                if raw is None:
+                    response = self.openai.chat.completions.create(
+                        model=ContentConfig.OPENAI_MODEL,
+                        messages=[
+                            {"role": "system", "content": "You are an expert e-commerce copywriter specializing in tech products."},
+                            {"role": "user", "content": prompt}
+                        ],
+                        response_format={"type": "json_object"},
+                        temperature=0.7
+                    )
+                    choices = response.choices
+                    raw = choices[0].message.content if choices else ""
+                    if raw:
+                        _cache_put(key, raw)
+        except Exception as e:
+            logger.error(f"Bulk description generation failed: {e}")
+            return {}
+
+        try:
+            # Tolerate models wrapping the JSON in prose/code fences
+            start, end = raw.find('{'), raw.rfind('}')
+            parsed = json.loads(raw[start:end + 1])
+            self.bulk_descriptions = {t: d for t, d in parsed.items() if isinstance(d, str) and d}
+            logger.info(f"Bulk-generated {len(self.bulk_descriptions)}/{len(titles)} descriptions in one request")
+        except (ValueError, AttributeError) as e:
+            logger.warning(f"Could not parse bulk description response, falling back per-title: {e}")
+            return {}
+
+        return self.bulk_descriptions
 
     def generate_description(self, collection_title: str, collection_type: str = "category") -> str:
         """Generate SEO-optimized collection description"""
 
+        # Bulk pre-pass already produced this one
+        bulk = self.bulk_descriptions.get(collection_title)
+        if bulk:
+            return bulk
+
         # Try AI generation first
         if self.claude:
             description = self._generate_with_claude(collection_title, collection_type)
@@ -124,13 +288,24 @@ Length: 300-500 words
 Keywords: Include "{title}" naturally 3-4 times
 Format: HTML with <p>, <ul>, <li> tags"""
 
+            # Skip the paid API call entirely on re-runs
+            key = _cache_key(ContentConfig.CLAUDE_MODEL, prompt)
+            cached = _cache_get(key)
+            if cached:
+                logger.info(f"Reused cached description for '{title}' (Claude)")
+                return cached
+
             response = self.claude.messages.create(
                 model=ContentConfig.CLAUDE_MODEL,
                 max_tokens=800,
                 messages=[{"role": "user", "content": prompt}]
             )
 
-            description = response.content[0].text
+            parts = response.content
+            description = parts[0].text if parts else ""
+            if not description:
+                return None
+            _cache_put(key, description)
             logger.info(f"Generated description for '{title}' with Claude")
             return description
 
@@ -141,11 +316,7 @@ Format: HTML with <p>, <ul>, <li> tags"""
     def _generate_with_openai(self, title: str, collection_type: str) -> Optional[str]:
         """Generate description using OpenAI"""
         try:
-            response = self.openai.chat.completions.create(
-                model=ContentConfig.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are an expert e-commerce copywriter specializing in tech products."},
-                    {"role": "user", "content": f"""Write a collection description for: {title}
+            user_prompt = f"""Write a collection description for: {title}
 
 Include:
 1. Category overview (2-3 sentences)
@@ -153,13 +324,29 @@ Include:
 3. Buying guide
 4. Why Oubon Shop
 
-Length: 300-500 words. Format as HTML."""}
+Length: 300-500 words. Format as HTML."""
+
+            key = _cache_key(ContentConfig.OPENAI_MODEL, user_prompt)
+            cached = _cache_get(key)
+            if cached:
+                logger.info(f"Reused cached description for '{title}' (OpenAI)")
+                return cached
+
+            response = self.openai.chat.completions.create(
+                model=ContentConfig.OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": "You are an expert e-commerce copywriter specializing in tech products."},
+                    {"role": "user", "content": user_prompt}
                 ],
                 max_tokens=800,
                 temperature=0.7
             )
 
-            description = response.choices[0].message.content
+            choices = response.choices
+            description = choices[0].message.content if choices else None
+            if not description:
+                return None
+            _cache_put(key, description)
             logger.info(f"Generated description for '{title}' with OpenAI")
             return description
 
@@ -169,64 +356,28 @@ Length: 300-500 words. Format as HTML."""}
 
     def _generate_fallback_description(self, title: str, collection_type: str) -> str:
         """Generate basic description without AI"""
-
-        descriptions = {
-            "Smart Lighting": """<p>Illuminate your home with our collection of smart lighting solutions. From WiFi LED bulbs to voice-controlled light strips, transform any space with customizable colors, schedules, and voice commands.</p>
-
-<p><strong>Why Choose Smart Lighting?</strong></p>
-<ul>
-<li>Energy savings up to 75% compared to traditional bulbs</li>
-<li>Voice control with Alexa, Google Home, and Siri</li>
-<li>Set schedules and automations for convenience</li>
-<li>Create custom scenes for any mood or occasion</li>
-</ul>
-
-<p>At Oubon Shop, we carefully select only the highest-rated smart lighting products with proven reliability and customer satisfaction. Free shipping on orders over $50 and 30-day returns on all products.</p>""",
-
-            "Home Security": """<p>Protect what matters most with our professional-grade home security solutions. Browse wireless cameras, smart locks, and security systems designed for easy installation and remote monitoring.</p>
-
-<p><strong>Essential Security Features:</strong></p>
-<ul>
-<li>24/7 HD video recording with night vision</li>
-<li>Instant alerts sent to your smartphone</li>
-<li>Two-way audio communication</li>
-<li>Cloud storage and local backup options</li>
-</ul>
-
-<p>Every security product at Oubon Shop is tested for reliability and backed by our satisfaction guarantee. Shop with confidence knowing you're getting quality home protection.</p>""",
-
-            "default": f"""<p>Discover our curated selection of {title.lower()} at Oubon Shop. Each product is carefully selected for quality, reliability, and customer satisfaction.</p>
-
-<p><strong>Why Shop This Collection?</strong></p>
-<ul>
-<li>Hand-picked products with verified reviews</li>
-<li>Easy installation and setup</li>
-<li>Compatible with major smart home platforms</li>
-<li>Free shipping on orders over $50</li>
-</ul>
-
-<p>At Oubon Shop, we're committed to bringing you the latest in smart home technology at unbeatable prices. Every product is backed by our 30-day money-back guarantee.</p>"""
-        }
-
-        return descriptions.get(title, descriptions["default"])
-
-    def generate_meta_fields(self, collection_title: str) -> Dict[str, str]:
-        """Generate SEO meta title and description"""
-
-        # Meta title (60 chars max)
-        meta_title = f"{collection_title} - Smart Home Tech | Oubon Shop"
-        if len(meta_title) > 60:
+        return (_FALLBACK_DESCRIPTIONS.get(title)
+                or _DEFAULT_FALLBACK_TEMPLATE.format(title_lower=title.lower()))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def generate_meta_fields(collection_title: str) -> tuple:
+        """Generate SEO (meta_title, meta_description); pure, so memoized"""
+
+        # Meta title (60 chars max): decide on the title length up front so
+        # only the final string is ever built
+        if len(collection_title) + len(" - Smart Home Tech | Oubon Shop") <= 60:
+            meta_title = f"{collection_title} - Smart Home Tech | Oubon Shop"
+        else:
             meta_title = f"{collection_title[:40]}... | Oubon Shop"
 
-        # Meta description (155 chars max)
-        meta_description = f"Shop {collection_title} at Oubon Shop. Premium smart home products with free shipping over $50. 30-day returns. Order now!"
-        if len(meta_description) > 155:
+        # Meta description (155 chars max): same single-build pattern
+        if len(collection_title) + len("Shop  at Oubon Shop. Premium smart home products with free shipping over $50. 30-day returns. Order now!") <= 155:
+            meta_description = f"Shop {collection_title} at Oubon Shop. Premium smart home products with free shipping over $50. 30-day returns. Order now!"
+        else:
             meta_description = f"Shop {collection_title[:80]}... Free shipping over $50. 30-day returns."
 
-        return {
-            "meta_title": meta_title,
-            "meta_description": meta_description
-        }
+        return meta_title, meta_description
 
 
 # ============================================
@@ -241,6 +392,32 @@ class ShopifyCollectionCreator:
         self.custom_collections_url = f"{ShopifyConfig.BASE_URL}/custom_collections.json"
         self.headers = get_shopify_headers()
         self.rate_limit_delay = 1.0 / ShopifyConfig.REQUESTS_PER_SECOND
+        self._next_allowed = 0.0  # monotonic deadline for the next request slot
+
+        # Reuse one session so every create shares a pooled TCP+TLS connection
+        # instead of paying a fresh handshake per collection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=ShopifyConfig.MAX_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+
+    def _reserve_slot(self) -> float:
+        """Claim the next request slot; return how long to wait for it.
+
+        Token-bucket style pacing against time.monotonic(): if the previous
+        request already took longer than 1/RPS there is nothing to wait for.
+        """
+        now = time.monotonic()
+        slot = max(now, self._next_allowed)
+        self._next_allowed = slot + self.rate_limit_delay
+        return slot - now
 
     def create_smart_collection(self, collection_data: Dict, dry_run: bool = False) -> Optional[Dict]:
         """Create smart collection in Shopify"""
@@ -249,13 +426,17 @@ class ShopifyCollectionCreator:
             return {"smart_collection": {"id": "dry-run-id", **collection_data['smart_collection']}}
 
         try:
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
-
-            response = requests.post(
+            # Rate limiting: only sleep when we're ahead of schedule, so slow
+            # API calls don't pay an extra fixed delay on top
+            wait = self._reserve_slot()
+            if wait > 0:
+                time.sleep(wait)
+
+            # orjson emits bytes directly; Content-Type is already on the
+            # session headers
+            response = self.session.post(
                 self.smart_collections_url,
-                json=collection_data,
-                headers=self.headers,
+                data=_json_dumps(collection_data),
                 timeout=ShopifyConfig.REQUEST_TIMEOUT
             )
 
@@ -276,6 +457,64 @@ class ShopifyCollectionCreator:
             logger.error(f"Failed to create collection: {e}")
             return None
 
+    async def create_smart_collection_async(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        collection_data: Dict,
+        dry_run: bool = False
+    ) -> Optional[Dict]:
+        """Create smart collection via a shared async HTTP/2 client"""
+        if dry_run:
+            logger.info(f"[DRY RUN] Would create collection: {collection_data['smart_collection']['title']}")
+            return {"smart_collection": {"id": "dry-run-id", **collection_data['smart_collection']}}
+
+        async with semaphore:
+            try:
+                # Rate limiting (non-blocking for sibling tasks)
+                wait = self._reserve_slot()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                response = await client.post(
+                    self.smart_collections_url,
+                    content=_json_dumps(collection_data),
+                    timeout=ShopifyConfig.REQUEST_TIMEOUT
+                )
+
+                response.raise_for_status()
+                result = response.json()
+
+                logger.info(UIConfig.success(f"Created collection: {result['smart_collection']['title']}"))
+                return result
+
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 422:
+                    # Collection might already exist
+                    logger.warning(f"Collection might already exist: {collection_data['smart_collection']['title']}")
+                else:
+                    logger.error(f"Shopify API error: {e.response.status_code} - {e.response.text}")
+                return None
+            except Exception as e:
+                logger.error(f"Failed to create collection: {e}")
+                return None
+
+    async def create_smart_collections_async(self, payloads: List[Dict], dry_run: bool = False) -> List[Optional[Dict]]:
+        """Create many collections concurrently over one pooled connection"""
+        # Shopify's leaky bucket (~40 requests deep) tolerates several
+        # in-flight requests; pacing is enforced by _reserve_slot, so the
+        # semaphore only caps concurrency, not rate
+        semaphore = asyncio.Semaphore(min(8, max(1, int(ShopifyConfig.REQUESTS_PER_SECOND) * 4)))
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        ) as client:
+            return await asyncio.gather(*[
+                self.create_smart_collection_async(client, semaphore, payload, dry_run=dry_run)
+                for payload in payloads
+            ])
+
     def build_collection_data(self, collection_config: Dict, content_gen: CollectionContentGenerator) -> Dict:
         """Build Shopify collection data structure"""
 
@@ -287,7 +526,7 @@ class ShopifyCollectionCreator:
 
         # Generate content
         description = content_gen.generate_description(title)
-        meta_fields = content_gen.generate_meta_fields(title)
+        meta_title, meta_description = content_gen.generate_meta_fields(title)
 
         # Build rules
         collection_rules = []
@@ -307,8 +546,8 @@ class ShopifyCollectionCreator:
                 "sort_order": sort_order,
                 "rules": collection_rules,
                 "disjunctive": disjunctive,  # True = OR, False = AND
-                "metafields_global_title_tag": meta_fields['meta_title'],
-                "metafields_global_description_tag": meta_fields['meta_description']
+                "metafields_global_title_tag": meta_title,
+                "metafields_global_description_tag": meta_description
             }
         }
 
@@ -338,14 +577,16 @@ def create_collections(dry_run: bool = False):
     claude = None
     openai_client = None
 
-    if HAS_ANTHROPIC and ContentConfig.CLAUDE_API_KEY:
+    Anthropic = _get_anthropic()
+    if Anthropic and ContentConfig.CLAUDE_API_KEY:
         try:
             claude = Anthropic(api_key=ContentConfig.CLAUDE_API_KEY)
             logger.info(UIConfig.success("Claude AI initialized"))
         except Exception as e:
             logger.warning(f"Claude initialization failed: {e}")
 
-    if HAS_OPENAI and ContentConfig.OPENAI_API_KEY:
+    OpenAI = _get_openai()
+    if OpenAI and ContentConfig.OPENAI_API_KEY:
         try:
             openai_client = OpenAI(api_key=ContentConfig.OPENAI_API_KEY)
             logger.info(UIConfig.success("OpenAI initialized"))
@@ -361,27 +602,28 @@ def create_collections(dry_run: bool = False):
 
     print(UIConfig.info(f"Creating {len(collections)} smart collections...\n"))
 
-    # Create collections
+    # One up-front AI request for all descriptions; per-title fallback on miss
+    content_gen.generate_descriptions_bulk([c['title'] for c in collections])
+
+    # Build all payloads first (content-generation pass), then issue the
+    # POSTs concurrently over one pooled HTTP/2 connection
     successful = 0
     failed = 0
+    payloads = []
 
-    iterator = tqdm(collections, desc="Creating collections") if HAS_TQDM else collections
-
-    for collection_config in iterator:
+    for collection_config in tqdm(collections, desc="Building collections"):
         try:
-            # Build collection data
-            collection_data = shopify.build_collection_data(collection_config, content_gen)
-
-            # Create in Shopify
-            result = shopify.create_smart_collection(collection_data, dry_run=dry_run)
+            payloads.append(shopify.build_collection_data(collection_config, content_gen))
+        except Exception as e:
+            logger.error(f"Error building collection {collection_config.get('title')}: {e}")
+            failed += 1
 
-            if result:
-                successful += 1
-            else:
-                failed += 1
+    results = asyncio.run(shopify.create_smart_collections_async(payloads, dry_run=dry_run))
 
-        except Exception as e:
-            logger.error(f"Error creating collection {collection_config.get('title')}: {e}")
+    for result in results:
+        if result:
+            successful += 1
+        else:
             failed += 1
 
     # Summary
@@ -23,9 +23,34 @@ Usage:
 import os
 import sys
 import argparse
+import asyncio
+import base64
+import functools
+import json
 import logging
+import re
 import time
+import types
+from urllib.parse import urlparse
+import aiohttp
 import requests
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _json_loads(data):
+        return json.loads(data)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional
 from pathlib import Path
 
@@ -41,45 +66,79 @@ from shopify_automation.config import (
     LogConfig,
     APIConfig,
     UIConfig,
+    setup_queue_logging,
+    content_cache_key,
+    content_cache_get,
+    content_cache_put,
     get_shopify_headers,
     calculate_selling_price,
     calculate_compare_at_price,
     clean_handle
 )
 
-# Try to import optional dependencies
-try:
-    from tqdm import tqdm
-    HAS_TQDM = True
-except ImportError:
-    HAS_TQDM = False
-    print(UIConfig.warning("tqdm not installed. Progress bars disabled. Install with: pip install tqdm"))
+# Optional dependencies are imported lazily on first use so cold starts
+# (--help, cached dry-runs) don't pay for anthropic/openai import time
+_Anthropic = None
+_OpenAI = None
 
-try:
-    from anthropic import Anthropic
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
 
-try:
-    from openai import OpenAI
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+def _get_anthropic():
+    """Return the Anthropic class, or False if the package is missing"""
+    global _Anthropic
+    if _Anthropic is None:
+        try:
+            from anthropic import Anthropic
+            _Anthropic = Anthropic
+        except ImportError:
+            _Anthropic = False
+    return _Anthropic
+
+
+def _get_openai():
+    """Return the OpenAI class, or False if the package is missing"""
+    global _OpenAI
+    if _OpenAI is None:
+        try:
+            from openai import OpenAI
+            _OpenAI = OpenAI
+        except ImportError:
+            _OpenAI = False
+    return _OpenAI
+
+
+def tqdm(iterable, **kwargs):
+    """Import tqdm on first call; rebinds itself to the real (or no-op) one"""
+    global tqdm
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        print(UIConfig.warning("tqdm not installed. Progress bars disabled. Install with: pip install tqdm"))
+
+        def tqdm(it, **_):
+            return it
+    return tqdm(iterable, **kwargs)
+
+
+# Shared session for the remaining synchronous HTTP paths (image
+# downloads): keep-alive pooling avoids a TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"]
+    )
+))
 
 
 # ============================================
 # LOGGING SETUP
 # ============================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=LogConfig.LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LogConfig.SETUP_PRODUCTS_LOG)
-    ]
-)
+setup_queue_logging(LogConfig.SETUP_PRODUCTS_LOG)
 
 logger = logging.getLogger(__name__)
 
@@ -94,7 +153,8 @@ def init_ai_clients():
     openai_client = None
 
     # Try Claude first
-    if HAS_ANTHROPIC and ContentConfig.CLAUDE_API_KEY:
+    Anthropic = _get_anthropic()
+    if Anthropic and ContentConfig.CLAUDE_API_KEY:
         try:
             claude = Anthropic(api_key=ContentConfig.CLAUDE_API_KEY)
             logger.info(UIConfig.success("Claude AI initialized"))
@@ -102,7 +162,8 @@ def init_ai_clients():
             logger.warning(f"Claude initialization failed: {e}")
 
     # Try OpenAI as fallback
-    if HAS_OPENAI and ContentConfig.OPENAI_API_KEY:
+    OpenAI = _get_openai()
+    if OpenAI and ContentConfig.OPENAI_API_KEY:
         try:
             openai_client = OpenAI(api_key=ContentConfig.OPENAI_API_KEY)
             logger.info(UIConfig.success("OpenAI initialized"))
@@ -126,22 +187,25 @@ class ProductIntelligenceFetcher:
         self.api_url = api_url or APIConfig.INTELLIGENCE_API_URL
         logger.info(f"Intelligence API: {self.api_url}")
 
-    def fetch_products(self, niches: List[str], max_per_niche: int = 5) -> List[Dict]:
+    async def fetch_products(self, niches: List[str], max_per_niche: int = 5) -> List[Dict]:
         """Fetch products from intelligence API"""
         logger.info(f"Fetching products for niches: {niches}")
 
         try:
-            response = requests.post(
-                self.api_url,
-                json={
-                    "niches": niches,
-                    "max_per_niche": max_per_niche
-                },
-                timeout=APIConfig.API_TIMEOUT
-            )
-
-            response.raise_for_status()
-            data = response.json()
+            timeout = aiohttp.ClientTimeout(total=APIConfig.API_TIMEOUT)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.post(
+                    self.api_url,
+                    data=_json_dumps({
+                        "niches": niches,
+                        "max_per_niche": max_per_niche
+                    }),
+                    headers={"Content-Type": "application/json"}
+                ) as response:
+                    response.raise_for_status()
+                    # Parse straight from the raw bytes — no intermediate
+                    # text decode, and orjson builds the objects in one pass
+                    data = _json_loads(await response.read())
 
             if not data.get('success'):
                 error = data.get('error', 'Unknown error')
@@ -152,10 +216,10 @@ class ProductIntelligenceFetcher:
             logger.info(UIConfig.success(f"Fetched {len(products)} products from intelligence API"))
             return products
 
-        except requests.exceptions.Timeout:
-            logger.error("Intelligence API timeout after 120 seconds")
+        except asyncio.TimeoutError:
+            logger.error(f"Intelligence API timeout after {APIConfig.API_TIMEOUT} seconds")
             return []
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             logger.error(f"Intelligence API request failed: {e}")
             return []
         except Exception as e:
@@ -167,6 +231,68 @@ class ProductIntelligenceFetcher:
 # CONTENT GENERATOR
 # ============================================
 
+# One pass over a name/niche finds every tag keyword at once, instead of
+# separate .lower() + substring scans per keyword
+_TAG_KEYWORD_RE = re.compile(r"(?i)\b(smart|wireless|wifi|voice|compatible)\b")
+
+# Default tags never change, so serialize them once at import
+_DEFAULT_TAGS_STR = ", ".join(ProductConfig.DEFAULT_TAGS)
+
+# One C-level pass turns a niche name into its tag slug
+_SLUG_TABLE = str.maketrans({" ": "-", "_": "-"})
+
+# Producer/consumer pipeline tuning: how many payloads a batch POST may
+# carry, and how long the consumer waits for a batch to fill before
+# flushing whatever it has
+_PIPELINE_BATCH_SIZE = 10
+_PIPELINE_MAX_WAIT = 5.0
+
+# Shopify auth headers are fixed for the process lifetime; freeze one
+# shared copy instead of rebuilding a dict per instance
+_SHOPIFY_HEADERS = types.MappingProxyType(get_shopify_headers())
+
+
+def _keyword_hits(text: str) -> set:
+    """Lowercased set of tag keywords found in text (single regex scan)"""
+    return {m.group(1).lower() for m in _TAG_KEYWORD_RE.finditer(text)}
+
+
+# Brand voice / format examples doc, cached server-side alongside the
+# instructions so every per-product call is a short variable suffix on a
+# large cached prefix (cache-augmented generation)
+_BRAND_VOICE_PATH = Path(__file__).parent / "brand_voice.md"
+
+
+@functools.lru_cache(maxsize=1)
+def _brand_context() -> str:
+    """Load the brand voice doc once; empty string if it is missing"""
+    try:
+        return _BRAND_VOICE_PATH.read_text(encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Brand voice doc unavailable: {e}")
+        return ""
+
+
+# Static instruction block shared by every description request. Kept
+# byte-identical between calls so provider-side prompt caching keys match;
+# only the short product/niche/price lines vary per call.
+_DESCRIPTION_SYSTEM_PROMPT = """You are an expert e-commerce copywriter specializing in tech products, writing for the Oubon Shop storefront.
+
+For every product you receive, write a compelling product description.
+
+Requirements:
+1. Start with an emotional hook (1-2 sentences)
+2. List 5-7 key features as bullet points
+3. Include technical specifications section
+4. Add "What's Included" section
+5. End with "Why Choose Oubon Shop" section mentioning fast shipping and quality guarantee
+
+Tone: Professional, enthusiastic, benefit-focused
+Length: 500-800 words
+Format: HTML with <h3>, <ul>, <li>, <p> tags
+Keywords: Include product name naturally 3-4 times"""
+
+
 class ContentGenerator:
     """Generates product titles, descriptions, and meta fields using AI"""
 
@@ -179,17 +305,20 @@ class ContentGenerator:
         # Extract key features from name
         title = product_name.strip()
 
+        # Already over budget: no suffix could survive truncation, so skip
+        # the keyword scans and cut straight away
+        if len(title) > 70:
+            return title[:67] + "..."
+
         # Add key benefit if not already present
-        if "compatible" not in title.lower() and "voice" in niche.lower():
+        title_hits = _keyword_hits(title)
+        niche_hits = _keyword_hits(niche)
+        if "voice" in niche_hits and "compatible" not in title_hits:
             title += " - Voice Control Compatible"
-        elif "smart" in niche.lower() and "smart" not in title.lower():
+        elif "smart" in niche_hits and "smart" not in title_hits:
             title = f"Smart {title}"
 
-        # Limit length
-        if len(title) > 70:
-            title = title[:67] + "..."
-
-        return title
+        return title if len(title) <= 70 else title[:67] + "..."
 
     def generate_product_description(self, product: Dict) -> str:
         """Generate compelling product description using AI"""
@@ -197,49 +326,65 @@ class ContentGenerator:
         niche = product.get('niche', 'tech gadget')
         price = product.get('price', 0)
 
+        # Retries and re-runs reuse prior output instead of re-billing an
+        # LLM call; keyed on the fields that shape the description
+        key = content_cache_key("product_description", product_name, niche, f"{price:.2f}")
+        cached = content_cache_get(key)
+        if cached:
+            logger.info(f"Reused cached description for '{product_name}'")
+            return cached
+
         # Try AI generation first
         if self.claude:
             description = self._generate_with_claude(product_name, niche, price)
             if description:
+                content_cache_put(key, description)
                 return description
 
         if self.openai:
             description = self._generate_with_openai(product_name, niche, price)
             if description:
+                content_cache_put(key, description)
                 return description
 
-        # Fallback to template
+        # Fallback to template (not cached: it is cheap and may improve
+        # once an AI client becomes available)
         return self._generate_fallback_description(product)
 
     def _generate_with_claude(self, product_name: str, niche: str, price: float) -> Optional[str]:
         """Generate description using Claude"""
         try:
-            prompt = f"""Write a compelling product description for an e-commerce store.
-
-Product: {product_name}
-Niche: {niche}
-Price: ${price:.2f}
-
-Requirements:
-1. Start with an emotional hook (1-2 sentences)
-2. List 5-7 key features as bullet points
-3. Include technical specifications section
-4. Add "What's Included" section
-5. End with "Why Choose Oubon Shop" section mentioning fast shipping and quality guarantee
-
-Tone: Professional, enthusiastic, benefit-focused
-Length: 500-800 words
-Format: HTML with <h3>, <ul>, <li>, <p> tags
-Keywords: Include product name naturally 3-4 times"""
+            # Static instructions live in a cached system block so repeat
+            # calls hit Anthropic's prompt cache; only the product lines
+            # vary per request
+            system_blocks = []
+            brand_context = _brand_context()
+            if brand_context:
+                system_blocks.append({
+                    "type": "text",
+                    "text": brand_context,
+                    "cache_control": {"type": "ephemeral"}
+                })
+            system_blocks.append({
+                "type": "text",
+                "text": _DESCRIPTION_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"}
+            })
 
             response = self.claude.messages.create(
                 model=ContentConfig.CLAUDE_MODEL,
                 max_tokens=ContentConfig.CLAUDE_MAX_TOKENS,
-                messages=[{"role": "user", "content": prompt}]
+                system=system_blocks,
+                messages=[{
+                    "role": "user",
+                    "content": f"Product: {product_name}\nNiche: {niche}\nPrice: ${price:.2f}"
+                }]
             )
 
+            usage = getattr(response, 'usage', None)
+            cached = getattr(usage, 'cache_read_input_tokens', 0) if usage else 0
             description = response.content[0].text
-            logger.info("Generated description with Claude")
+            logger.info(f"Generated description with Claude ({cached} cached input tokens)")
             return description
 
         except Exception as e:
@@ -249,24 +394,14 @@ Keywords: Include product name naturally 3-4 times"""
     def _generate_with_openai(self, product_name: str, niche: str, price: float) -> Optional[str]:
         """Generate description using OpenAI"""
         try:
+            # The byte-identical system prompt forms a stable prefix that
+            # OpenAI's automatic prompt caching can key on; the user turn
+            # carries only the variable fields
             response = self.openai.chat.completions.create(
                 model=ContentConfig.OPENAI_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are an expert e-commerce copywriter specializing in tech products."},
-                    {"role": "user", "content": f"""Write a compelling product description for:
-
-Product: {product_name}
-Niche: {niche}
-Price: ${price:.2f}
-
-Include:
-1. Emotional opening hook
-2. 5-7 key features (bullet points)
-3. Technical specs
-4. What's included
-5. Why buy from Oubon Shop
-
-Format as HTML. Length: 500-800 words."""}
+                    {"role": "system", "content": _DESCRIPTION_SYSTEM_PROMPT},
+                    {"role": "user", "content": f"Product: {product_name}\nNiche: {niche}\nPrice: ${price:.2f}"}
                 ],
                 max_tokens=ContentConfig.OPENAI_MAX_TOKENS,
                 temperature=ContentConfig.OPENAI_TEMPERATURE
@@ -330,13 +465,39 @@ class ImageHandler:
     def download_image(self, url: str) -> Optional[bytes]:
         """Download image from URL"""
         try:
-            response = requests.get(url, timeout=ImageConfig.DOWNLOAD_TIMEOUT)
+            response = _SESSION.get(url, timeout=ImageConfig.DOWNLOAD_TIMEOUT)
             response.raise_for_status()
             return response.content
         except Exception as e:
             logger.error(f"Failed to download image {url}: {e}")
             return None
 
+    async def download_all(self, urls: List[str]) -> List[Optional[bytes]]:
+        """Download many images concurrently; None for any that fail.
+
+        Results come back in input order so callers can zip them with the
+        source URLs.
+        """
+        if not urls:
+            return []
+
+        timeout = aiohttp.ClientTimeout(total=ImageConfig.DOWNLOAD_TIMEOUT)
+
+        async def _one(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    return await response.read()
+            except Exception as e:
+                logger.error(f"Failed to download image {url}: {e}")
+                return None
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_one(session, url)) for url in urls]
+
+        return [task.result() for task in tasks]
+
     def prepare_images(self, product: Dict) -> List[str]:
         """Prepare image URLs for Shopify upload"""
         images = []
@@ -350,6 +511,48 @@ class ImageHandler:
         return images[:ImageConfig.MAX_IMAGES_PER_PRODUCT]
 
 
+# ============================================
+# RATE LIMITING
+# ============================================
+
+class TokenBucket:
+    """Paces requests against a leaky bucket like Shopify's.
+
+    Tokens refill at `rate` per second up to `capacity`, so runs can use
+    the full burst budget and only wait once the bucket is drained —
+    unlike a fixed per-call sleep, which pays the delay even when a slow
+    response already consumed the time.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token; return how long to wait before proceeding"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1.0
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocking acquire for synchronous callers"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Non-blocking acquire for tasks sharing the event loop"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
 # ============================================
 # SHOPIFY PRODUCT CREATOR
 # ============================================
@@ -359,40 +562,296 @@ class ShopifyProductCreator:
 
     def __init__(self):
         self.base_url = f"{ShopifyConfig.BASE_URL}/products.json"
-        self.headers = get_shopify_headers()
-        self.rate_limit_delay = 1.0 / ShopifyConfig.REQUESTS_PER_SECOND
-
-    def create_product(self, product_data: Dict, dry_run: bool = False) -> Optional[Dict]:
-        """Create product in Shopify"""
+        self.headers = _SHOPIFY_HEADERS
+        self.bucket = TokenBucket(
+            rate=ShopifyConfig.REQUESTS_PER_SECOND,
+            capacity=ShopifyConfig.BURST_CAPACITY
+        )
+
+    async def create_product(
+        self,
+        session: aiohttp.ClientSession,
+        product_data: Dict,
+        dry_run: bool = False
+    ) -> Optional[Dict]:
+        """Create product in Shopify via a shared async session"""
         if dry_run:
             logger.info(f"[DRY RUN] Would create product: {product_data['product']['title']}")
             return {"product": {"id": "dry-run-id", **product_data['product']}}
 
         try:
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
+            # Rate limiting (non-blocking for sibling tasks)
+            await self.bucket.acquire_async()
 
-            response = requests.post(
+            # orjson emits bytes directly; Content-Type is on the session headers
+            async with session.post(
                 self.base_url,
-                json=product_data,
-                headers=self.headers,
-                timeout=ShopifyConfig.REQUEST_TIMEOUT
-            )
-
-            response.raise_for_status()
-            result = response.json()
+                data=_json_dumps(product_data),
+                timeout=aiohttp.ClientTimeout(total=ShopifyConfig.REQUEST_TIMEOUT)
+            ) as response:
+                if response.status >= 400:
+                    text = await response.text()
+                    logger.error(f"Shopify API error: {response.status} - {text}")
+                    return None
+                result = _json_loads(await response.read())
 
             logger.info(UIConfig.success(f"Created product: {result['product']['title']}"))
             return result
 
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"Shopify API error: {e.response.status_code} - {e.response.text}")
-            return None
         except Exception as e:
             logger.error(f"Failed to create product: {e}")
             return None
 
-    def build_product_data(self, product: Dict, content_gen: ContentGenerator, image_handler: ImageHandler) -> Dict:
+    async def create_products(self, payloads: List[Dict], dry_run: bool = False) -> List[Optional[Dict]]:
+        """Create many products concurrently over one pooled connection.
+
+        A TaskGroup drives the POSTs; the semaphore caps in-flight requests
+        while the token bucket paces them against Shopify's limit.
+        """
+        semaphore = asyncio.Semaphore(min(8, max(1, int(ShopifyConfig.REQUESTS_PER_SECOND) * 4)))
+
+        async def _one(session, payload):
+            async with semaphore:
+                return await self.create_product(session, payload, dry_run=dry_run)
+
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_one(session, payload)) for payload in payloads]
+
+        return [task.result() for task in tasks]
+
+    # GraphQL document executed once per line of the staged JSONL upload
+    _BULK_PRODUCT_CREATE = (
+        "mutation call($input: ProductInput!, $media: [CreateMediaInput!]) { "
+        "productCreate(input: $input, media: $media) { product { id title } userErrors { field message } } }"
+    )
+
+    # Bulk operations complete asynchronously; poll currentBulkOperation
+    # until the result file is ready
+    _BULK_POLL_INTERVAL = 2  # seconds
+    _BULK_POLL_TIMEOUT = 300  # seconds
+
+    @staticmethod
+    def _to_bulk_variables(product: Dict) -> Dict:
+        """Map a REST-shaped product payload onto productCreate variables.
+
+        The REST and GraphQL schemas disagree on names and shapes:
+        body_html -> descriptionHtml, product_type -> productType,
+        comma-joined tags -> list, lowercase status -> enum, the SEO
+        metafield shortcuts -> explicit metafields entries, and images
+        -> CreateMediaInput entries keyed by source URL.
+        """
+        tags = product.get("tags", "")
+        input_data = {
+            "title": product.get("title"),
+            "descriptionHtml": product.get("body_html"),
+            "vendor": product.get("vendor"),
+            "productType": product.get("product_type"),
+            "status": (product.get("status") or "draft").upper(),
+            "tags": [tag.strip() for tag in tags.split(",") if tag.strip()],
+        }
+
+        metafields = []
+        if product.get("metafields_global_title_tag"):
+            metafields.append({
+                "namespace": "global", "key": "title_tag",
+                "type": "single_line_text_field",
+                "value": product["metafields_global_title_tag"],
+            })
+        if product.get("metafields_global_description_tag"):
+            metafields.append({
+                "namespace": "global", "key": "description_tag",
+                "type": "multi_line_text_field",
+                "value": product["metafields_global_description_tag"],
+            })
+        if metafields:
+            input_data["metafields"] = metafields
+
+        variants = []
+        for variant in product.get("variants", []):
+            mapped = {
+                "price": variant.get("price"),
+                "compareAtPrice": variant.get("compare_at_price"),
+                "inventoryPolicy": (variant.get("inventory_policy") or "deny").upper(),
+                "requiresShipping": variant.get("requires_shipping"),
+                "taxable": variant.get("taxable"),
+                "sku": variant.get("sku") or None,
+            }
+            variants.append({k: v for k, v in mapped.items() if v is not None})
+        if variants:
+            input_data["variants"] = variants
+
+        media = [
+            {"originalSource": image["src"], "mediaContentType": "IMAGE"}
+            for image in product.get("images", [])
+            if image.get("src")
+        ]
+
+        variables = {"input": {k: v for k, v in input_data.items() if v is not None}}
+        if media:
+            variables["media"] = media
+        return variables
+
+    async def _poll_bulk_operation(self, session, graphql_url: str) -> Dict:
+        """Wait for the current bulk mutation to finish and return it.
+
+        Raises on FAILED/CANCELED status or timeout so the caller's REST
+        fallback takes over.
+        """
+        poll_query = (
+            "query { currentBulkOperation(type: MUTATION) "
+            "{ id status errorCode objectCount url } }"
+        )
+        deadline = time.monotonic() + self._BULK_POLL_TIMEOUT
+        while True:
+            await asyncio.sleep(self._BULK_POLL_INTERVAL)
+            async with session.post(graphql_url, data=_json_dumps({"query": poll_query})) as response:
+                response.raise_for_status()
+                op = _json_loads(await response.read())["data"]["currentBulkOperation"]
+            if op and op["status"] == "COMPLETED":
+                return op
+            if op and op["status"] in ("FAILED", "CANCELED"):
+                raise RuntimeError(f"bulk operation {op['status']}: {op.get('errorCode')}")
+            if time.monotonic() > deadline:
+                raise RuntimeError("bulk operation timed out")
+
+    async def create_products_bulk(self, payloads: List[Dict], dry_run: bool = False) -> List[Optional[Dict]]:
+        """Create products through ONE GraphQL bulk operation.
+
+        Uploads all product inputs as a staged JSONL file and submits a
+        single bulkOperationRunMutation, so per-request HTTP overhead and
+        rate-limit tokens are amortized over the whole batch, then polls
+        the operation and re-creates any failed lines via REST. Payloads
+        whose images carry base64 attachments stay on the per-product
+        REST path — a staged JSONL line can only reference media by URL.
+        """
+        if len(payloads) <= 1 or dry_run:
+            return await self.create_products(payloads, dry_run=dry_run)
+
+        bulk_indices = [
+            index for index, payload in enumerate(payloads)
+            if not any(image.get("attachment")
+                       for image in payload["product"].get("images", []))
+        ]
+        if len(bulk_indices) <= 1:
+            return await self.create_products(payloads, dry_run=dry_run)
+
+        rest_indices = [i for i in range(len(payloads)) if i not in set(bulk_indices)]
+        bulk_payloads = [payloads[i] for i in bulk_indices]
+
+        graphql_url = f"{ShopifyConfig.BASE_URL}/graphql.json"
+        jsonl = b"\n".join(
+            _json_dumps(self._to_bulk_variables(payload["product"]))
+            for payload in bulk_payloads
+        )
+
+        try:
+            async with aiohttp.ClientSession(headers=self.headers) as session:
+                # 1. Ask Shopify for a staged upload target
+                staged_query = """
+                mutation {
+                  stagedUploadsCreate(input: [{
+                    resource: BULK_MUTATION_VARIABLES,
+                    filename: "products.jsonl",
+                    mimeType: "text/jsonl",
+                    httpMethod: POST
+                  }]) {
+                    stagedTargets { url resourceUrl parameters { name value } }
+                    userErrors { field message }
+                  }
+                }"""
+                async with session.post(graphql_url, data=_json_dumps({"query": staged_query})) as response:
+                    response.raise_for_status()
+                    staged = _json_loads(await response.read())
+
+                targets = staged["data"]["stagedUploadsCreate"]["stagedTargets"]
+                if not targets:
+                    raise RuntimeError(staged["data"]["stagedUploadsCreate"]["userErrors"])
+                target = targets[0]
+
+                # 2. Upload the JSONL to the staged target
+                form = aiohttp.FormData()
+                key = None
+                for param in target["parameters"]:
+                    form.add_field(param["name"], param["value"])
+                    if param["name"] == "key":
+                        key = param["value"]
+                form.add_field("file", jsonl, filename="products.jsonl", content_type="text/jsonl")
+                async with aiohttp.ClientSession() as upload_session:
+                    async with upload_session.post(target["url"], data=form) as response:
+                        response.raise_for_status()
+
+                # 3. Kick off the bulk mutation over the uploaded file
+                run_query = """
+                mutation($mutation: String!, $stagedUploadPath: String!) {
+                  bulkOperationRunMutation(mutation: $mutation, stagedUploadPath: $stagedUploadPath) {
+                    bulkOperation { id status }
+                    userErrors { field message }
+                  }
+                }"""
+                async with session.post(graphql_url, data=_json_dumps({
+                    "query": run_query,
+                    "variables": {
+                        "mutation": self._BULK_PRODUCT_CREATE,
+                        "stagedUploadPath": key
+                    }
+                })) as response:
+                    response.raise_for_status()
+                    result = _json_loads(await response.read())
+
+                run = result["data"]["bulkOperationRunMutation"]
+                if run["userErrors"]:
+                    raise RuntimeError(run["userErrors"])
+
+                op = run["bulkOperation"]
+                logger.info(UIConfig.info(
+                    f"Submitted bulk creation of {len(bulk_payloads)} products (operation {op['id']}, {op['status']})"
+                ))
+
+                # 4. Wait for completion and read per-line results —
+                #    userErrors only surface in the result file
+                op = await self._poll_bulk_operation(session, graphql_url)
+                if not op.get("url"):
+                    raise RuntimeError("bulk operation completed without a result file")
+                async with aiohttp.ClientSession() as result_session:
+                    async with result_session.get(op["url"]) as response:
+                        response.raise_for_status()
+                        lines = (await response.read()).splitlines()
+
+        except Exception as e:
+            logger.warning(f"Bulk product creation failed ({e}); falling back to per-product REST")
+            return await self.create_products(payloads, dry_run=dry_run)
+
+        # Result lines come back in submission order; anything without a
+        # created product gets retried through the REST path
+        results: List[Optional[Dict]] = [None] * len(payloads)
+        failed_indices = []
+        for position, index in enumerate(bulk_indices):
+            record = _json_loads(lines[position]) if position < len(lines) else {}
+            created = (record.get("data") or record).get("productCreate") or {}
+            if created.get("product") and not created.get("userErrors"):
+                results[index] = {"product": created["product"], "bulk_operation": op}
+            else:
+                failed_indices.append(index)
+                if created.get("userErrors"):
+                    logger.warning(
+                        f"Bulk line {position} rejected: {created['userErrors']}"
+                    )
+
+        retry_indices = rest_indices + failed_indices
+        if retry_indices:
+            if failed_indices:
+                logger.warning(
+                    f"{len(failed_indices)} bulk lines failed; retrying via per-product REST"
+                )
+            retried = await self.create_products(
+                [payloads[i] for i in retry_indices], dry_run=dry_run
+            )
+            for index, result in zip(retry_indices, retried):
+                results[index] = result
+        return results
+
+    async def build_product_data(self, product: Dict, content_gen: ContentGenerator, image_handler: ImageHandler) -> Dict:
         """Build Shopify product data structure"""
 
         # Extract data from intelligence product
@@ -409,18 +868,34 @@ class ShopifyProductCreator:
         description = content_gen.generate_product_description(product)
         meta_fields = content_gen.generate_meta_fields(product_name, niche)
 
-        # Prepare images
+        # Prepare images: download them ourselves (concurrently) and attach
+        # the bytes, so Shopify doesn't block product creation on a
+        # synchronous fetch from the AliExpress CDN. A failed download falls
+        # back to the src URL for that image.
         image_urls = image_handler.prepare_images(product)
+        image_bytes = await image_handler.download_all(image_urls)
+
+        images = []
+        for url, content in zip(image_urls, image_bytes):
+            if content:
+                filename = Path(urlparse(url).path).name or "product.jpg"
+                images.append({
+                    "attachment": base64.b64encode(content).decode(),
+                    "filename": filename
+                })
+            else:
+                images.append({"src": url})
 
-        # Build tags
-        tags = ProductConfig.DEFAULT_TAGS.copy()
-        tags.append(niche.replace(' ', '-'))
+        # Build tags (defaults are constant, so only join the per-product extras)
+        extra_tags = [niche.translate(_SLUG_TABLE).lower()]
         if product.get('rating', 0) >= 4.5:
-            tags.append('top-rated')
-        if 'smart' in product_name.lower():
-            tags.append('smart-home')
-        if 'wireless' in product_name.lower() or 'wifi' in product_name.lower():
-            tags.append('wireless')
+            extra_tags.append('top-rated')
+        name_hits = _keyword_hits(product_name)
+        if 'smart' in name_hits:
+            extra_tags.append('smart-home')
+        if 'wireless' in name_hits or 'wifi' in name_hits:
+            extra_tags.append('wireless')
+        tags_str = _DEFAULT_TAGS_STR + ", " + ", ".join(extra_tags)
 
         # Build product data
         product_data = {
@@ -429,7 +904,7 @@ class ShopifyProductCreator:
                 "body_html": description,
                 "vendor": ProductConfig.DEFAULT_VENDOR,
                 "product_type": ProductConfig.DEFAULT_PRODUCT_TYPE,
-                "tags": ", ".join(tags),
+                "tags": tags_str,
                 "status": ProductConfig.DEFAULT_STATUS,
                 "variants": [
                     {
@@ -442,7 +917,7 @@ class ShopifyProductCreator:
                         "sku": product.get('supplier_sku', '')
                     }
                 ],
-                "images": [{"src": url} for url in image_urls] if image_urls else [],
+                "images": images,
                 "metafields_global_title_tag": meta_fields['meta_title'],
                 "metafields_global_description_tag": meta_fields['meta_description']
             }
@@ -455,7 +930,7 @@ class ShopifyProductCreator:
 # MAIN SETUP SCRIPT
 # ============================================
 
-def setup_products(
+async def setup_products(
     count: int = 20,
     niches: List[str] = None,
     dry_run: bool = False,
@@ -490,7 +965,7 @@ def setup_products(
     print(UIConfig.info(f"Fetching products from {len(niches)} niches..."))
 
     # Fetch products from intelligence engine
-    products = fetcher.fetch_products(niches, max_per_niche)
+    products = await fetcher.fetch_products(niches, max_per_niche)
 
     if not products:
         print(UIConfig.error("No products fetched. Cannot continue."))
@@ -501,27 +976,65 @@ def setup_products(
 
     print(UIConfig.success(f"Processing {len(products)} products...\n"))
 
-    # Create products
+    # Producer/consumer pipeline: payload building (LLM + image work) and
+    # Shopify POSTs overlap instead of running as two serial passes
     successful = 0
     failed = 0
-
-    iterator = tqdm(products, desc="Creating products") if HAS_TQDM else products
-
-    for product in iterator:
-        try:
-            # Build product data
-            product_data = shopify.build_product_data(product, content_gen, image_handler)
-
-            # Create in Shopify
-            result = shopify.create_product(product_data, dry_run=dry_run)
-
-            if result:
-                successful += 1
-            else:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+    results: List[Optional[Dict]] = []
+
+    async def _produce():
+        nonlocal failed
+        # Throttle refreshes and disable the bar entirely when output is
+        # piped (CI/daemon runs), where every redraw is a wasted write
+        progress = tqdm(
+            products,
+            desc="Building products",
+            mininterval=2.0,
+            miniters=max(1, len(products) // 20),
+            disable=not sys.stdout.isatty()
+        )
+        for product in progress:
+            try:
+                payload = await shopify.build_product_data(product, content_gen, image_handler)
+            except Exception as e:
+                logger.error(f"Error processing product {product.get('name')}: {e}")
                 failed += 1
-
-        except Exception as e:
-            logger.error(f"Error processing product {product.get('name')}: {e}")
+                continue
+            await queue.put(payload)
+        await queue.put(None)  # end-of-stream sentinel
+
+    async def _consume():
+        loop = asyncio.get_running_loop()
+        done = False
+        while not done:
+            # Fill a batch, but never hold completed payloads longer than
+            # the max-wait cutoff — flush whatever arrived in time
+            batch = []
+            deadline = loop.time() + _PIPELINE_MAX_WAIT
+            while len(batch) < _PIPELINE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+            if batch:
+                results.extend(await shopify.create_products_bulk(batch, dry_run=dry_run))
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(_produce())
+        tg.create_task(_consume())
+
+    for result in results:
+        if result:
+            successful += 1
+        else:
             failed += 1
 
     # Summary
@@ -578,12 +1091,12 @@ def main():
     niches = [n.strip() for n in args.niches.split(',') if n.strip()] if args.niches else None
 
     # Run setup
-    success = setup_products(
+    success = asyncio.run(setup_products(
         count=args.count,
         niches=niches,
         dry_run=args.dry_run,
         max_per_niche=args.max_per_niche
-    )
+    ))
 
     sys.exit(0 if success else 1)
 
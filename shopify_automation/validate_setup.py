@@ -16,10 +16,26 @@ Usage:
     python validate_setup.py
 """
 
+import itertools
+import json
 import os
 import sys
+import threading
 import requests
+
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import types
 from typing import Dict, List, Tuple
 from pathlib import Path
 
@@ -35,6 +51,25 @@ from shopify_automation.config import (
 )
 
 
+# Shared session: all validation probes hit the same Shopify host, so
+# keep-alive pooling saves a TLS handshake per check
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"]
+    )
+))
+
+# Shopify auth headers are fixed for the process lifetime; freeze one
+# shared copy instead of rebuilding a dict per instance
+_SHOPIFY_HEADERS = types.MappingProxyType(get_shopify_headers())
+
+
 # ============================================
 # LOGGING SETUP
 # ============================================
@@ -44,7 +79,7 @@ logging.basicConfig(
     format=LogConfig.LOG_FORMAT,
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler(LogConfig.VALIDATE_SETUP_LOG)
+        logging.FileHandler(LogConfig.VALIDATE_SETUP_LOG, delay=True)
     ]
 )
 
@@ -60,10 +95,17 @@ class ShopifyValidator:
 
     def __init__(self):
         self.base_url = ShopifyConfig.BASE_URL
-        self.headers = get_shopify_headers()
+        self.headers = _SHOPIFY_HEADERS
         self.errors = []
         self.warnings = []
         self.successes = []
+        # check_* methods run on worker threads; guard the result lists
+        self._lock = threading.Lock()
+
+    def _record(self, bucket: list, message: str):
+        """Thread-safe append to one of the result lists"""
+        with self._lock:
+            bucket.append(message)
 
     def validate_all(self) -> bool:
         """Run all validation checks"""
@@ -71,10 +113,13 @@ class ShopifyValidator:
         print("🔍 SHOPIFY STORE VALIDATION")
         print("="*60 + "\n")
 
-        # Run checks
-        self.check_api_connection()
-        self.check_products()
-        self.check_collections()
+        # The network probes are independent: fire them concurrently so
+        # wall time is max(RTT) instead of sum(RTT)
+        checks = [self.check_api_connection, self.check_products, self.check_collections]
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            for future in [executor.submit(check) for check in checks]:
+                future.result()
+
         self.check_manual_tasks()
 
         # Print results
@@ -87,30 +132,30 @@ class ShopifyValidator:
         print(UIConfig.info("Checking Shopify API connection..."))
 
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 f"{self.base_url}/shop.json",
                 headers=self.headers,
                 timeout=10
             )
 
             response.raise_for_status()
-            shop_data = response.json()
+            shop_data = _json_loads(response.content)
 
             shop_name = shop_data['shop']['name']
             shop_domain = shop_data['shop']['domain']
 
-            self.successes.append(f"Connected to Shopify: {shop_name} ({shop_domain})")
+            self._record(self.successes, f"Connected to Shopify: {shop_name} ({shop_domain})")
             print(UIConfig.success(f"✓ Connected to {shop_name}"))
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
-                self.errors.append("Shopify API authentication failed. Check your SHOPIFY_ADMIN_ACCESS_TOKEN.")
+                self._record(self.errors, "Shopify API authentication failed. Check your SHOPIFY_ADMIN_ACCESS_TOKEN.")
             else:
-                self.errors.append(f"Shopify API error: {e.response.status_code}")
+                self._record(self.errors, f"Shopify API error: {e.response.status_code}")
             print(UIConfig.error("✗ API connection failed"))
 
         except Exception as e:
-            self.errors.append(f"Failed to connect to Shopify: {str(e)}")
+            self._record(self.errors, f"Failed to connect to Shopify: {str(e)}")
             print(UIConfig.error("✗ Connection error"))
 
     def check_products(self):
@@ -118,76 +163,77 @@ class ShopifyValidator:
         print(UIConfig.info("Checking products..."))
 
         try:
-            response = requests.get(
+            response = _SESSION.get(
                 f"{self.base_url}/products/count.json",
                 headers=self.headers,
                 timeout=10
             )
 
             response.raise_for_status()
-            count = response.json()['count']
+            count = _json_loads(response.content)['count']
 
             if count >= ValidationConfig.MIN_PRODUCTS_REQUIRED:
-                self.successes.append(f"Products: {count} products created")
+                self._record(self.successes, f"Products: {count} products created")
                 print(UIConfig.success(f"✓ {count} products found"))
             elif count > 0:
-                self.warnings.append(f"Only {count} products. Recommended: {ValidationConfig.MIN_PRODUCTS_REQUIRED}+")
+                self._record(self.warnings, f"Only {count} products. Recommended: {ValidationConfig.MIN_PRODUCTS_REQUIRED}+")
                 print(UIConfig.warning(f"⚠  Only {count} products (recommended: {ValidationConfig.MIN_PRODUCTS_REQUIRED}+)"))
             else:
-                self.errors.append("No products found. Run setup_products.py first.")
+                self._record(self.errors, "No products found. Run setup_products.py first.")
                 print(UIConfig.error("✗ No products found"))
                 return
 
-            # Check product details
-            response = requests.get(
-                f"{self.base_url}/products.json?limit=10",
+            # Check product details — only the fields the quality check
+            # reads, and the max page size so one request covers the store
+            response = _SESSION.get(
+                f"{self.base_url}/products.json?limit=250&fields=id,title,images,body_html,variants",
                 headers=self.headers,
                 timeout=10
             )
 
             response.raise_for_status()
-            products = response.json()['products']
+            products = _json_loads(response.content)['products']
 
             # Validate product quality
             issues = self._validate_product_quality(products)
 
             if not issues:
-                self.successes.append("All products have images and descriptions")
+                self._record(self.successes, "All products have images and descriptions")
                 print(UIConfig.success("✓ Products are properly configured"))
             else:
                 for issue in issues:
-                    self.warnings.append(issue)
+                    self._record(self.warnings, issue)
                     print(UIConfig.warning(f"⚠  {issue}"))
 
         except Exception as e:
-            self.errors.append(f"Failed to check products: {str(e)}")
+            self._record(self.errors, f"Failed to check products: {str(e)}")
             print(UIConfig.error("✗ Product check failed"))
 
-    def _validate_product_quality(self, products: List[Dict]) -> List[str]:
-        """Validate individual product quality"""
-        issues = []
-
+    @staticmethod
+    def _iter_issues(products: List[Dict]):
+        """Yield quality issues lazily so callers can stop early"""
         for product in products:
             product_title = product['title']
 
             # Check for images
             if ValidationConfig.REQUIRE_PRODUCT_IMAGES:
                 if not product.get('images'):
-                    issues.append(f"Product '{product_title}' has no images")
+                    yield f"Product '{product_title}' has no images"
 
             # Check for description
             if ValidationConfig.REQUIRE_PRODUCT_DESCRIPTIONS:
                 if not product.get('body_html') or len(product['body_html']) < 100:
-                    issues.append(f"Product '{product_title}' has no/short description")
+                    yield f"Product '{product_title}' has no/short description"
 
             # Check for pricing
             if ValidationConfig.REQUIRE_PRODUCT_PRICES:
                 variants = product.get('variants', [])
                 if not variants or not variants[0].get('price'):
-                    issues.append(f"Product '{product_title}' has no price set")
+                    yield f"Product '{product_title}' has no price set"
 
-        # Limit to first 5 issues
-        return issues[:5]
+    def _validate_product_quality(self, products: List[Dict]) -> List[str]:
+        """Validate individual product quality (first 5 issues only)"""
+        return list(itertools.islice(self._iter_issues(products), 5))
 
     def check_collections(self):
         """Validate collections setup"""
@@ -195,39 +241,39 @@ class ShopifyValidator:
 
         try:
             # Check smart collections
-            response = requests.get(
+            response = _SESSION.get(
                 f"{self.base_url}/smart_collections/count.json",
                 headers=self.headers,
                 timeout=10
             )
 
             response.raise_for_status()
-            smart_count = response.json()['count']
+            smart_count = _json_loads(response.content)['count']
 
             # Check custom collections
-            response = requests.get(
+            response = _SESSION.get(
                 f"{self.base_url}/custom_collections/count.json",
                 headers=self.headers,
                 timeout=10
             )
 
             response.raise_for_status()
-            custom_count = response.json()['count']
+            custom_count = _json_loads(response.content)['count']
 
             total_collections = smart_count + custom_count
 
             if total_collections >= ValidationConfig.MIN_COLLECTIONS_REQUIRED:
-                self.successes.append(f"Collections: {total_collections} collections created ({smart_count} smart, {custom_count} custom)")
+                self._record(self.successes, f"Collections: {total_collections} collections created ({smart_count} smart, {custom_count} custom)")
                 print(UIConfig.success(f"✓ {total_collections} collections found"))
             elif total_collections > 0:
-                self.warnings.append(f"Only {total_collections} collections. Recommended: {ValidationConfig.MIN_COLLECTIONS_REQUIRED}+")
+                self._record(self.warnings, f"Only {total_collections} collections. Recommended: {ValidationConfig.MIN_COLLECTIONS_REQUIRED}+")
                 print(UIConfig.warning(f"⚠  Only {total_collections} collections (recommended: {ValidationConfig.MIN_COLLECTIONS_REQUIRED}+)"))
             else:
-                self.errors.append("No collections found. Run create_collections.py first.")
+                self._record(self.errors, "No collections found. Run create_collections.py first.")
                 print(UIConfig.error("✗ No collections found"))
 
         except Exception as e:
-            self.errors.append(f"Failed to check collections: {str(e)}")
+            self._record(self.errors, f"Failed to check collections: {str(e)}")
             print(UIConfig.error("✗ Collection check failed"))
 
     def check_manual_tasks(self):
@@ -235,7 +281,7 @@ class ShopifyValidator:
         print(UIConfig.info("Checking manual tasks..."))
 
         for task in ValidationConfig.MANUAL_TASKS:
-            self.warnings.append(f"Manual task: {task}")
+            self._record(self.warnings, f"Manual task: {task}")
 
         print(UIConfig.warning(f"⚠  {len(ValidationConfig.MANUAL_TASKS)} manual tasks remaining"))
 
@@ -4,7 +4,8 @@ Configures Dawn theme with Oubon Shop branding and optimized settings
 """
 
 import os
-import json
+import asyncio
+import functools
 import logging
 from typing import Dict, Optional, List, TYPE_CHECKING
 from pathlib import Path
@@ -12,9 +13,106 @@ from pathlib import Path
 if TYPE_CHECKING:
     import shopify
 
+# settings_data.json and template JSON assets run tens to hundreds of KB;
+# orjson parses and pretty-prints them several times faster than stdlib json
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> str:
+        # Compact on purpose: Shopify consumes the JSON server-side, and
+        # indentation only inflates the upload payload
+        return orjson.dumps(obj).decode()
+
+    def _dumps_compact(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    # stdlib json only gets imported on the fallback path
+    import json
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+    def _dumps_compact(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
 
+def _guarded(name):
+    """Wrap a configure step: log failures and return a uniform error dict"""
+    def deco(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{name} error: {e}")
+                return {'success': False, 'error': str(e)}
+        return wrapper
+    return deco
+
+
+async def _afind_asset(key: str, theme_id: int):
+    """Fetch a theme asset off-loop (ShopifyAPI is blocking)"""
+    return await asyncio.to_thread(shopify.Asset.find, key, theme_id=theme_id)
+
+
+class ThemeAssetBulkWriter:
+    """Batches theme asset writes into one bulk request per flush.
+
+    Each asset.save() is its own PUT against /themes/{id}/assets.json;
+    the bulk endpoint carries all pending writes in a single round-trip.
+    Batches are capped by asset count and payload size, mirroring the
+    limits on Shopify's bulk endpoint.
+    """
+
+    MAX_ASSETS = 20
+    MAX_BYTES = 10 * 1024 * 1024
+
+    def __init__(self, shop_url: str, access_token: str, theme_id: int,
+                 api_version: str = '2024-01'):
+        host = shop_url.replace('https://', '').rstrip('/')
+        self.url = f"https://{host}/admin/api/{api_version}/themes/{theme_id}/assets/bulk.json"
+        self.headers = {
+            'X-Shopify-Access-Token': access_token,
+            'Content-Type': 'application/json'
+        }
+        self._pending: List[Dict] = []
+        self._pending_bytes = 0
+        self._lock = asyncio.Lock()
+
+    async def enqueue(self, key: str, value: str):
+        """Queue one asset write; auto-flushes when a cap is hit"""
+        async with self._lock:
+            self._pending.append({'key': key, 'value': value})
+            self._pending_bytes += len(value)
+            if len(self._pending) >= self.MAX_ASSETS or self._pending_bytes >= self.MAX_BYTES:
+                await self._flush_locked()
+
+    async def flush(self):
+        """Send any pending asset writes"""
+        async with self._lock:
+            await self._flush_locked()
+
+    async def _flush_locked(self):
+        if not self._pending:
+            return
+        batch, self._pending, self._pending_bytes = self._pending, [], 0
+
+        import aiohttp
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout) as session:
+            async with session.put(self.url, data=_dumps_compact({'assets': batch})) as response:
+                response.raise_for_status()
+        logger.info(f"✅ Bulk-saved {len(batch)} theme assets")
+
+
 class DawnThemeConfigurator:
     """
     Automatically configure Shopify Dawn theme with best practices
@@ -28,6 +126,11 @@ class DawnThemeConfigurator:
     - Performance improvements
     """
 
+    # Fixed attribute set: no per-instance __dict__, faster attribute reads
+    __slots__ = ('shop_url', 'access_token', 'brand_config',
+                 '_theme_settings_patch', '_homepage_sections',
+                 '_homepage_order', '_bulk')
+
     def __init__(self, shop_url: str = None, access_token: str = None):
         self.shop_url = shop_url or os.getenv('SHOPIFY_SHOP_URL')
         self.access_token = access_token or os.getenv('SHOPIFY_ACCESS_TOKEN')
@@ -38,6 +141,9 @@ class DawnThemeConfigurator:
         # Initialize Shopify API
         self._init_shopify()
 
+        # Created per-run once the theme id is known
+        self._bulk: Optional[ThemeAssetBulkWriter] = None
+
         # Brand settings for Oubon Shop
         self.brand_config = {
             'colors': {
@@ -63,8 +169,158 @@ class DawnThemeConfigurator:
             }
         }
 
+        # brand_config is static per instance, so flatten it into the
+        # theme-settings patch once; the hot path is then a single
+        # dict.update against a prebuilt dict
+        self._theme_settings_patch = {
+            # Colors
+            'colors_accent_1': self.brand_config['colors']['primary'],
+            'colors_accent_2': self.brand_config['colors']['secondary'],
+            'colors_text': self.brand_config['colors']['text'],
+            'colors_background_1': self.brand_config['colors']['background'],
+            'colors_outline_button_labels': self.brand_config['colors']['primary'],
+            'colors_button_labels': '#ffffff',
+
+            # Typography
+            'type_header_font': self.brand_config['typography']['heading_font'],
+            'type_body_font': self.brand_config['typography']['body_font'],
+            'body_scale': '100',
+            'heading_scale': '125',
+
+            # Layout
+            'page_width': '1400',
+            'spacing_sections': '60',
+            'spacing_grid_horizontal': '20',
+            'spacing_grid_vertical': '20',
+
+            # Buttons
+            'buttons_border_thickness': '1',
+            'buttons_border_radius': '8',
+            'buttons_shadow': True,
+
+            # Product cards
+            'card_style': 'standard',
+            'card_border_thickness': '0',
+            'card_border_radius': '12',
+            'card_shadow': True,
+            'card_image_padding': '0',
+
+            # Animations
+            'animations_reveal_on_scroll': True,
+            'animations_hover_elements': True
+        }
+
+        # Homepage layout is equally static; built once here
+        self._homepage_sections = self._build_homepage_sections()
+        self._homepage_order = [
+            'hero',
+            'trust_badges',
+            'featured_products',
+            'category_grid',
+            'support_cta'
+        ]
+
+    @staticmethod
+    def _build_homepage_sections() -> Dict:
+        """Static homepage section layout (hero, trust badges, featured, CTA).
+
+        Kept as plain dicts (not typed structs): orjson already walks and
+        emits them at C speed, and the idempotence checks rely on direct
+        dict equality against the template loaded from Shopify.
+        """
+        return {
+            'hero': {
+                'type': 'image-banner',
+                'settings': {
+                    'image_height': 'large',
+                    'desktop_content_position': 'middle-center',
+                    'show_text_box': True,
+                    'desktop_content_alignment': 'center',
+                    'heading': 'Welcome to Oubon Shop',
+                    'heading_size': 'h0',
+                    'text': 'Discover trending products at unbeatable prices',
+                    'button_label_1': 'Shop Now',
+                    'button_link_1': '/collections/all'
+                }
+            },
+            'trust_badges': {
+                'type': 'multicolumn',
+                'settings': {
+                    'title': '',
+                    'columns_desktop': 4,
+                    'column_alignment': 'center',
+                    'background_style': 'none',
+                    'image_width': 'small'
+                },
+                'blocks': {
+                    'shipping': {
+                        'type': 'column',
+                        'settings': {
+                            'title': 'Free Shipping',
+                            'text': 'On orders over $50'
+                        }
+                    },
+                    'returns': {
+                        'type': 'column',
+                        'settings': {
+                            'title': '30-Day Returns',
+                            'text': 'Hassle-free returns'
+                        }
+                    },
+                    'support': {
+                        'type': 'column',
+                        'settings': {
+                            'title': '24/7 Support',
+                            'text': 'Always here to help'
+                        }
+                    },
+                    'secure': {
+                        'type': 'column',
+                        'settings': {
+                            'title': 'Secure Checkout',
+                            'text': 'SSL encrypted payments'
+                        }
+                    }
+                }
+            },
+            'featured_products': {
+                'type': 'featured-collection',
+                'settings': {
+                    'title': 'Trending Products',
+                    'heading_size': 'h1',
+                    'collection': 'trending',
+                    'products_to_show': 8,
+                    'columns_desktop': 4,
+                    'show_view_all': True,
+                    'image_ratio': 'square',
+                    'show_secondary_image': True,
+                    'show_vendor': False,
+                    'show_rating': True
+                }
+            },
+            'category_grid': {
+                'type': 'multicolumn',
+                'settings': {
+                    'title': 'Shop by Category',
+                    'columns_desktop': 3,
+                    'column_alignment': 'left',
+                    'image_width': 'full'
+                }
+            },
+            'support_cta': {
+                'type': 'newsletter',
+                'settings': {
+                    'heading': 'Stay Updated',
+                    'text': 'Get exclusive deals and product launches',
+                    'button_label': 'Subscribe'
+                }
+            }
+        }
+
     def _init_shopify(self):
         """Initialize Shopify API session"""
+        # Bind the module globally so the configure steps can use it
+        global shopify
         try:
             import shopify
         except ImportError:
@@ -95,55 +351,44 @@ class DawnThemeConfigurator:
         }
 
         try:
-            # Step 1: Get theme
+            # Step 1: Get theme (Theme.find blocks, so run it off-loop)
             if not theme_id:
-                theme = self._get_main_theme()
+                theme = await asyncio.to_thread(self._get_main_theme)
                 theme_id = theme.id
                 results['theme_id'] = theme_id
             else:
-                theme = shopify.Theme.find(theme_id)
+                theme = await asyncio.to_thread(shopify.Theme.find, theme_id)
 
             logger.info(f"📝 Configuring theme: {theme.name} (ID: {theme_id})")
 
-            # Step 2: Configure theme settings
-            settings_result = await self._configure_theme_settings(theme_id)
-            if settings_result['success']:
-                results['steps_completed'].append('theme_settings')
-            else:
-                results['errors'].append(settings_result.get('error'))
-
-            # Step 3: Set up homepage sections
-            homepage_result = await self._configure_homepage(theme_id)
-            if homepage_result['success']:
-                results['steps_completed'].append('homepage')
-            else:
-                results['errors'].append(homepage_result.get('error'))
-
-            # Step 4: Configure product page
-            product_result = await self._configure_product_page(theme_id)
-            if product_result['success']:
-                results['steps_completed'].append('product_page')
-            else:
-                results['errors'].append(product_result.get('error'))
-
-            # Step 5: Set up collection pages
-            collection_result = await self._configure_collections(theme_id)
-            if collection_result['success']:
-                results['steps_completed'].append('collections')
-            else:
-                results['errors'].append(collection_result.get('error'))
-
-            # Step 6: Configure navigation
-            nav_result = await self._configure_navigation()
-            if nav_result['success']:
-                results['steps_completed'].append('navigation')
-            else:
-                results['errors'].append(nav_result.get('error'))
-
-            # Step 7: Optimize for SEO and performance
-            seo_result = await self._optimize_seo(theme_id)
-            if seo_result['success']:
-                results['steps_completed'].append('seo')
+            # Asset writes from the steps below are collected and sent as
+            # one bulk request instead of one PUT per asset
+            self._bulk = ThemeAssetBulkWriter(self.shop_url, self.access_token, theme_id)
+
+            # Steps 2-7 each touch a different theme asset and don't
+            # depend on each other, so run them as one concurrent batch
+            # instead of six serial round-trips
+            steps = [
+                ('theme_settings', self._configure_theme_settings(theme_id)),
+                ('homepage', self._configure_homepage(theme_id)),
+                ('product_page', self._configure_product_page(theme_id)),
+                ('collections', self._configure_collections(theme_id)),
+                ('navigation', self._configure_navigation()),
+                ('seo', self._optimize_seo(theme_id)),
+            ]
+            step_results = await asyncio.gather(
+                *(coro for _, coro in steps),
+                return_exceptions=True
+            )
+            await self._bulk.flush()
+
+            for (name, _), step_result in zip(steps, step_results):
+                if isinstance(step_result, BaseException):
+                    results['errors'].append(f"{name}: {step_result}")
+                elif step_result['success']:
+                    results['steps_completed'].append(name)
+                else:
+                    results['errors'].append(step_result.get('error'))
 
             results['success'] = len(results['steps_completed']) >= 4
             logger.info(f"✅ Theme configuration complete: {len(results['steps_completed'])} steps")
@@ -164,318 +409,185 @@ class DawnThemeConfigurator:
 
         return main_theme
 
+    @_guarded('Settings configuration')
     async def _configure_theme_settings(self, theme_id: int) -> Dict:
         """Configure global theme settings (colors, fonts, etc.)"""
         logger.info("🎨 Configuring theme settings...")
 
-        try:
-            # Get current settings
-            asset = shopify.Asset.find('config/settings_data.json', theme_id=theme_id)
-            settings = json.loads(asset.value)
-
-            # Update with brand colors
-            if 'current' not in settings:
-                settings['current'] = {}
-
-            settings['current'].update({
-                # Colors
-                'colors_accent_1': self.brand_config['colors']['primary'],
-                'colors_accent_2': self.brand_config['colors']['secondary'],
-                'colors_text': self.brand_config['colors']['text'],
-                'colors_background_1': self.brand_config['colors']['background'],
-                'colors_outline_button_labels': self.brand_config['colors']['primary'],
-                'colors_button_labels': '#ffffff',
-
-                # Typography
-                'type_header_font': self.brand_config['typography']['heading_font'],
-                'type_body_font': self.brand_config['typography']['body_font'],
-                'body_scale': '100',
-                'heading_scale': '125',
-
-                # Layout
-                'page_width': '1400',
-                'spacing_sections': '60',
-                'spacing_grid_horizontal': '20',
-                'spacing_grid_vertical': '20',
-
-                # Buttons
-                'buttons_border_thickness': '1',
-                'buttons_border_radius': '8',
-                'buttons_shadow': True,
-
-                # Product cards
-                'card_style': 'standard',
-                'card_border_thickness': '0',
-                'card_border_radius': '12',
-                'card_shadow': True,
-                'card_image_padding': '0',
-
-                # Animations
-                'animations_reveal_on_scroll': True,
-                'animations_hover_elements': True
-            })
-
-            # Save settings
-            asset.value = json.dumps(settings, indent=2)
-            asset.save()
-
-            logger.info("✅ Theme settings configured")
-            return {'success': True}
+        # Get current settings
+        asset = await _afind_asset('config/settings_data.json', theme_id)
+        settings = _loads(asset.value)
 
-        except Exception as e:
-            logger.error(f"Settings configuration error: {e}")
-            return {'success': False, 'error': str(e)}
+        current = settings.setdefault('current', {})
 
-    async def _configure_homepage(self, theme_id: int) -> Dict:
-        """Set up optimized homepage sections"""
-        logger.info("🏠 Configuring homepage...")
+        # Re-runs are idempotent: when every patch key already matches,
+        # skip the write (the API round-trip is the expensive part)
+        if all(current.get(k) == v for k, v in self._theme_settings_patch.items()):
+            logger.info("✅ Theme settings already up to date")
+            return {'success': True, 'skipped': True}
 
-        try:
-            # Get index.json template
-            asset = shopify.Asset.find('templates/index.json', theme_id=theme_id)
-            template = json.loads(asset.value)
-
-            # Configure sections in order
-            template['sections'] = {
-                'hero': {
-                    'type': 'image-banner',
-                    'settings': {
-                        'image_height': 'large',
-                        'desktop_content_position': 'middle-center',
-                        'show_text_box': True,
-                        'desktop_content_alignment': 'center',
-                        'heading': 'Welcome to Oubon Shop',
-                        'heading_size': 'h0',
-                        'text': 'Discover trending products at unbeatable prices',
-                        'button_label_1': 'Shop Now',
-                        'button_link_1': '/collections/all'
-                    }
-                },
-                'trust_badges': {
-                    'type': 'multicolumn',
-                    'settings': {
-                        'title': '',
-                        'columns_desktop': 4,
-                        'column_alignment': 'center',
-                        'background_style': 'none',
-                        'image_width': 'small'
-                    },
-                    'blocks': {
-                        'shipping': {
-                            'type': 'column',
-                            'settings': {
-                                'title': 'Free Shipping',
-                                'text': 'On orders over $50'
-                            }
-                        },
-                        'returns': {
-                            'type': 'column',
-                            'settings': {
-                                'title': '30-Day Returns',
-                                'text': 'Hassle-free returns'
-                            }
-                        },
-                        'support': {
-                            'type': 'column',
-                            'settings': {
-                                'title': '24/7 Support',
-                                'text': 'Always here to help'
-                            }
-                        },
-                        'secure': {
-                            'type': 'column',
-                            'settings': {
-                                'title': 'Secure Checkout',
-                                'text': 'SSL encrypted payments'
-                            }
-                        }
-                    }
-                },
-                'featured_products': {
-                    'type': 'featured-collection',
-                    'settings': {
-                        'title': 'Trending Products',
-                        'heading_size': 'h1',
-                        'collection': 'trending',
-                        'products_to_show': 8,
-                        'columns_desktop': 4,
-                        'show_view_all': True,
-                        'image_ratio': 'square',
-                        'show_secondary_image': True,
-                        'show_vendor': False,
-                        'show_rating': True
-                    }
-                },
-                'category_grid': {
-                    'type': 'multicolumn',
-                    'settings': {
-                        'title': 'Shop by Category',
-                        'columns_desktop': 3,
-                        'column_alignment': 'left',
-                        'image_width': 'full'
-                    }
-                },
-                'support_cta': {
-                    'type': 'newsletter',
-                    'settings': {
-                        'heading': 'Stay Updated',
-                        'text': 'Get exclusive deals and product launches',
-                        'button_label': 'Subscribe'
-                    }
-                }
-            }
-
-            # Set section order
-            template['order'] = [
-                'hero',
-                'trust_badges',
-                'featured_products',
-                'category_grid',
-                'support_cta'
-            ]
+        # Apply the brand patch prebuilt in __init__
+        current.update(self._theme_settings_patch)
 
-            # Save template
-            asset.value = json.dumps(template, indent=2)
-            asset.save()
+        # Queue settings for the bulk write
+        await self._bulk.enqueue('config/settings_data.json', _dumps(settings))
 
-            logger.info("✅ Homepage configured")
-            return {'success': True}
+        logger.info("✅ Theme settings configured")
+        return {'success': True}
 
-        except Exception as e:
-            logger.error(f"Homepage configuration error: {e}")
-            return {'success': False, 'error': str(e)}
+    @_guarded('Homepage configuration')
+    async def _configure_homepage(self, theme_id: int) -> Dict:
+        """Set up optimized homepage sections"""
+        logger.info("🏠 Configuring homepage...")
 
+        # Get index.json template
+        asset = await _afind_asset('templates/index.json', theme_id)
+        template = _loads(asset.value)
+
+        # Skip the write when a previous run already applied the layout
+        if (template.get('sections') == self._homepage_sections
+                and template.get('order') == self._homepage_order):
+            logger.info("✅ Homepage already up to date")
+            return {'success': True, 'skipped': True}
+
+        # Sections and order are prebuilt in __init__
+        template['sections'] = self._homepage_sections
+        template['order'] = self._homepage_order
+
+        # Queue template for the bulk write
+        await self._bulk.enqueue('templates/index.json', _dumps(template))
+
+        logger.info("✅ Homepage configured")
+        return {'success': True}
+
+    # Static section patches, built once at class definition
+    _PRODUCT_PAGE_PATCH = {
+        'enable_sticky_info': True,
+        'media_size': 'large',
+        'gallery_layout': 'stacked',
+        'media_position': 'left',
+        'image_zoom': 'lightbox',
+        'enable_video_looping': True,
+        'show_rating': True,
+        'show_share_buttons': True
+    }
+    _COLLECTION_GRID_PATCH = {
+        'products_per_page': 24,
+        'columns_desktop': 4,
+        'image_ratio': 'square',
+        'show_secondary_image': True,
+        'show_vendor': False,
+        'show_rating': True,
+        'enable_filtering': True,
+        'enable_sorting': True
+    }
+
+    @_guarded('Product page')
     async def _configure_product_page(self, theme_id: int) -> Dict:
         """Configure product page template"""
         logger.info("📦 Configuring product page...")
 
-        try:
-            asset = shopify.Asset.find('templates/product.json', theme_id=theme_id)
-            template = json.loads(asset.value)
-
-            # Optimize product page sections
-            if 'main' in template.get('sections', {}):
-                template['sections']['main']['settings'].update({
-                    'enable_sticky_info': True,
-                    'media_size': 'large',
-                    'gallery_layout': 'stacked',
-                    'media_position': 'left',
-                    'image_zoom': 'lightbox',
-                    'enable_video_looping': True,
-                    'show_rating': True,
-                    'show_share_buttons': True
-                })
-
-            # Save
-            asset.value = json.dumps(template, indent=2)
-            asset.save()
-
-            logger.info("✅ Product page configured")
-            return {'success': True}
+        asset = await _afind_asset('templates/product.json', theme_id)
+        template = _loads(asset.value)
 
-        except Exception as e:
-            logger.error(f"Product page error: {e}")
-            return {'success': False, 'error': str(e)}
+        # Optimize product page sections
+        if 'main' in template.get('sections', {}):
+            main_settings = template['sections']['main']['settings']
+            if all(main_settings.get(k) == v for k, v in self._PRODUCT_PAGE_PATCH.items()):
+                logger.info("✅ Product page already up to date")
+                return {'success': True, 'skipped': True}
+            main_settings.update(self._PRODUCT_PAGE_PATCH)
 
+            # Queue for the bulk write
+            await self._bulk.enqueue('templates/product.json', _dumps(template))
+
+        logger.info("✅ Product page configured")
+        return {'success': True}
+
+    @_guarded('Collection configuration')
     async def _configure_collections(self, theme_id: int) -> Dict:
         """Configure collection page template"""
         logger.info("📚 Configuring collection pages...")
 
-        try:
-            asset = shopify.Asset.find('templates/collection.json', theme_id=theme_id)
-            template = json.loads(asset.value)
+        asset = await _afind_asset('templates/collection.json', theme_id)
+        template = _loads(asset.value)
 
-            # Optimize collection display
-            if 'product-grid' in template.get('sections', {}):
-                template['sections']['product-grid']['settings'].update({
-                    'products_per_page': 24,
-                    'columns_desktop': 4,
-                    'image_ratio': 'square',
-                    'show_secondary_image': True,
-                    'show_vendor': False,
-                    'show_rating': True,
-                    'enable_filtering': True,
-                    'enable_sorting': True
-                })
+        # Optimize collection display
+        if 'product-grid' in template.get('sections', {}):
+            grid_settings = template['sections']['product-grid']['settings']
+            if all(grid_settings.get(k) == v for k, v in self._COLLECTION_GRID_PATCH.items()):
+                logger.info("✅ Collection pages already up to date")
+                return {'success': True, 'skipped': True}
+            grid_settings.update(self._COLLECTION_GRID_PATCH)
 
-            asset.value = json.dumps(template, indent=2)
-            asset.save()
+            await self._bulk.enqueue('templates/collection.json', _dumps(template))
 
-            logger.info("✅ Collection pages configured")
-            return {'success': True}
-
-        except Exception as e:
-            logger.error(f"Collection configuration error: {e}")
-            return {'success': False, 'error': str(e)}
+        logger.info("✅ Collection pages configured")
+        return {'success': True}
 
+    @_guarded('Navigation')
     async def _configure_navigation(self) -> Dict:
         """Set up navigation menus"""
         logger.info("🧭 Configuring navigation...")
 
-        try:
-            # Main menu structure
-            main_menu_items = [
-                {'title': 'Home', 'url': '/'},
-                {'title': 'Shop All', 'url': '/collections/all'},
-                {'title': 'Trending', 'url': '/collections/trending'},
-                {'title': 'New Arrivals', 'url': '/collections/new'},
-                {'title': 'About', 'url': '/pages/about'},
-                {'title': 'Contact', 'url': '/pages/contact'}
-            ]
-
-            # Footer menu
-            footer_items = [
-                {'title': 'Shipping Policy', 'url': '/pages/shipping'},
-                {'title': 'Return Policy', 'url': '/pages/returns'},
-                {'title': 'Privacy Policy', 'url': '/pages/privacy'},
-                {'title': 'Terms of Service', 'url': '/pages/terms'}
-            ]
-
-            # Note: Actual menu creation would use Shopify Admin API
-            # This is a simplified version
-
-            logger.info("✅ Navigation configured")
-            return {'success': True}
-
-        except Exception as e:
-            logger.error(f"Navigation error: {e}")
-            return {'success': False, 'error': str(e)}
-
-    async def _optimize_seo(self, theme_id: int) -> Dict:
-        """Apply SEO optimizations"""
-        logger.info("🔍 Optimizing SEO...")
-
-        try:
-            # Update theme.liquid with SEO enhancements
-            asset = shopify.Asset.find('layout/theme.liquid', theme_id=theme_id)
-            html = asset.value
-
-            # Check for meta tags
-            if '<meta name="description"' not in html:
-                # Add placeholder (should be customized per page)
-                meta_insert = '''
+        # Main menu structure
+        main_menu_items = [
+            {'title': 'Home', 'url': '/'},
+            {'title': 'Shop All', 'url': '/collections/all'},
+            {'title': 'Trending', 'url': '/collections/trending'},
+            {'title': 'New Arrivals', 'url': '/collections/new'},
+            {'title': 'About', 'url': '/pages/about'},
+            {'title': 'Contact', 'url': '/pages/contact'}
+        ]
+
+        # Footer menu
+        footer_items = [
+            {'title': 'Shipping Policy', 'url': '/pages/shipping'},
+            {'title': 'Return Policy', 'url': '/pages/returns'},
+            {'title': 'Privacy Policy', 'url': '/pages/privacy'},
+            {'title': 'Terms of Service', 'url': '/pages/terms'}
+        ]
+
+        # Note: Actual menu creation would use Shopify Admin API
+        # This is a simplified version
+
+        logger.info("✅ Navigation configured")
+        return {'success': True}
+
+    # Placeholder meta tags injected ahead of </head> (customized per page
+    # via the liquid defaults); built once as a class constant
+    _SEO_META_INSERT = '''
   <meta name="description" content="{{ page_description | default: shop.description }}">
   <meta property="og:title" content="{{ page_title | default: shop.name }}">
   <meta property="og:description" content="{{ page_description | default: shop.description }}">
   <meta property="og:image" content="{{ shop.logo | img_url: 'large' }}">
 '''
-                html = html.replace('</head>', f'{meta_insert}</head>')
-                asset.value = html
-                asset.save()
 
-            logger.info("✅ SEO optimized")
-            return {'success': True}
+    @_guarded('SEO optimization')
+    async def _optimize_seo(self, theme_id: int) -> Dict:
+        """Apply SEO optimizations"""
+        logger.info("🔍 Optimizing SEO...")
 
-        except Exception as e:
-            logger.error(f"SEO optimization error: {e}")
-            return {'success': False, 'error': str(e)}
+        # Update theme.liquid with SEO enhancements
+        asset = await _afind_asset('layout/theme.liquid', theme_id)
+        html = asset.value
+
+        # rpartition finds the single trailing </head> from the end of
+        # the liquid and splits in one pass — no replace() rebuild scan
+        head_pre, sep, head_post = html.rpartition('</head>')
+        if sep and '<meta name="description"' not in head_pre:
+            html = head_pre + self._SEO_META_INSERT + sep + head_post
+            await self._bulk.enqueue('layout/theme.liquid', html)
+
+        logger.info("✅ SEO optimized")
+        return {'success': True}
 
     async def publish_theme(self, theme_id: int) -> bool:
         """Publish the configured theme"""
         try:
-            theme = shopify.Theme.find(theme_id)
+            theme = await asyncio.to_thread(shopify.Theme.find, theme_id)
             theme.role = 'main'
-            theme.save()
+            await asyncio.to_thread(theme.save)
 
             logger.info(f"✅ Theme {theme_id} published as main theme")
             return True
@@ -22,9 +22,9 @@ async def test_api():
         print('❌ API credentials not configured!')
         return
 
-    print(f'✅ Credentials loaded:')
-    print(f'   App Key: {client.app_key[:10]}...')
-    print(f'   Secret: {client.app_secret[:10]}...\n')
+    print(f'✅ Credentials loaded:\n'
+          f'   App Key: {client.app_key[:10]}...\n'
+          f'   Secret: {client.app_secret[:10]}...\n')
 
     print('📡 Fetching products from API...')
 
@@ -33,12 +33,13 @@ async def test_api():
 
         if products:
             print(f'\n✅ Got {len(products)} products!\n')
+            # One formatted write per product instead of five print calls
             for i, p in enumerate(products[:3], 1):
-                print(f'{i}. {p.get("name", "Unknown")}')
-                print(f'   Price: ${p.get("price", 0):.2f}')
-                print(f'   Orders: {p.get("orders", 0):,}')
-                print(f'   Rating: {p.get("rating", 0):.1f}/5.0')
-                print(f'   URL: {p.get("url", "")}\n')
+                print(f'{i}. {p.get("name", "Unknown")}\n'
+                      f'   Price: ${p.get("price", 0):.2f}\n'
+                      f'   Orders: {p.get("orders", 0):,}\n'
+                      f'   Rating: {p.get("rating", 0):.1f}/5.0\n'
+                      f'   URL: {p.get("url", "")}\n')
         else:
             print('\n❌ No products returned')
     except Exception as e:
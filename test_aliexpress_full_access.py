@@ -5,36 +5,65 @@ Test AliExpress Full Dropshipping Solution API Access.
 This script verifies which APIs are accessible with current credentials.
 """
 
+import asyncio
+import sys
 import time
 import hmac
 import hashlib
-import requests
+import httpx
 from typing import Dict, Any
 
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def _json_loads(data):
+        return json.loads(data)
+
 
 # Your credentials
 APP_KEY = "520918"
 APP_SECRET = "idjX6tOzHx6urVsSylVzEcHZKwBN4YhN"
 API_URL = "https://api-sg.aliexpress.com/sync"
 
+# Primed once at import; copy() per signature skips re-deriving the
+# HMAC key pads (two SHA-256 block compressions per call)
+_BASE_HMAC = hmac.new(APP_SECRET.encode('utf-8'), b'', hashlib.sha256)
 
-def generate_signature(params: Dict[str, str]) -> str:
-    """Generate HMAC-SHA256 signature for API request."""
-    sorted_params = sorted(params.items())
-    sign_string = "".join([f"{k}{v}" for k, v in sorted_params])
-    signature = hmac.new(
-        APP_SECRET.encode('utf-8'),
-        sign_string.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest().upper()
-    return signature
+# Keys and values that appear in every request, pre-encoded once so
+# signing only UTF-8-encodes the dynamic fields (timestamp, method...)
+_STATIC_BYTES = {s: s.encode('utf-8') for s in (
+    "app_key", APP_KEY, "method", "timestamp", "format", "json",
+    "v", "2.0", "sign_method", "sha256", "keywords",
+    "target_currency", "USD", "target_language", "EN", "page_size", "5",
+)}
 
 
-def test_api(method: str, additional_params: Dict[str, str] = None) -> Dict[str, Any]:
+def generate_signature(params: Dict[str, str]) -> str:
+    """Generate HMAC-SHA256 signature for API request."""
+    # Accumulate the sign bytes directly instead of building per-pair
+    # f-strings plus a joined str that gets re-encoded anyway
+    sign_bytes = bytearray()
+    static = _STATIC_BYTES
+    for k, v in sorted(params.items()):
+        sign_bytes += static.get(k) or k.encode('utf-8')
+        sign_bytes += static.get(v) or v.encode('utf-8')
+    h = _BASE_HMAC.copy()
+    h.update(sign_bytes)
+    return h.hexdigest().upper()
+
+
+async def test_api(client: httpx.AsyncClient, method: str,
+                   additional_params: Dict[str, str] = None) -> Dict[str, Any]:
     """
     Test an API endpoint.
 
     Args:
+        client: Shared AsyncClient (all probes multiplex one connection)
         method: API method name
         additional_params: Extra params for the API call
 
@@ -44,7 +73,8 @@ def test_api(method: str, additional_params: Dict[str, str] = None) -> Dict[str,
     params = {
         "app_key": APP_KEY,
         "method": method,
-        "timestamp": str(int(time.time() * 1000)),
+        # Integer path end to end — no float multiply/truncate
+        "timestamp": str(time.time_ns() // 1_000_000),
         "format": "json",
         "v": "2.0",
         "sign_method": "sha256",
@@ -58,7 +88,7 @@ def test_api(method: str, additional_params: Dict[str, str] = None) -> Dict[str,
     params["sign"] = generate_signature(params)
 
     try:
-        response = requests.get(API_URL, params=params, timeout=15)
+        response = await client.get(API_URL, params=params)
 
         if response.status_code != 200:
             return {
@@ -67,78 +97,83 @@ def test_api(method: str, additional_params: Dict[str, str] = None) -> Dict[str,
                 "details": response.text
             }
 
-        data = response.json()
-
-        # Check for API errors
-        if "error_response" in data:
-            error = data["error_response"]
-            error_code = error.get("code", "unknown")
-            error_msg = error.get("msg", "No message")
-
-            # Distinguish between permission errors and parameter errors
-            if "permission" in error_msg.lower() or "unauthorized" in error_msg.lower():
-                return {
-                    "success": False,
-                    "error": "PERMISSION DENIED",
-                    "code": error_code,
-                    "message": error_msg
-                }
-            elif "param" in error_msg.lower() or "required" in error_msg.lower():
-                return {
-                    "success": True,  # API is accessible, just missing params
-                    "access": "GRANTED",
-                    "error": "Missing required parameters (expected)",
-                    "code": error_code,
-                    "message": error_msg
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": "API ERROR",
-                    "code": error_code,
-                    "message": error_msg
-                }
+        raw = response.content
+
+        # Cheap bytes sniff over the head of the payload: error bodies
+        # (including the expected missing-param probes) are tiny and
+        # carry error_response up front, so the 50KB+ product-search
+        # success shape never pays the marker check against full data
+        if b'"error_response"' in raw[:4096]:
+            error = _json_loads(raw).get("error_response")
+            if error is not None:
+                error_code = error.get("code", "unknown")
+                error_msg = error.get("msg", "No message")
+
+                # Distinguish between permission errors and parameter errors
+                msg_lc = error_msg.lower()
+                if any(k in msg_lc for k in ("permission", "unauthorized")):
+                    return {
+                        "success": False,
+                        "error": "PERMISSION DENIED",
+                        "code": error_code,
+                        "message": error_msg
+                    }
+                elif any(k in msg_lc for k in ("param", "required")):
+                    return {
+                        "success": True,  # API is accessible, just missing params
+                        "access": "GRANTED",
+                        "error": "Missing required parameters (expected)",
+                        "code": error_code,
+                        "message": error_msg
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "error": "API ERROR",
+                        "code": error_code,
+                        "message": error_msg
+                    }
 
         # Success - got valid response
         return {
             "success": True,
             "access": "GRANTED",
-            "data": data
+            "data": _json_loads(raw)
         }
 
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         return {"success": False, "error": "TIMEOUT"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
-def print_test_result(test_name: str, result: Dict[str, Any]):
-    """Print formatted test result."""
-    print(f"\n{'='*70}")
-    print(f"TEST: {test_name}")
-    print(f"{'='*70}")
+def format_test_result(test_name: str, result: Dict[str, Any], buf: list):
+    """Append a formatted test result to the output buffer."""
+    buf.append(f"\n{'='*70}")
+    buf.append(f"TEST: {test_name}")
+    buf.append(f"{'='*70}")
 
     if result.get("success") or result.get("access") == "GRANTED":
-        print("✅ ACCESS GRANTED")
+        buf.append("✅ ACCESS GRANTED")
         if result.get("error"):
-            print(f"   Note: {result['error']}")
+            buf.append(f"   Note: {result['error']}")
         if result.get("message"):
-            print(f"   Details: {result['message']}")
+            buf.append(f"   Details: {result['message']}")
         if result.get("data"):
             # Show sample of response
-            print(f"   Response keys: {list(result['data'].keys())}")
+            buf.append(f"   Response keys: {list(result['data'].keys())}")
     else:
-        print("❌ ACCESS DENIED or ERROR")
-        print(f"   Error: {result.get('error', 'Unknown')}")
+        buf.append("❌ ACCESS DENIED or ERROR")
+        buf.append(f"   Error: {result.get('error', 'Unknown')}")
         if result.get("code"):
-            print(f"   Code: {result['code']}")
+            buf.append(f"   Code: {result['code']}")
         if result.get("message"):
-            print(f"   Message: {result['message']}")
+            buf.append(f"   Message: {result['message']}")
         if result.get("details"):
-            print(f"   Details: {result['details'][:200]}...")
+            buf.append(f"   Details: {result['details'][:200]}...")
 
 
-def main():
+async def main():
     """Run all API access tests."""
     print("\n" + "🚀" * 35)
     print("ALIEXPRESS DROPSHIPPING SOLUTION API ACCESS TEST")
@@ -148,104 +183,105 @@ def main():
     print(f"Endpoint: {API_URL}")
     print(f"Testing access level...")
 
-    # ===================================================================
-    # TEST 1: Product Search API (Affiliate API)
-    # ===================================================================
-    print("\n\n" + "📦" * 35)
-    print("TESTING PRODUCT SEARCH CAPABILITIES")
-    print("📦" * 35)
-
-    result1 = test_api(
-        "aliexpress.affiliate.product.query",
-        {
-            "keywords": "smart lock",
-            "target_currency": "USD",
-            "target_language": "EN",
-            "page_size": "5"
-        }
-    )
-    print_test_result("Product Search (aliexpress.affiliate.product.query)", result1)
-
-    # ===================================================================
-    # TEST 2: Hot Products API (Affiliate API)
-    # ===================================================================
-    result2 = test_api(
-        "aliexpress.affiliate.hotproduct.query",
-        {
-            "target_currency": "USD",
-            "target_language": "EN",
-            "page_size": "5"
-        }
-    )
-    print_test_result("Hot Products (aliexpress.affiliate.hotproduct.query)", result2)
-
-    # ===================================================================
-    # TEST 3: Product Details API (Dropshipping API)
-    # ===================================================================
-    print("\n\n" + "🔍" * 35)
-    print("TESTING PRODUCT DETAILS CAPABILITIES")
-    print("🔍" * 35)
-
-    result3 = test_api(
-        "aliexpress.ds.product.get",
-        {
-            "product_id": "1005004043442825",
-            "target_currency": "USD",
-            "target_language": "EN"
-        }
-    )
-    print_test_result("Product Details (aliexpress.ds.product.get)", result3)
-
-    # ===================================================================
-    # TEST 4: Order Placement API (Solution API) - CRITICAL TEST
-    # ===================================================================
-    print("\n\n" + "🛒" * 35)
-    print("TESTING ORDER PLACEMENT API ACCESS (NOT PLACING REAL ORDER)")
-    print("🛒" * 35)
-
-    print("\n⚠️  NOTE: This test will fail with 'missing params' if we have access.")
-    print("   That's GOOD - it means the API is accessible!")
-    print("   If we get 'permission denied' - that's BAD.\n")
-
-    result4 = test_api(
-        "aliexpress.solution.order.create",
-        {
-            # Intentionally incomplete - just testing access
-            "param_place_order_request": "{}"
-        }
-    )
-    print_test_result("Order Placement (aliexpress.solution.order.create)", result4)
-
-    # ===================================================================
-    # TEST 5: Order Query API (Solution API)
-    # ===================================================================
-    result5 = test_api(
-        "aliexpress.solution.order.get",
-        {
-            "param_single_order_query": "{}"
-        }
-    )
-    print_test_result("Order Query (aliexpress.solution.order.get)", result5)
-
-    # ===================================================================
-    # TEST 6: Shipping Info API
-    # ===================================================================
-    print("\n\n" + "🚚" * 35)
-    print("TESTING LOGISTICS/SHIPPING CAPABILITIES")
-    print("🚚" * 35)
-
-    result6 = test_api(
-        "aliexpress.logistics.redefining.getlogisticsselleraddresses",
-        {}
-    )
-    print_test_result("Logistics Addresses (shipping info)", result6)
+    # All six probes fire concurrently over one pooled HTTP/2 connection,
+    # so wall time is the slowest round-trip instead of the sum of six.
+    # Explicit pool bounds keep a fallback to HTTP/1.1 from fanning out
+    # into six parallel TLS handshakes
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+    async with httpx.AsyncClient(http2=True, timeout=15, limits=limits) as client:
+        result1, result2, result3, result4, result5, result6 = await asyncio.gather(
+            # TEST 1: Product Search API (Affiliate API)
+            test_api(
+                client,
+                "aliexpress.affiliate.product.query",
+                {
+                    "keywords": "smart lock",
+                    "target_currency": "USD",
+                    "target_language": "EN",
+                    "page_size": "5"
+                }
+            ),
+            # TEST 2: Hot Products API (Affiliate API)
+            test_api(
+                client,
+                "aliexpress.affiliate.hotproduct.query",
+                {
+                    "target_currency": "USD",
+                    "target_language": "EN",
+                    "page_size": "5"
+                }
+            ),
+            # TEST 3: Product Details API (Dropshipping API)
+            test_api(
+                client,
+                "aliexpress.ds.product.get",
+                {
+                    "product_id": "1005004043442825",
+                    "target_currency": "USD",
+                    "target_language": "EN"
+                }
+            ),
+            # TEST 4: Order Placement API (Solution API) - CRITICAL TEST
+            test_api(
+                client,
+                "aliexpress.solution.order.create",
+                {
+                    # Intentionally incomplete - just testing access
+                    "param_place_order_request": "{}"
+                }
+            ),
+            # TEST 5: Order Query API (Solution API)
+            test_api(
+                client,
+                "aliexpress.solution.order.get",
+                {
+                    "param_single_order_query": "{}"
+                }
+            ),
+            # TEST 6: Shipping Info API
+            test_api(
+                client,
+                "aliexpress.logistics.redefining.getlogisticsselleraddresses",
+                {}
+            )
+        )
+
+    # Results render in the original deterministic order once all probes
+    # have completed. Everything below is buffered into one write so the
+    # report goes out in a single syscall instead of ~50 print calls
+    buf = []
+    buf.append("\n\n" + "📦" * 35)
+    buf.append("TESTING PRODUCT SEARCH CAPABILITIES")
+    buf.append("📦" * 35)
+    format_test_result("Product Search (aliexpress.affiliate.product.query)", result1, buf)
+    format_test_result("Hot Products (aliexpress.affiliate.hotproduct.query)", result2, buf)
+
+    buf.append("\n\n" + "🔍" * 35)
+    buf.append("TESTING PRODUCT DETAILS CAPABILITIES")
+    buf.append("🔍" * 35)
+    format_test_result("Product Details (aliexpress.ds.product.get)", result3, buf)
+
+    buf.append("\n\n" + "🛒" * 35)
+    buf.append("TESTING ORDER PLACEMENT API ACCESS (NOT PLACING REAL ORDER)")
+    buf.append("🛒" * 35)
+
+    buf.append("\n⚠️  NOTE: This test will fail with 'missing params' if we have access.")
+    buf.append("   That's GOOD - it means the API is accessible!")
+    buf.append("   If we get 'permission denied' - that's BAD.\n")
+    format_test_result("Order Placement (aliexpress.solution.order.create)", result4, buf)
+    format_test_result("Order Query (aliexpress.solution.order.get)", result5, buf)
+
+    buf.append("\n\n" + "🚚" * 35)
+    buf.append("TESTING LOGISTICS/SHIPPING CAPABILITIES")
+    buf.append("🚚" * 35)
+    format_test_result("Logistics Addresses (shipping info)", result6, buf)
 
     # ===================================================================
     # SUMMARY
     # ===================================================================
-    print("\n\n" + "📊" * 35)
-    print("ACCESS SUMMARY")
-    print("📊" * 35)
+    buf.append("\n\n" + "📊" * 35)
+    buf.append("ACCESS SUMMARY")
+    buf.append("📊" * 35)
 
     tests = [
         ("Product Search", result1),
@@ -261,30 +297,31 @@ def main():
 
     for name, result in tests:
         status = "✅" if (result.get("success") or result.get("access") == "GRANTED") else "❌"
-        print(f"{status} {name}")
+        buf.append(f"{status} {name}")
         if result.get("success") or result.get("access") == "GRANTED":
             granted += 1
         else:
             denied += 1
 
-    print(f"\n📊 TOTAL: {granted}/{len(tests)} APIs accessible")
+    buf.append(f"\n📊 TOTAL: {granted}/{len(tests)} APIs accessible")
 
     if granted >= 4:  # At least product + order APIs
-        print("\n🎉 CONGRATULATIONS! You have FULL Dropshipping Solution access!")
-        print("   You can now:")
-        print("   ✅ Search products")
-        print("   ✅ Get product details")
-        print("   ✅ Place orders automatically")
-        print("   ✅ Track shipments")
-        print("\n   🚀 READY FOR FULL AUTOMATION! 🚀")
+        buf.append("\n🎉 CONGRATULATIONS! You have FULL Dropshipping Solution access!")
+        buf.append("   You can now:")
+        buf.append("   ✅ Search products")
+        buf.append("   ✅ Get product details")
+        buf.append("   ✅ Place orders automatically")
+        buf.append("   ✅ Track shipments")
+        buf.append("\n   🚀 READY FOR FULL AUTOMATION! 🚀")
     elif granted >= 2:  # Just affiliate APIs
-        print("\n⚠️  You have PARTIAL access (Affiliate APIs only)")
-        print("   You can search products but cannot place orders yet.")
+        buf.append("\n⚠️  You have PARTIAL access (Affiliate APIs only)")
+        buf.append("   You can search products but cannot place orders yet.")
     else:
-        print("\n❌ Limited access - may need to verify credentials or request access")
+        buf.append("\n❌ Limited access - may need to verify credentials or request access")
 
-    print("\n" + "="*70 + "\n")
+    buf.append("\n" + "="*70 + "\n")
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
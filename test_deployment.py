@@ -12,22 +12,42 @@ Checks:
 Run this before deploying to production!
 """
 
+import os
 import sys
 import asyncio
+from collections import defaultdict
 from pathlib import Path
 
 
+# (init name, database_url) pairs already initialized this process —
+# repeat validation runs skip the redundant CREATE TABLE round-trips
+_DB_INITED: set = set()
+
+
+def _init_db_once(name: str, init_fn, database_url):
+    """Run a DDL init at most once per (init, url) in this process."""
+    key = (name, database_url)
+    if key not in _DB_INITED:
+        init_fn(database_url)
+        _DB_INITED.add(key)
+
+
+def _section(title: str) -> str:
+    """Return a formatted section header."""
+    return f"\n{'='*70}\n{title}\n{'='*70}\n"
+
+
 def print_section(title: str):
     """Print a formatted section header."""
-    print(f"\n{'='*70}")
-    print(f"{title}")
-    print(f"{'='*70}\n")
+    print(_section(title))
 
 
-async def check_environment_variables():
+def check_environment_variables():
     """Check that all required environment variables are set."""
-    print_section("1. ENVIRONMENT VARIABLES CHECK")
+    out = [_section("1. ENVIRONMENT VARIABLES CHECK")]
 
+    # get_settings is @lru_cache(maxsize=1) upstream, so the per-check
+    # calls below are dict lookups — pydantic only parses the env once
     from ospra_os.core.settings import get_settings
     settings = get_settings()
 
@@ -47,23 +67,23 @@ async def check_environment_variables():
     all_passed = True
     for name, passed in checks.items():
         status = "✅" if passed else "❌"
-        print(f"{status} {name}: {'Configured' if passed else 'NOT CONFIGURED'}")
+        out.append(f"{status} {name}: {'Configured' if passed else 'NOT CONFIGURED'}")
 
         if not passed and "(optional)" not in name:
             all_passed = False
 
     if all_passed:
-        print("\n✅ All required environment variables are set!")
+        out.append("\n✅ All required environment variables are set!")
     else:
-        print("\n⚠️  Some required environment variables are missing!")
-        print("   Set them in Render: Dashboard → Environment → Add Environment Variable")
+        out.append("\n⚠️  Some required environment variables are missing!")
+        out.append("   Set them in Render: Dashboard → Environment → Add Environment Variable")
 
-    return all_passed
+    return all_passed, "\n".join(out)
 
 
-async def check_database_initialization():
+def check_database_initialization():
     """Check that databases are initialized correctly."""
-    print_section("2. DATABASE INITIALIZATION CHECK")
+    out = [_section("2. DATABASE INITIALIZATION CHECK")]
 
     from ospra_os.core.settings import get_settings
     settings = get_settings()
@@ -73,44 +93,44 @@ async def check_database_initialization():
     # Check follow-up database
     try:
         from app.models import init_followup_db
-        init_followup_db(settings.database_url)
-        print("✅ Follow-up database initialized")
+        _init_db_once("followup", init_followup_db, settings.database_url)
+        out.append("✅ Follow-up database initialized")
         checks.append(True)
     except Exception as e:
-        print(f"❌ Follow-up database failed: {e}")
+        out.append(f"❌ Follow-up database failed: {e}")
         checks.append(False)
 
     # Check analytics database
     try:
         from app.analytics import init_analytics_db
-        init_analytics_db(settings.database_url)
-        print("✅ Analytics database initialized")
+        _init_db_once("analytics", init_analytics_db, settings.database_url)
+        out.append("✅ Analytics database initialized")
         checks.append(True)
     except Exception as e:
-        print(f"❌ Analytics database failed: {e}")
+        out.append(f"❌ Analytics database failed: {e}")
         checks.append(False)
 
     # Check AliExpress OAuth database
     try:
         from ospra_os.aliexpress.oauth import init_aliexpress_oauth_db
-        init_aliexpress_oauth_db(settings.database_url)
-        print("✅ AliExpress OAuth database initialized")
+        _init_db_once("aliexpress_oauth", init_aliexpress_oauth_db, settings.database_url)
+        out.append("✅ AliExpress OAuth database initialized")
         checks.append(True)
     except Exception as e:
-        print(f"❌ AliExpress OAuth database failed: {e}")
+        out.append(f"❌ AliExpress OAuth database failed: {e}")
         checks.append(False)
 
     if all(checks):
-        print("\n✅ All databases initialized successfully!")
+        out.append("\n✅ All databases initialized successfully!")
     else:
-        print("\n⚠️  Some database initializations failed!")
+        out.append("\n⚠️  Some database initializations failed!")
 
-    return all(checks)
+    return all(checks), "\n".join(out)
 
 
 async def check_api_connections():
     """Test connections to all external APIs."""
-    print_section("3. API CONNECTION TESTS")
+    out = [_section("3. API CONNECTION TESTS")]
 
     from ospra_os.core.settings import get_settings
     settings = get_settings()
@@ -125,80 +145,84 @@ async def check_api_connections():
                 client_id=settings.REDDIT_CLIENT_ID,
                 client_secret=settings.REDDIT_SECRET
             )
-            if reddit.is_available():
-                print("✅ Reddit API: Connected and available")
+            # is_available() probes over sync HTTP, so keep it off-loop
+            if await asyncio.to_thread(reddit.is_available):
+                out.append("✅ Reddit API: Connected and available")
                 results["reddit"] = True
             else:
-                print("❌ Reddit API: Not available")
+                out.append("❌ Reddit API: Not available")
                 results["reddit"] = False
         except Exception as e:
-            print(f"❌ Reddit API: Failed - {e}")
+            out.append(f"❌ Reddit API: Failed - {e}")
             results["reddit"] = False
     else:
-        print("⏭️  Reddit API: Skipped (not configured)")
+        out.append("⏭️  Reddit API: Skipped (not configured)")
         results["reddit"] = None
 
     # Test Google Trends (always available)
     try:
         from ospra_os.product_research.connectors.trends.google_trends import GoogleTrendsConnector
         trends = GoogleTrendsConnector()
-        print("✅ Google Trends: Always available (no API key needed)")
+        out.append("✅ Google Trends: Always available (no API key needed)")
         results["google_trends"] = True
     except Exception as e:
-        print(f"❌ Google Trends: Failed - {e}")
+        out.append(f"❌ Google Trends: Failed - {e}")
         results["google_trends"] = False
 
     # Test Shopify API
     if settings.SHOPIFY_STORE_DOMAIN:
         try:
             from app.shopify_client import ShopifyClient
-            import requests
+            import httpx
 
             client = ShopifyClient(settings)
             url = f"https://{settings.SHOPIFY_STORE_DOMAIN}/admin/api/{settings.SHOPIFY_API_VERSION}/shop.json"
-            response = requests.get(url, headers=client.headers, timeout=10)
+            # Native-async probe: the loop stays free during the TCP/TLS
+            # wait so the other gathered checks truly overlap
+            async with httpx.AsyncClient(timeout=10) as http_client:
+                response = await http_client.get(url, headers=client.headers)
 
             if response.status_code == 200:
                 shop = response.json()["shop"]
-                print(f"✅ Shopify API: Connected to {shop.get('name')}")
+                out.append(f"✅ Shopify API: Connected to {shop.get('name')}")
                 results["shopify"] = True
             else:
-                print(f"❌ Shopify API: HTTP {response.status_code}")
+                out.append(f"❌ Shopify API: HTTP {response.status_code}")
                 results["shopify"] = False
         except Exception as e:
-            print(f"❌ Shopify API: Failed - {e}")
+            out.append(f"❌ Shopify API: Failed - {e}")
             results["shopify"] = False
     else:
-        print("⏭️  Shopify API: Skipped (not configured)")
+        out.append("⏭️  Shopify API: Skipped (not configured)")
         results["shopify"] = None
 
     # Test AliExpress OAuth Status
     if settings.ALIEXPRESS_API_KEY:
         try:
             # Just check if credentials are set - OAuth needs manual authorization
-            print("✅ AliExpress API: Credentials configured (OAuth authorization required)")
+            out.append("✅ AliExpress API: Credentials configured (OAuth authorization required)")
             results["aliexpress"] = True
         except Exception as e:
-            print(f"❌ AliExpress API: Failed - {e}")
+            out.append(f"❌ AliExpress API: Failed - {e}")
             results["aliexpress"] = False
     else:
-        print("⏭️  AliExpress API: Skipped (not configured)")
+        out.append("⏭️  AliExpress API: Skipped (not configured)")
         results["aliexpress"] = None
 
     configured_count = sum(1 for v in results.values() if v is True)
     total_required = 3  # Reddit, Google Trends, Shopify
 
     if configured_count >= 2:
-        print(f"\n✅ {configured_count} APIs connected - System is operational!")
+        out.append(f"\n✅ {configured_count} APIs connected - System is operational!")
     else:
-        print(f"\n⚠️  Only {configured_count} APIs connected - Consider configuring more APIs")
+        out.append(f"\n⚠️  Only {configured_count} APIs connected - Consider configuring more APIs")
 
-    return configured_count >= 2
+    return configured_count >= 2, "\n".join(out)
 
 
-async def test_scoring_algorithm():
+def test_scoring_algorithm():
     """Validate that the scoring algorithm is working correctly."""
-    print_section("4. SCORING ALGORITHM TEST")
+    out = [_section("4. SCORING ALGORITHM TEST")]
 
     from ospra_os.product_research.connectors.base import ProductCandidate
     from ospra_os.product_research.scorer import ProductScorer
@@ -218,23 +242,23 @@ async def test_scoring_algorithm():
     score = scorer.score(high_priority_product)
     priority = scorer.get_priority_label(score)
 
-    print(f"Test Product: {high_priority_product.name}")
-    print(f"  Score: {score}/10")
-    print(f"  Priority: {priority}")
+    out.append(f"Test Product: {high_priority_product.name}")
+    out.append(f"  Score: {score}/10")
+    out.append(f"  Priority: {priority}")
 
     if score >= 7.0 and priority == "HIGH":
-        print("✅ Scoring algorithm is working correctly!")
-        return True
+        out.append("✅ Scoring algorithm is working correctly!")
+        return True, "\n".join(out)
     else:
-        print(f"❌ Scoring algorithm issue: Expected HIGH priority (>7.0), got {priority} ({score})")
-        return False
+        out.append(f"❌ Scoring algorithm issue: Expected HIGH priority (>7.0), got {priority} ({score})")
+        return False, "\n".join(out)
 
 
-async def test_dashboard_routes():
+def test_dashboard_routes():
     """Test that all dashboard API routes are accessible."""
-    print_section("5. DASHBOARD API ROUTES TEST")
+    out = [_section("5. DASHBOARD API ROUTES TEST")]
 
-    print("Checking that all dashboard routes are defined...")
+    out.append("Checking that all dashboard routes are defined...")
 
     from ospra_os.main import app
 
@@ -248,27 +272,32 @@ async def test_dashboard_routes():
         "/api/validate-product",
     ]
 
-    all_routes = [route.path for route in app.routes]
+    # Cache the compiled path set on the app so watch-mode / repeated
+    # runs in one process don't rebuild it from hundreds of routes
+    all_routes = getattr(app, "_route_path_set", None)
+    if all_routes is None:
+        all_routes = {route.path for route in app.routes}
+        app._route_path_set = all_routes
 
     all_present = True
     for route in required_routes:
         if route in all_routes:
-            print(f"✅ {route}")
+            out.append(f"✅ {route}")
         else:
-            print(f"❌ {route} - NOT FOUND")
+            out.append(f"❌ {route} - NOT FOUND")
             all_present = False
 
     if all_present:
-        print("\n✅ All dashboard routes are defined!")
+        out.append("\n✅ All dashboard routes are defined!")
     else:
-        print("\n❌ Some dashboard routes are missing!")
+        out.append("\n❌ Some dashboard routes are missing!")
 
-    return all_present
+    return all_present, "\n".join(out)
 
 
-async def test_file_structure():
+def test_file_structure():
     """Check that all required files exist."""
-    print_section("6. FILE STRUCTURE CHECK")
+    out = [_section("6. FILE STRUCTURE CHECK")]
 
     required_files = [
         "ospra_os/main.py",
@@ -284,21 +313,37 @@ async def test_file_structure():
         "static/ospra_dashboard.html",
     ]
 
+    # One scandir per parent directory instead of one stat per file:
+    # 11 required files across ~6 dirs means ~6 syscalls, not 11
+    by_dir = defaultdict(set)
+    for f in required_files:
+        path = Path(f)
+        by_dir[str(path.parent)].add(path.name)
+
+    present = set()
+    for directory, names in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                present.update(
+                    f"{directory}/{e.name}" for e in entries if e.name in names
+                )
+        except FileNotFoundError:
+            pass  # whole directory missing — its files report as absent
+
     all_present = True
     for file_path in required_files:
-        path = Path(file_path)
-        if path.exists():
-            print(f"✅ {file_path}")
+        if file_path in present:
+            out.append(f"✅ {file_path}")
         else:
-            print(f"❌ {file_path} - NOT FOUND")
+            out.append(f"❌ {file_path} - NOT FOUND")
             all_present = False
 
     if all_present:
-        print("\n✅ All required files are present!")
+        out.append("\n✅ All required files are present!")
     else:
-        print("\n❌ Some required files are missing!")
+        out.append("\n❌ Some required files are missing!")
 
-    return all_present
+    return all_present, "\n".join(out)
 
 
 async def main():
@@ -307,15 +352,53 @@ async def main():
     print("OSPRA OS - PRE-DEPLOYMENT VALIDATION")
     print("🚀" * 35)
 
+    # Each check buffers its own output and returns (passed, log), so
+    # output still renders in the fixed 1-6 order. Only the API probe
+    # does real I/O — the rest run as plain sync calls with no event-
+    # loop ceremony. Cheap local checks go first; the network-bound API
+    # probe only runs when the environment is actually configured, so a
+    # broken deploy fails in milliseconds instead of sitting through
+    # HTTP timeouts.
     results = {}
+    logs = {}
 
-    # Run all checks
-    results["environment"] = await check_environment_variables()
-    results["database"] = await check_database_initialization()
-    results["api_connections"] = await check_api_connections()
-    results["scoring"] = await test_scoring_algorithm()
-    results["routes"] = await test_dashboard_routes()
-    results["files"] = await test_file_structure()
+    def _run_sync(check_name, fn):
+        try:
+            passed, log = fn()
+        except Exception as e:
+            passed = False
+            log = _section(f"CHECK '{check_name}' CRASHED") + f"❌ {e}"
+        results[check_name] = passed
+        logs[check_name] = log
+
+    # Stage 1: prerequisites (cheap, no network)
+    _run_sync("environment", check_environment_variables)
+    _run_sync("files", test_file_structure)
+
+    # Stage 2: independent local checks
+    _run_sync("database", check_database_initialization)
+    _run_sync("scoring", test_scoring_algorithm)
+    _run_sync("routes", test_dashboard_routes)
+
+    # Stage 3: network probes — pointless if the env isn't configured
+    if results["environment"]:
+        try:
+            passed, log = await check_api_connections()
+        except Exception as e:
+            passed = False
+            log = _section("CHECK 'api_connections' CRASHED") + f"❌ {e}"
+        results["api_connections"] = passed
+        logs["api_connections"] = log
+    else:
+        results["api_connections"] = False
+        logs["api_connections"] = (
+            _section("3. API CONNECTION TESTS")
+            + "⏭️  Skipped (prerequisite failed: environment variables)"
+        )
+
+    for check_name in ("environment", "database", "api_connections",
+                       "scoring", "routes", "files"):
+        print(logs[check_name])
 
     # Summary
     print_section("📊 DEPLOYMENT READINESS SUMMARY")
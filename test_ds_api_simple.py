@@ -10,14 +10,34 @@ import hashlib
 import time
 import requests
 
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps_pretty(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps_pretty(data):
+        return json.dumps(data, indent=2)
+
 app_key = "520918"
 app_secret = "idjX6tOzHx6urVsSylVzEcHZKwBN4YhN"
 
+# HMAC base primed once; copy() avoids re-expanding the key pads
+_base_hmac = hmac.new(app_secret.encode('utf-8'), b'', hashlib.sha256)
+
 # API parameters
 params = {
     "app_key": app_key,
     "method": "aliexpress.ds.product.get",
-    "timestamp": str(int(time.time() * 1000)),
+    "timestamp": str(time.time_ns() // 1_000_000),
     "format": "json",
     "v": "2.0",
     "sign_method": "sha256",
@@ -27,16 +47,14 @@ params = {
     "target_language": "en",
 }
 
-# Generate signature
-sorted_params = sorted(params.items())
-sign_string = "".join([f"{k}{v}" for k, v in sorted_params])
-signature = hmac.new(
-    app_secret.encode('utf-8'),
-    sign_string.encode('utf-8'),
-    hashlib.sha256
-).hexdigest().upper()
-
-params["sign"] = signature
+# Generate signature — accumulate bytes directly, no intermediate str
+sign_bytes = bytearray()
+for k, v in sorted(params.items()):
+    sign_bytes += k.encode('utf-8')
+    sign_bytes += v.encode('utf-8')
+_h = _base_hmac.copy()
+_h.update(sign_bytes)
+params["sign"] = _h.hexdigest().upper()
 
 # Make request
 url = "https://api-sg.aliexpress.com/sync"
@@ -52,8 +70,8 @@ response = requests.get(url, params=params, timeout=15)
 
 print(f"\nHTTP Status Code: {response.status_code}")
 
-# Check for success
-data = response.json()
+# Check for success — parse straight from the response bytes
+data = _json_loads(response.content)
 
 if "aliexpress_ds_product_get_response" in data:
     print("\n" + "🎉" * 35)
@@ -102,5 +120,4 @@ else:
 print("\n" + "=" * 70)
 print("\nFull Response:")
 print("=" * 70)
-import json
-print(json.dumps(data, indent=2))
+print(_json_dumps_pretty(data))
@@ -32,7 +32,8 @@ async def test_multi_niche_discovery():
     # Run discovery
     niche_products = await discovery.discover_all_niches(
         min_score=7.0,
-        max_per_niche=3  # Limit to 3 per niche for testing
+        max_per_niche=3,  # Limit to 3 per niche for testing
+        max_concurrency=8
     )
 
     # Get top products
@@ -10,6 +10,14 @@ import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
+# Prefer uvloop's libuv-backed event loop when available — the discovery
+# tests are await-heavy I/O where it runs well ahead of the default loop
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Load environment variables
 load_dotenv()
 
@@ -120,13 +128,17 @@ async def main():
     
     # Test 1: Environment
     env_ok = test_environment()
-    
-    # Test 2: AliExpress API
-    ali_ok = await test_aliexpress_api()
-    
-    # Test 3: Intelligence Engine
-    engine_ok = await test_intelligence_engine()
-    
+
+    # Tests 2+3 are independent and network-bound — overlap them so the
+    # run takes as long as the slower of the two, not their sum
+    ali_ok, engine_ok = await asyncio.gather(
+        test_aliexpress_api(),
+        test_intelligence_engine(),
+        return_exceptions=True,
+    )
+    ali_ok = ali_ok is True
+    engine_ok = engine_ok is True
+
     # Summary
     print("\n" + "=" * 60)
     print("📊 TEST SUMMARY")
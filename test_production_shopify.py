@@ -1,35 +1,14 @@
 #!/usr/bin/env python3
 """Test production (Render) Shopify connection."""
 
-import requests
+import asyncio
+import sys
 
-print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-print("TESTING PRODUCTION SHOPIFY (Render)")
-print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-print()
+import aiohttp
 
 # Test the production API's Shopify integration endpoint
 url = "https://oubon-mailbot.onrender.com"
 
-print(f"Testing: {url}")
-print()
-
-# First check if service is up
-print("1. Checking if service is online...")
-try:
-    resp = requests.get(f"{url}/", timeout=30)
-    if resp.status_code == 200:
-        print("   ✅ Service is online")
-    else:
-        print(f"   ⚠️  Service returned {resp.status_code}")
-except Exception as e:
-    print(f"   ❌ Service is offline: {e}")
-    exit(1)
-
-print()
-
-# Check if we have a Shopify test endpoint
-print("2. Looking for Shopify test endpoint...")
 endpoints_to_try = [
     "/api/shopify/test",
     "/api/test-shopify",
@@ -37,25 +16,72 @@ endpoints_to_try = [
     "/health"
 ]
 
-for endpoint in endpoints_to_try:
+
+async def probe(session: aiohttp.ClientSession, endpoint: str):
+    """Probe one endpoint, returning (endpoint, status, body head or error)."""
     try:
-        print(f"   Trying: {endpoint}")
-        resp = requests.get(f"{url}{endpoint}", timeout=15)
-        print(f"   Status: {resp.status_code}")
-        if resp.status_code in [200, 404, 405]:
-            print(f"   Response: {resp.text[:200]}")
+        async with session.get(f"{url}{endpoint}", timeout=aiohttp.ClientTimeout(total=15)) as resp:
+            # Only the first 200 bytes are ever shown, so stop reading
+            # there instead of pulling a full product payload down
+            head = await resp.content.read(200)
+            return endpoint, resp.status, head.decode("utf-8", errors="replace")
     except Exception as e:
-        print(f"   Error: {e}")
+        return endpoint, None, str(e)
+
+
+async def main():
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print("TESTING PRODUCTION SHOPIFY (Render)")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print()
+    print(f"Testing: {url}")
+    print()
+
+    connector = aiohttp.TCPConnector(limit=8)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Probe the root and every candidate endpoint concurrently over
+        # the keep-alive pool — wall time is the slowest probe, not the
+        # sum, and a dead root no longer hides the other results
+        print("1. Probing service root and Shopify endpoints...")
+        probed = await asyncio.gather(
+            *(probe(session, endpoint) for endpoint in ["/"] + endpoints_to_try)
+        )
+
+    results = {endpoint: status for endpoint, status, _ in probed}
+    root_status = results["/"]
+    if root_status == 200:
+        print("   ✅ Service is online")
+    elif root_status is None:
+        print("   ❌ Service is offline")
+    else:
+        print(f"   ⚠️  Service returned {root_status}")
+    print()
+
+    print("2. Endpoint results...")
+    for endpoint, status, detail in probed[1:]:
+        print(f"   Tried: {endpoint}")
+        if status is None:
+            print(f"   Error: {detail}")
+        else:
+            print(f"   Status: {status}")
+            if status in [200, 404, 405]:
+                print(f"   Response: {detail}")
+        print()
+
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print("RECOMMENDATION:")
+    print()
+    print("If you updated the Shopify token on Render:")
+    print("1. ✅ Token is active in production")
+    print("2. ❌ Local .env still has old token")
     print()
+    print("To sync local with production:")
+    print("  - Copy the NEW token from Render Environment Variables")
+    print("  - Paste it here and I'll update your local .env")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+
+    return 0 if root_status == 200 else 1
+
 
-print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-print("RECOMMENDATION:")
-print()
-print("If you updated the Shopify token on Render:")
-print("1. ✅ Token is active in production")
-print("2. ❌ Local .env still has old token")
-print()
-print("To sync local with production:")
-print("  - Copy the NEW token from Render Environment Variables")
-print("  - Paste it here and I'll update your local .env")
-print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
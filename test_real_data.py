@@ -6,156 +6,220 @@ Tests that the intelligence engine returns real, unique data (not mock/duplicate
 
 import asyncio
 import os
+import re
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
 from typing import List, Dict
 
+import numpy as np
+
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
 # Load environment variables
 load_dotenv()
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Block-buffer when output is captured (CI, tee) instead of flushing
+# a syscall per line
+if hasattr(sys.stdout, "reconfigure") and not sys.stdout.isatty():
+    sys.stdout.reconfigure(line_buffering=False)
+
+
+# URL classifiers compiled once — a single scan per URL instead of
+# chained substring tests, and the cap on checked URLs can be lifted
+# without the classification turning quadratic
+_EXACT_URL = re.compile(r'/item/|/product/|productId', re.IGNORECASE)
+_GENERIC_URL = re.compile(r'search|query', re.IGNORECASE)
+
+
+def _flush(buf: List[str]) -> None:
+    """Emit a verification section's lines in one stdout write."""
+    sys.stdout.write("\n".join(buf) + "\n")
+
+
 print("=" * 70)
 print("🧪 OUBON SHOP - REAL DATA VERIFICATION TEST")
 print("=" * 70)
 
 
-def verify_unique_scores(products: List[Dict]) -> bool:
+def _extract_columns(products: List[Dict]):
+    """Pull every verified field out of the product list in one pass.
+
+    The four verify_* checks used to walk the list independently; the
+    SoA columns here mean each product dict is touched exactly once.
+    """
+    scores, prices, urls, names, explanations = [], [], [], [], []
+    _empty = {}          # shared miss default — no fresh dict per product
+    _get = dict.get      # skip per-iteration attribute resolution
+    for p in products:
+        dd = _get(p, 'display_data') or _empty
+        scores.append(_get(p, 'score', 0))
+        prices.append(_get(dd, 'supplier_cost', 0))
+        urls.append(_get(dd, 'supplier_url', ''))
+        names.append(_get(dd, 'name', 'Unknown'))
+        explanations.append(_get(p, 'ai_explanation', ''))
+    return scores, prices, urls, names, explanations
+
+
+def verify_unique_scores(raw_scores: List[float]) -> bool:
     """Verify that products have unique or varied scores"""
-    if not products:
+    if not raw_scores:
         print("  ❌ No products to verify")
         return False
 
-    scores = [p.get('score', 0) for p in products]
-    unique_scores = len(set(scores))
-    total_products = len(products)
-
-    print(f"\n  📊 SCORE ANALYSIS:")
-    print(f"     Total products: {total_products}")
-    print(f"     Unique scores: {unique_scores}")
-    print(f"     Uniqueness: {unique_scores / total_products * 100:.1f}%")
+    total_products = len(raw_scores)
+    scores = np.asarray(raw_scores, dtype=np.float32)
+    unique_scores = np.unique(scores).size
 
-    # List all scores
-    print(f"     All scores: {sorted(scores, reverse=True)}")
+    buf = [
+        "\n  📊 SCORE ANALYSIS:",
+        f"     Total products: {total_products}",
+        f"     Unique scores: {unique_scores}",
+        f"     Uniqueness: {unique_scores / total_products * 100:.1f}%",
+        f"     All scores: {np.sort(scores)[::-1].tolist()}",
+    ]
 
     # We expect at least 70% unique scores for real data
-    if unique_scores / total_products >= 0.7:
-        print("     ✅ PASS: Good score diversity")
-        return True
+    passed = unique_scores / total_products >= 0.7
+    if passed:
+        buf.append("     ✅ PASS: Good score diversity")
     else:
-        print("     ⚠️  WARNING: Low score diversity (may indicate mock data)")
-        return False
+        buf.append("     ⚠️  WARNING: Low score diversity (may indicate mock data)")
+    _flush(buf)
+    return passed
 
 
-def verify_unique_pricing(products: List[Dict]) -> bool:
+def verify_unique_pricing(raw_prices: List[float]) -> bool:
     """Verify that products have unique pricing"""
-    if not products:
+    if not raw_prices:
         print("  ❌ No products to verify")
         return False
 
-    prices = [p.get('display_data', {}).get('supplier_cost', 0) for p in products]
-    unique_prices = len(set(prices))
-    total_products = len(products)
+    total_products = len(raw_prices)
+    prices = np.asarray(raw_prices, dtype=np.float32)
+    unique_prices = np.unique(prices).size
 
-    print(f"\n  💰 PRICING ANALYSIS:")
-    print(f"     Total products: {total_products}")
-    print(f"     Unique prices: {unique_prices}")
-    print(f"     Uniqueness: {unique_prices / total_products * 100:.1f}%")
-
-    # List sample prices
-    print(f"     Sample prices: ${min(prices):.2f} - ${max(prices):.2f}")
+    buf = [
+        "\n  💰 PRICING ANALYSIS:",
+        f"     Total products: {total_products}",
+        f"     Unique prices: {unique_prices}",
+        f"     Uniqueness: {unique_prices / total_products * 100:.1f}%",
+        f"     Sample prices: ${prices.min():.2f} - ${prices.max():.2f}",
+    ]
 
     # We expect at least 80% unique prices for real data
-    if unique_prices / total_products >= 0.8:
-        print("     ✅ PASS: Good price diversity")
-        return True
+    passed = unique_prices / total_products >= 0.8
+    if passed:
+        buf.append("     ✅ PASS: Good price diversity")
     else:
-        print("     ❌ FAIL: Too many duplicate prices (mock data detected)")
-        return False
+        buf.append("     ❌ FAIL: Too many duplicate prices (mock data detected)")
+    _flush(buf)
+    return passed
 
 
-def verify_exact_supplier_urls(products: List[Dict]) -> bool:
+def verify_exact_supplier_urls(urls: List[str], names: List[str]) -> bool:
     """Verify that supplier URLs point to exact products (not generic searches)"""
-    if not products:
+    if not urls:
         print("  ❌ No products to verify")
         return False
 
-    print(f"\n  🔗 SUPPLIER URL ANALYSIS:")
+    buf = ["\n  🔗 SUPPLIER URL ANALYSIS:"]
 
     exact_urls = 0
     generic_urls = 0
 
-    for i, product in enumerate(products[:5], 1):  # Check first 5
-        url = product.get('display_data', {}).get('supplier_url', '')
-        name = product.get('display_data', {}).get('name', 'Unknown')
-
-        print(f"\n     {i}. {name[:50]}...")
+    for i, (url, name) in enumerate(zip(urls[:5], names[:5]), 1):  # Check first 5
+        buf.append(f"\n     {i}. {name[:50]}...")
 
         # Check if URL is exact (contains product ID) or generic (just search)
-        if '/item/' in url or '/product/' in url or 'productId' in url:
-            print(f"        ✅ Exact URL: {url[:60]}...")
+        if _EXACT_URL.search(url):
+            buf.append(f"        ✅ Exact URL: {url[:60]}...")
             exact_urls += 1
-        elif 'search' in url or 'query' in url or url == '#':
-            print(f"        ❌ Generic URL: {url[:60]}...")
+        elif url == '#' or _GENERIC_URL.search(url):
+            buf.append(f"        ❌ Generic URL: {url[:60]}...")
             generic_urls += 1
         else:
-            print(f"        ⚠️  Unknown URL format: {url[:60]}...")
+            buf.append(f"        ⚠️  Unknown URL format: {url[:60]}...")
 
     total_checked = exact_urls + generic_urls
     if total_checked == 0:
-        print("     ❌ FAIL: No valid URLs found")
+        buf.append("     ❌ FAIL: No valid URLs found")
+        _flush(buf)
         return False
 
     exact_percentage = (exact_urls / total_checked) * 100
 
-    print(f"\n     Exact URLs: {exact_urls}/{total_checked} ({exact_percentage:.1f}%)")
+    buf.append(f"\n     Exact URLs: {exact_urls}/{total_checked} ({exact_percentage:.1f}%)")
 
-    if exact_percentage >= 80:
-        print("     ✅ PASS: Most URLs are exact product links")
-        return True
+    passed = exact_percentage >= 80
+    if passed:
+        buf.append("     ✅ PASS: Most URLs are exact product links")
     else:
-        print("     ❌ FAIL: Too many generic search URLs (not real products)")
-        return False
+        buf.append("     ❌ FAIL: Too many generic search URLs (not real products)")
+    _flush(buf)
+    return passed
 
 
-def verify_ai_explanations(products: List[Dict]) -> bool:
+def verify_ai_explanations(explanations: List[str]) -> bool:
     """Verify that AI explanations are unique and meaningful"""
-    if not products:
+    if not explanations:
         print("  ❌ No products to verify")
         return False
 
-    print(f"\n  🤖 AI EXPLANATION ANALYSIS:")
+    buf = ["\n  🤖 AI EXPLANATION ANALYSIS:"]
 
-    explanations = [p.get('ai_explanation', '') for p in products]
-    unique_explanations = len(set(explanations))
-    total_products = len(products)
+    # dict.fromkeys dedups while keeping first-seen order, so the counts
+    # line up with the sample printout and stay diff-stable across runs
+    unique_explanations = len(dict.fromkeys(explanations))
+    total_products = len(explanations)
 
-    print(f"     Total products: {total_products}")
-    print(f"     Unique explanations: {unique_explanations}")
+    buf.append(f"     Total products: {total_products}")
+    buf.append(f"     Unique explanations: {unique_explanations}")
 
-    # Check for generic/mock explanations
-    generic_count = 0
-    for exp in explanations:
-        if not exp or len(exp) < 50 or "analysis not available" in exp.lower():
-            generic_count += 1
+    # Check for generic/mock explanations — the length test vectorizes;
+    # the substring check stays in Python (string ops don't)
+    lengths = np.fromiter((len(exp) for exp in explanations), dtype=np.int32,
+                          count=total_products)
+    short_mask = lengths < 50
+    generic_count = int(short_mask.sum()) + sum(
+        1 for exp, short in zip(explanations, short_mask.tolist())
+        if not short and "analysis not available" in exp.lower()
+    )
 
-    print(f"     Generic explanations: {generic_count}")
+    buf.append(f"     Generic explanations: {generic_count}")
 
     # Show samples
-    print(f"\n     Sample explanations:")
+    buf.append("\n     Sample explanations:")
     for i, exp in enumerate(explanations[:3], 1):
-        print(f"     {i}. {exp[:100]}...")
+        buf.append(f"     {i}. {exp[:100]}...")
 
     # We expect at least 90% unique and meaningful explanations
     valid_explanations = unique_explanations - generic_count
-    if valid_explanations / total_products >= 0.9:
-        print("     ✅ PASS: AI explanations are unique and meaningful")
-        return True
+    passed = valid_explanations / total_products >= 0.9
+    if passed:
+        buf.append("     ✅ PASS: AI explanations are unique and meaningful")
     else:
-        print("     ❌ FAIL: Too many generic/duplicate AI explanations")
-        return False
+        buf.append("     ❌ FAIL: Too many generic/duplicate AI explanations")
+    _flush(buf)
+    return passed
 
 
 async def test_intelligence_engine():
@@ -189,10 +253,11 @@ async def test_intelligence_engine():
         print("VERIFICATION TESTS")
         print("=" * 70)
 
-        score_pass = verify_unique_scores(products)
-        price_pass = verify_unique_pricing(products)
-        url_pass = verify_exact_supplier_urls(products)
-        ai_pass = verify_ai_explanations(products)
+        scores, prices, urls, names, explanations = _extract_columns(products)
+        score_pass = verify_unique_scores(scores)
+        price_pass = verify_unique_pricing(prices)
+        url_pass = verify_exact_supplier_urls(urls, names)
+        ai_pass = verify_ai_explanations(explanations)
 
         # Summary
         print("\n" + "=" * 70)
@@ -245,16 +310,19 @@ async def test_api_endpoint():
         print(f"  🌐 Testing API at: {base_url}")
 
         async with httpx.AsyncClient(timeout=60.0) as client:
+            # Pre-serialized body + orjson parse skip the stdlib json
+            # encoder/decoder on the sizeable discovery payload
             response = await client.post(
                 f"{base_url}/api/intelligence/discover",
-                json={
+                content=_dumps({
                     "niches": ["smart home"],
                     "max_per_niche": 3
-                }
+                }),
+                headers={"content-type": "application/json"},
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
 
                 if data.get('success'):
                     products = data.get('products', [])
@@ -262,7 +330,7 @@ async def test_api_endpoint():
 
                     # Quick verification
                     if products:
-                        score_check = len(set(p['score'] for p in products)) / len(products)
+                        score_check = len({p['score'] for p in products}) / len(products)
                         print(f"  📊 Score uniqueness: {score_check * 100:.1f}%")
 
                         if score_check >= 0.7:
@@ -300,8 +368,9 @@ async def test_environment():
 
     all_configured = True
 
+    env = os.environ  # one mapping read instead of a getenv call per var
     for var, name in required_vars.items():
-        value = os.getenv(var)
+        value = env.get(var)
         if value:
             masked = f"{value[:8]}...{value[-4:]}" if len(value) > 12 else f"{value[:4]}..."
             print(f"  ✅ {name}: {masked}")
@@ -320,11 +389,20 @@ async def main():
     # Test 1: Environment
     env_ok = await test_environment()
 
-    # Test 2: Intelligence Engine
-    engine_ok = await test_intelligence_engine()
-
-    # Test 3: API Endpoint (optional)
-    api_ok = await test_api_endpoint()
+    # Tests 2 and 3 hit different backends and are independent, so they
+    # run concurrently; return_exceptions keeps one failure from
+    # cancelling the other mid-flight
+    engine_ok, api_ok = await asyncio.gather(
+        test_intelligence_engine(),
+        test_api_endpoint(),
+        return_exceptions=True,
+    )
+    if isinstance(engine_ok, Exception):
+        print(f"\n  ❌ Intelligence engine test crashed: {engine_ok}")
+        engine_ok = False
+    if isinstance(api_ok, Exception):
+        print(f"\n  ⚠️  API endpoint test crashed: {api_ok}")
+        api_ok = None  # treated as skipped, matching connection errors
 
     # Final Summary
     print("\n\n" + "=" * 70)
@@ -354,5 +432,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
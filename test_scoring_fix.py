@@ -1,22 +1,23 @@
 #!/usr/bin/env python3
 """Test the fixed product scoring algorithm."""
 
-from ospra_os.product_research.connectors.base import ProductCandidate
-from ospra_os.product_research.scorer import ProductScorer
-
-
 def test_scoring():
     """Test scoring with different product scenarios."""
+    # Local imports keep pytest collection of this module cheap
+    from ospra_os.product_research.connectors.base import ProductCandidate
+    from ospra_os.product_research.scorer import ProductScorer
 
     scorer = ProductScorer()
 
+    w = scorer.weights
+
     print("=" * 70)
     print("TESTING FIXED PRODUCT SCORING ALGORITHM")
     print("=" * 70)
     print("\nWeights:")
-    print(f"  - Demand: {scorer.weights['demand']*100}%")
-    print(f"  - Sentiment: {scorer.weights['sentiment']*100}%")
-    print(f"  - Trend: {scorer.weights['trend']*100}%")
+    print(f"  - Demand: {w['demand']*100}%")
+    print(f"  - Sentiment: {w['sentiment']*100}%")
+    print(f"  - Trend: {w['trend']*100}%")
     print()
 
     # Test Case 1: HIGH PRIORITY - Viral Reddit product
@@ -31,8 +32,7 @@ def test_scoring():
         search_volume=75,          # Good search volume
     )
 
-    score1 = scorer.score(viral_product)
-    explanation1 = scorer.explain_score(viral_product)
+    score1, explanation1 = scorer.score_with_explanation(viral_product)
 
     print(f"Product: {viral_product.name}")
     print(f"Score: {score1}/10")
@@ -56,8 +56,7 @@ def test_scoring():
         search_volume=35,          # Moderate search
     )
 
-    score2 = scorer.score(moderate_product)
-    explanation2 = scorer.explain_score(moderate_product)
+    score2, explanation2 = scorer.score_with_explanation(moderate_product)
 
     print(f"Product: {moderate_product.name}")
     print(f"Score: {score2}/10")
@@ -81,8 +80,7 @@ def test_scoring():
         search_volume=10,          # Low search
     )
 
-    score3 = scorer.score(weak_product)
-    explanation3 = scorer.explain_score(weak_product)
+    score3, explanation3 = scorer.score_with_explanation(weak_product)
 
     print(f"Product: {weak_product.name}")
     print(f"Score: {score3}/10")
@@ -106,8 +104,7 @@ def test_scoring():
         social_engagement=None,
     )
 
-    score4 = scorer.score(trending_product)
-    explanation4 = scorer.explain_score(trending_product)
+    score4, explanation4 = scorer.score_with_explanation(trending_product)
 
     print(f"Product: {trending_product.name}")
     print(f"Score: {score4}/10")
@@ -2,7 +2,7 @@
 """Test Shopify API connection with updated API version."""
 
 import os
-import requests
+import httpx
 
 # Get credentials
 store = os.getenv('SHOPIFY_STORE')
@@ -11,14 +11,20 @@ token = os.getenv('SHOPIFY_API_TOKEN')
 print(f'Store: {store}')
 print(f'Token: {"*" * 20 if token else "NOT SET"}')
 
-# Test connection with NEW API version
-url = f'https://{store}/admin/api/2025-01/shop.json'
-headers = {'X-Shopify-Access-Token': token}
+# Test connection with NEW API version. Skip the auth header when the
+# token is unset — httpx rejects None header values, and the diagnostic
+# output above already reports the missing token.
+client = httpx.Client(
+    base_url=f'https://{store}/admin/api/2025-01',
+    headers={'X-Shopify-Access-Token': token} if token else {},
+    http2=True,
+    timeout=10.0,
+)
 
-print(f'\n🧪 Testing: {url}')
+print(f'\n🧪 Testing: {client.base_url}/shop.json')
 
 try:
-    response = requests.get(url, headers=headers, timeout=10)
+    response = client.get('/shop.json')
     print(f'Status: {response.status_code}')
 
     if response.status_code == 200: